@@ -1,6 +1,19 @@
 """Skyjo strategy optimization toolkit."""
 
-from .ml.evolution import EvolutionConfig, EvolutionOptimizer
-from .simulation.scenarios import GameSituation
+from skyjo_optimizer._lazy import lazy_exports
 
-__all__ = ["EvolutionConfig", "EvolutionOptimizer", "GameSituation"]
+TYPE_CHECKING = False  # avoids importing typing at start-up; type checkers treat it as typing.TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ml.evolution import EvolutionConfig, EvolutionOptimizer
+    from .simulation.scenarios import GameSituation
+
+_EXPORTS: dict[str, str] = {
+    "EvolutionConfig": ".ml.evolution",
+    "EvolutionOptimizer": ".ml.evolution",
+    "GameSituation": ".simulation.scenarios",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
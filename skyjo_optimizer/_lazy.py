@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib import import_module
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Module ``__getattr__``/``__dir__`` (PEP 562) that import each public name on first access.
+
+    ``exports`` maps a name to the relative submodule defining it. Package
+    ``__init__`` files use this so that importing one submodule, e.g. from a
+    CLI subcommand, does not load the rest of the package.
+    """
+
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> object:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,43 @@
+from skyjo_optimizer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .kernels import KERNEL_ROUNDS, measure_kernels
+    from .memory import MEMORY_METRICS, deep_sizeof, measure_memory
+    from .runner import (
+        DEFAULT_REGRESSION_THRESHOLD,
+        TURNS_PER_MINUTE_TARGET,
+        Regression,
+        WorkloadResult,
+        compare_to_baseline,
+        read_report,
+        run_benchmarks,
+        write_report,
+    )
+    from .startup import STARTUP_BUDGET_MS, measure_startup
+    from .workloads import WORKLOADS, Workload
+
+_EXPORTS: dict[str, str] = {
+    "DEFAULT_REGRESSION_THRESHOLD": ".runner",
+    "KERNEL_ROUNDS": ".kernels",
+    "MEMORY_METRICS": ".memory",
+    "Regression": ".runner",
+    "STARTUP_BUDGET_MS": ".startup",
+    "TURNS_PER_MINUTE_TARGET": ".runner",
+    "WORKLOADS": ".workloads",
+    "Workload": ".workloads",
+    "WorkloadResult": ".runner",
+    "compare_to_baseline": ".runner",
+    "deep_sizeof": ".memory",
+    "measure_kernels": ".kernels",
+    "measure_memory": ".memory",
+    "measure_startup": ".startup",
+    "read_report": ".runner",
+    "run_benchmarks": ".runner",
+    "write_report": ".runner",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
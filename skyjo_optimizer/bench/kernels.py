@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from random import Random
+
+from skyjo_optimizer.engine import RulesConfig, apply_action, deal_round, is_round_over, legal_actions
+from skyjo_optimizer.engine import kernels
+from skyjo_optimizer.engine.kernels import ArrayState, kernel_round
+from skyjo_optimizer.engine.state import ACTION_KINDS
+from skyjo_optimizer.simulation.baseline import (
+    KERNEL_POLICIES,
+    RandomAgent,
+    SimpleHeuristicAgent,
+    play_round,
+    score_round,
+)
+
+KERNEL_ROUNDS = 40
+
+# A benchmark side: an untimed ``prepare`` (or ``None``) and a timed run returning units done.
+_Side = tuple[Callable[[], None] | None, Callable[[], int]]
+
+
+def measure_kernels(repeats: int = 5, *, rounds: int = KERNEL_ROUNDS) -> dict[str, object]:
+    """Throughput of each ``engine.kernels`` kernel against the object-engine code it replaces.
+
+    Both sides work through the same recorded rounds (two random and two
+    heuristic seats), so ``speedup`` is kernel over object throughput for
+    identical work. ``backend`` says whether the kernels were compiled. Without
+    Numba they run as plain Python and still beat the object engine for the
+    step, scoring, the heuristic policy and whole rounds. Only the random
+    policy is slower than ``random.choice``.
+    """
+
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+    agents = [RandomAgent("random_a"), SimpleHeuristicAgent("heuristic_a"), RandomAgent("random_b"), SimpleHeuristicAgent("heuristic_b")]
+    policies = [KERNEL_POLICIES[type(agent)] for agent in agents]
+    deals = [deal_round(RulesConfig(), len(agents), seed) for seed in range(rounds)]
+    turns = []
+    moves: list[list[tuple[int, int]]] = []
+    finals = []
+    for seed, state in enumerate(deals):
+        rng = Random(seed)
+        moves.append([])
+        while not is_round_over(state):
+            action = agents[state.active_player].choose_action(state, legal_actions(state), rng)
+            turns.append((state, action))
+            moves[-1].append((ACTION_KINDS.index(action.kind), action.slot_index))
+            state = apply_action(state, action)
+        finals.append(state)
+
+    unpacked: list[ArrayState] = []
+
+    def unpack_deals() -> None:
+        unpacked[:] = [ArrayState(state) for state in deals]
+
+    def object_steps() -> int:
+        for state, action in turns:
+            apply_action(state, action)
+        return len(turns)
+
+    def kernel_steps() -> int:
+        for arrays, round_moves in zip(unpacked, moves):
+            for kind, slot in round_moves:
+                arrays.step(kind, slot)
+        return len(turns)
+
+    final_arrays = [ArrayState(state) for state in finals]
+
+    def object_scores() -> int:
+        for state in finals:
+            score_round(agents, state)
+        return len(finals)
+
+    def kernel_scores() -> int:
+        for arrays in final_arrays:
+            arrays.scores()
+        return len(final_arrays)
+
+    def policy(kind: int) -> tuple[_Side, _Side]:
+        agent = agents[policies.index(kind)]
+        states = [state for state, _ in turns if policies[state.active_player] == kind]
+        state_arrays = [ArrayState(state) for state in states]
+        words = kernels.random_words(Random(0), 8)
+
+        def object_policy() -> int:
+            rng = Random(0)
+            for state in states:
+                agent.choose_action(state, legal_actions(state), rng)
+            return len(states)
+
+        def kernel_policy() -> int:
+            for arrays in state_arrays:
+                if kind == kernels.POLICY_RANDOM:
+                    arrays.header[kernels.CURSOR] = 0
+                    kernels.random_action(arrays.header, arrays.face_up, arrays.face_count, arrays.size, words)
+                else:
+                    kernels.heuristic_action(
+                        arrays.header, arrays.slots, arrays.face_up, arrays.discard, arrays.values, arrays.size
+                    )
+            return len(state_arrays)
+
+        return (None, object_policy), (None, kernel_policy)
+
+    def object_rounds() -> int:
+        for seed, state in enumerate(deals):
+            play_round(agents, state, rng=Random(seed))
+        return len(deals)
+
+    def kernel_rounds() -> int:
+        for seed, state in enumerate(deals):
+            kernel_round(policies, state, rng=Random(seed))
+        return len(deals)
+
+    benchmarks: dict[str, tuple[str, _Side, _Side]] = {
+        "step": ("steps", (None, object_steps), (unpack_deals, kernel_steps)),
+        "score": ("rounds", (None, object_scores), (None, kernel_scores)),
+        "random_policy": ("decisions", *policy(kernels.POLICY_RANDOM)),
+        "heuristic_policy": ("decisions", *policy(kernels.POLICY_HEURISTIC)),
+        "round": ("rounds", (None, object_rounds), (None, kernel_rounds)),
+    }
+    report: dict[str, object] = {}
+    for name, (unit, python_side, kernel_side) in benchmarks.items():
+        python_rate = _median_rate(python_side, repeats)
+        kernel_rate = _median_rate(kernel_side, repeats)
+        report[name] = {
+            "unit": unit,
+            "python_per_second": python_rate,
+            "kernel_per_second": kernel_rate,
+            "speedup": kernel_rate / python_rate,
+        }
+    return {"backend": kernels.KERNEL_BACKEND, "repeats": repeats, "rounds": rounds, "kernels": report}
+
+
+def _median_rate(side: _Side, repeats: int) -> float:
+    prepare, run = side
+    rates = []
+    for attempt in range(repeats + 1):  # the first run warms up; with Numba it also compiles or loads the kernels
+        if prepare is not None:
+            prepare()
+        started = time.perf_counter()
+        units = run()
+        if attempt:
+            rates.append(units / (time.perf_counter() - started))
+    return statistics.median(rates)
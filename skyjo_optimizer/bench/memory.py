@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from random import Random
+from typing import TypeVar
+
+from skyjo_optimizer.engine import RulesConfig, apply_action, initialize_round, is_round_over, legal_actions
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_round, run_tournament
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+T = TypeVar("T")
+
+
+def measure_memory() -> dict[str, object]:
+    """Allocation and retention figures for pinned workloads, in bytes.
+
+    - ``bytes_allocated_per_turn``: growth per turn while every intermediate
+      ``RoundState`` of a round is kept alive, i.e. what one turn allocates.
+    - ``peak_bytes_per_round``: tracemalloc peak above the starting point while
+      one round is dealt and played, i.e. the cost of one concurrent round.
+    - ``retained_bytes_per_*``: memory still held per stored item after a run.
+    - ``object_sizes``: deep ``sys.getsizeof`` estimates; shared objects are counted once.
+    """
+
+    rules = RulesConfig()
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+
+    def play_keeping_states() -> list[object]:
+        state = initialize_round(rules, player_count=3, seed=1)
+        rng = Random(1)
+        states: list[object] = [state]
+        while not is_round_over(state):
+            state = apply_action(state, rng.choice(legal_actions(state)))
+            states.append(state)
+        return states
+
+    states, trajectory_bytes, _ = _traced(play_keeping_states)
+    turns = len(states) - 1
+    _, _, round_peak = _traced(lambda: run_round(agents, seed=2))
+
+    tournament_rounds = 60
+    tournament, tournament_bytes, tournament_peak = _traced(
+        lambda: run_tournament(agents, rounds=tournament_rounds, seed=3)
+    )
+
+    config = EvolutionConfig(population_size=12, generations=3, elite_count=3, rounds_per_eval=40, seed=5)
+
+    def optimize() -> EvolutionOptimizer:
+        optimizer = EvolutionOptimizer(config)
+        optimizer.optimize(DEFAULT_SITUATIONS)
+        return optimizer
+
+    optimizer, optimize_bytes, optimize_peak = _traced(optimize)
+    cache_entries = len(optimizer._fitness_cache)
+
+    deal = initialize_round(rules, player_count=3, seed=4)
+    return {
+        "turns_measured": turns,
+        "bytes_allocated_per_turn": trajectory_bytes / turns,
+        "peak_bytes_per_round": round_peak,
+        "tournament": {
+            "rounds": tournament_rounds,
+            "peak_bytes": tournament_peak,
+            "retained_bytes_per_round_result": tournament_bytes / tournament_rounds,
+        },
+        "optimize": {
+            "fitness_cache_entries": cache_entries,
+            "peak_bytes": optimize_peak,
+            "retained_bytes_per_cache_entry": optimize_bytes / cache_entries,
+        },
+        "object_sizes": {
+            "round_state": deep_sizeof(deal),
+            "round_state_cards": deep_sizeof(deal.cards),
+            "round_result": deep_sizeof(tournament.rounds[0]),
+            "tournament_result": deep_sizeof(tournament),
+        },
+    }
+
+
+# Lower is better for these figures; ``compare_to_baseline`` flags increases.
+MEMORY_METRICS: tuple[str, ...] = (
+    "bytes_allocated_per_turn",
+    "peak_bytes_per_round",
+    "tournament.retained_bytes_per_round_result",
+    "optimize.retained_bytes_per_cache_entry",
+)
+
+
+def memory_metric(report: dict[str, object], name: str) -> float | None:
+    value: object = report
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value)  # type: ignore[arg-type]
+
+
+def deep_sizeof(obj: object) -> int:
+    """Recursive ``sys.getsizeof`` over containers and dataclass fields, counting each object once."""
+
+    seen: set[int] = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif is_dataclass(item) and not isinstance(item, type):
+            stack.extend(getattr(item, field.name) for field in fields(item))
+    return total
+
+
+def _traced(build: Callable[[], T]) -> tuple[T, int, int]:
+    """Run ``build`` under tracemalloc; return its result, bytes it still holds and the peak above the start.
+
+    ``build`` runs once untraced first so lazily filled module caches (legal
+    action tables, column partners, code version) are not charged to it.
+    """
+
+    build()
+    with _tracing():
+        gc.collect()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = build()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    return result, current - start, peak - start
+
+
+@contextmanager
+def _tracing() -> Iterator[None]:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
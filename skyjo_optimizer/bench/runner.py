@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from skyjo_optimizer.bench.memory import MEMORY_METRICS, measure_memory, memory_metric
+from skyjo_optimizer.bench.startup import measure_startup
+from skyjo_optimizer.bench.workloads import WORKLOADS, Workload
+from skyjo_optimizer.ml.artifact_cache import code_version
+
+BENCH_SCHEMA_VERSION = 1
+# Phase 1 goal from docs/technical-approach.md, measured on run_round_heuristic.
+TURNS_PER_MINUTE_TARGET = 100_000
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True)
+class WorkloadResult:
+    """Throughput of one workload over ``repeats`` timed runs, in ``unit`` per second.
+
+    ``spread`` is ``(max - min) / median``; a large spread means a noisy machine
+    and a less trustworthy comparison.
+    """
+
+    name: str
+    unit: str
+    repeats: int
+    units_per_run: int
+    median_per_second: float
+    min_per_second: float
+    max_per_second: float
+    spread: float
+    turns_per_second: float | None
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A throughput drop (``unit="per_second"``) or a memory (``"bytes"``) or startup (``"ms"``) increase."""
+
+    name: str
+    unit: str
+    baseline_value: float
+    current_value: float
+    change: float
+
+
+def run_benchmarks(
+    names: Sequence[str] | None = None,
+    *,
+    repeats: int = 5,
+    warmup: int = 1,
+    memory: bool = True,
+    startup: bool = True,
+    kernels: bool = True,
+) -> dict[str, object]:
+    """Run the selected workloads (all by default) and return a JSON-ready report.
+
+    With ``memory`` the report also carries a ``memory`` section from
+    ``measure_memory``, measured after the timed runs so tracing does not slow them.
+    With ``startup`` it carries CLI start-up times from ``measure_startup``, and
+    with ``kernels`` the per-kernel speedups of ``measure_kernels``.
+    """
+
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+    if warmup < 0:
+        raise ValueError("warmup must be non-negative")
+    selected = select_workloads(names)
+    results = [_measure(workload, repeats=repeats, warmup=warmup) for workload in selected]
+    payload: dict[str, object] = {
+        "schema_version": BENCH_SCHEMA_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "code_version": code_version(),
+        },
+        "repeats": repeats,
+        "warmup": warmup,
+        "workloads": {result.name: asdict(result) for result in results},
+    }
+    heuristic = next((result for result in results if result.name == "run_round_heuristic"), None)
+    if heuristic is not None and heuristic.turns_per_second is not None:
+        turns_per_minute = heuristic.turns_per_second * 60
+        payload["turns_per_minute"] = turns_per_minute
+        payload["turns_per_minute_target"] = TURNS_PER_MINUTE_TARGET
+        payload["meets_turns_target"] = turns_per_minute >= TURNS_PER_MINUTE_TARGET
+    if memory:
+        payload["memory"] = measure_memory()
+    if startup:
+        payload["startup"] = measure_startup(repeats)
+    if kernels:
+        # Imported here so ``bench --help`` does not pay for importing Numba.
+        from skyjo_optimizer.bench.kernels import measure_kernels
+
+        payload["kernels"] = measure_kernels(repeats)
+    return payload
+
+
+def select_workloads(names: Sequence[str] | None) -> list[Workload]:
+    if not names:
+        return list(WORKLOADS)
+    by_name = {workload.name: workload for workload in WORKLOADS}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"unknown workloads: {unknown}; choose from {sorted(by_name)}")
+    return [by_name[name] for name in names]
+
+
+def compare_to_baseline(
+    current: dict[str, object],
+    baseline: dict[str, object],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> list[Regression]:
+    """Workloads whose median throughput fell more than ``threshold`` (a fraction) below the baseline,
+    followed by memory metrics and CLI start-up times that grew more than ``threshold`` above it.
+
+    Workloads and metrics missing from either report are ignored.
+    """
+
+    if not 0 <= threshold < 1:
+        raise ValueError("threshold must be in [0, 1)")
+    current_workloads: dict[str, dict[str, float]] = current["workloads"]  # type: ignore[assignment]
+    baseline_workloads: dict[str, dict[str, float]] = baseline["workloads"]  # type: ignore[assignment]
+    regressions: list[Regression] = []
+    for name in sorted(set(current_workloads) & set(baseline_workloads)):
+        before = baseline_workloads[name]["median_per_second"]
+        after = current_workloads[name]["median_per_second"]
+        if after < before * (1 - threshold):
+            regressions.append(Regression(name, "per_second", before, after, after / before - 1))
+    current_memory: dict[str, object] = current.get("memory") or {}  # type: ignore[assignment]
+    baseline_memory: dict[str, object] = baseline.get("memory") or {}  # type: ignore[assignment]
+    for metric in MEMORY_METRICS:
+        before_bytes = memory_metric(baseline_memory, metric)
+        after_bytes = memory_metric(current_memory, metric)
+        if before_bytes is None or after_bytes is None or before_bytes <= 0:
+            continue
+        if after_bytes > before_bytes * (1 + threshold):
+            regressions.append(Regression(f"memory.{metric}", "bytes", before_bytes, after_bytes, after_bytes / before_bytes - 1))
+    current_startup: dict[str, float] = (current.get("startup") or {}).get("median_ms", {})  # type: ignore[union-attr]
+    baseline_startup: dict[str, float] = (baseline.get("startup") or {}).get("median_ms", {})  # type: ignore[union-attr]
+    for name in sorted(set(current_startup) & set(baseline_startup)):
+        before_ms = baseline_startup[name]
+        after_ms = current_startup[name]
+        if before_ms > 0 and after_ms > before_ms * (1 + threshold):
+            regressions.append(Regression(f"startup.{name}", "ms", before_ms, after_ms, after_ms / before_ms - 1))
+    return regressions
+
+
+def write_report(payload: dict[str, object], path: str | Path) -> Path:
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    return destination
+
+
+def read_report(path: str | Path) -> dict[str, object]:
+    return json.loads(Path(path).read_text())
+
+
+def _measure(workload: Workload, *, repeats: int, warmup: int) -> WorkloadResult:
+    run = workload.setup()
+    for _ in range(warmup):
+        run()
+
+    rates: list[float] = []
+    turn_rates: list[float] = []
+    units = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        units, turns = run()
+        elapsed = time.perf_counter() - started
+        rates.append(units / elapsed)
+        if turns:
+            turn_rates.append(turns / elapsed)
+
+    median = statistics.median(rates)
+    return WorkloadResult(
+        name=workload.name,
+        unit=workload.unit,
+        repeats=repeats,
+        units_per_run=units,
+        median_per_second=median,
+        min_per_second=min(rates),
+        max_per_second=max(rates),
+        spread=(max(rates) - min(rates)) / median,
+        turns_per_second=statistics.median(turn_rates) if turn_rates else None,
+    )
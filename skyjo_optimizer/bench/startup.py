@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Wall-clock budget for a fresh interpreter to parse arguments and print help.
+# Job schedulers start the CLI once per task, so this is paid on every run.
+STARTUP_BUDGET_MS = 150.0
+
+STARTUP_COMMANDS: dict[str, tuple[str, ...]] = {
+    "help": ("--help",),
+    "verify_help": ("verify", "--help"),
+    "optimize_help": ("optimize", "--help"),
+}
+
+
+def measure_startup(repeats: int = 5) -> dict[str, object]:
+    """Median wall time in ms of ``python -m skyjo_optimizer.cli <args>`` per entry of ``STARTUP_COMMANDS``.
+
+    Each run is a new interpreter, so the figure includes imports the command
+    triggers but not Python's own start-up, which is measured separately as
+    ``interpreter_ms`` and subtracted.
+    """
+
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+    interpreter = _median_ms(("-c", "pass"), repeats)
+    median_ms = {
+        name: max(0.0, _median_ms(("-m", "skyjo_optimizer.cli", *arguments), repeats) - interpreter)
+        for name, arguments in STARTUP_COMMANDS.items()
+    }
+    return {
+        "repeats": repeats,
+        "interpreter_ms": interpreter,
+        "median_ms": median_ms,
+        "budget_ms": STARTUP_BUDGET_MS,
+        "within_budget": all(value <= STARTUP_BUDGET_MS for value in median_ms.values()),
+    }
+
+
+def _median_ms(arguments: tuple[str, ...], repeats: int) -> float:
+    root = str(Path(__file__).resolve().parents[2])
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, (root, os.environ.get("PYTHONPATH"))))}
+    samples: list[float] = []
+    for _ in range(repeats + 1):  # the first run warms the OS file cache and bytecode cache
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *arguments], env=env, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples[1:])
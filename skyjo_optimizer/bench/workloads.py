@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import tempfile
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from random import Random
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import DealBank, RulesConfig, apply_action, build_deal_bank, initialize_round, is_round_over, legal_actions
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import BaselineAgent, RandomAgent, SimpleHeuristicAgent, run_round, run_tournament
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+# A workload run returns how many units it processed and how many engine turns that took.
+WorkloadRun = Callable[[], tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A pinned benchmark: ``setup`` builds inputs once and returns the timed callable."""
+
+    name: str
+    unit: str
+    setup: Callable[[], WorkloadRun]
+
+
+def _initialize_round() -> WorkloadRun:
+    rules = RulesConfig()
+
+    def run() -> tuple[int, int]:
+        for seed in range(200):
+            initialize_round(rules, player_count=4, seed=seed)
+        return 200, 0
+
+    return run
+
+
+def _deal_bank() -> WorkloadRun:
+    rules = RulesConfig()
+    # The same 200 deals as ``initialize_round``, read from a memory-mapped bank.
+    directory = tempfile.TemporaryDirectory(prefix="skyjo-bench-", ignore_cleanup_errors=True)
+    bank = DealBank(build_deal_bank(Path(directory.name) / "deals.bin", [(rules, 4, range(200))]))
+
+    def run() -> tuple[int, int]:
+        for seed in range(200):
+            bank.deal(rules, 4, seed)
+        return 200, 0
+
+    # The bank file lives exactly as long as the runner holds on to ``run``.
+    weakref.finalize(run, directory.cleanup)
+    return run
+
+
+def _apply_action() -> WorkloadRun:
+    rules = RulesConfig()
+    deals = [initialize_round(rules, player_count=4, seed=seed) for seed in range(100)]
+
+    def run() -> tuple[int, int]:
+        rng = Random(0)
+        steps = 0
+        for state in deals:
+            while not is_round_over(state):
+                state = apply_action(state, rng.choice(legal_actions(state)))
+                steps += 1
+        return steps, steps
+
+    return run
+
+
+def _apply_action_scaling(players: int, rows: int, columns: int) -> Callable[[], WorkloadRun]:
+    """``apply_action`` on bigger tables and boards; steps/s should stay flat across sizes."""
+
+    def setup() -> WorkloadRun:
+        rules = RulesConfig(board_rows=rows, board_columns=columns)
+        deals = [initialize_round(rules, player_count=players, seed=seed) for seed in range(30)]
+
+        def run() -> tuple[int, int]:
+            rng = Random(0)
+            steps = 0
+            for state in deals:
+                while not is_round_over(state):
+                    state = apply_action(state, rng.choice(legal_actions(state)))
+                    steps += 1
+            return steps, steps
+
+        return run
+
+    return setup
+
+
+def _run_round(agent_type: type[BaselineAgent]) -> Callable[[], WorkloadRun]:
+    def setup() -> WorkloadRun:
+        agents = [agent_type(f"player_{seat}") for seat in range(3)]
+
+        def run() -> tuple[int, int]:
+            turns = sum(run_round(agents, seed=seed).turns for seed in range(40))
+            return 40, turns
+
+        return run
+
+    return setup
+
+
+def _run_tournament(players: int) -> Callable[[], WorkloadRun]:
+    def setup() -> WorkloadRun:
+        agents: list[BaselineAgent] = [SimpleHeuristicAgent("heuristic")]
+        agents += [RandomAgent(f"random_{seat}") for seat in range(players - 1)]
+
+        def run() -> tuple[int, int]:
+            result = run_tournament(agents, rounds=60, seed=7)
+            return 60, sum(round_result.turns for round_result in result.rounds)
+
+        return run
+
+    return setup
+
+
+def _evaluate_strategy(evaluator_name: str, rounds: int) -> Callable[[], WorkloadRun]:
+    def setup() -> WorkloadRun:
+        evaluator = get_evaluator(evaluator_name)
+        strategy = HeuristicStrategy(0.4, 0.6, 0.5, 0.3)
+
+        def run() -> tuple[int, int]:
+            for situation in DEFAULT_SITUATIONS:
+                evaluator.evaluate(strategy, situation, rounds, seed=11)
+            return len(DEFAULT_SITUATIONS), 0
+
+        return run
+
+    return setup
+
+
+def _optimize_generation() -> WorkloadRun:
+    config = EvolutionConfig(population_size=24, generations=1, elite_count=6, rounds_per_eval=120, seed=7)
+
+    def run() -> tuple[int, int]:
+        # A fresh optimizer per run keeps the fitness cache from hiding evaluation cost.
+        optimizer = EvolutionOptimizer(config)
+        optimizer.advance(optimizer.initial_state(), DEFAULT_SITUATIONS, until_generation=1)
+        return 1, 0
+
+    return run
+
+
+WORKLOADS: tuple[Workload, ...] = (
+    Workload("initialize_round", "deals", _initialize_round),
+    Workload("deal_bank", "deals", _deal_bank),
+    Workload("apply_action", "steps", _apply_action),
+    # Player counts and board shapes up to what the default 150-card deck can deal.
+    Workload("apply_action_2p_3x4", "steps", _apply_action_scaling(2, 3, 4)),
+    Workload("apply_action_5p_3x4", "steps", _apply_action_scaling(5, 3, 4)),
+    Workload("apply_action_8p_3x4", "steps", _apply_action_scaling(8, 3, 4)),
+    Workload("apply_action_4p_4x5", "steps", _apply_action_scaling(4, 4, 5)),
+    Workload("apply_action_7p_4x5", "steps", _apply_action_scaling(7, 4, 5)),
+    Workload("run_round_random", "rounds", _run_round(RandomAgent)),
+    Workload("run_round_heuristic", "rounds", _run_round(SimpleHeuristicAgent)),
+    Workload("run_tournament_2p", "rounds", _run_tournament(2)),
+    Workload("run_tournament_3p", "rounds", _run_tournament(3)),
+    Workload("run_tournament_4p", "rounds", _run_tournament(4)),
+    Workload("evaluate_strategy_synthetic", "evaluations", _evaluate_strategy("synthetic", 120)),
+    Workload("evaluate_strategy_engine", "evaluations", _evaluate_strategy("engine", 30)),
+    Workload("optimize_generation", "generations", _optimize_generation),
+)
@@ -2,17 +2,27 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from collections.abc import Callable
 from pathlib import Path
-import tomllib
 
-from skyjo_optimizer.ml import EvolutionConfig, run_experiment
-from skyjo_optimizer.simulation import RandomAgent, SimpleHeuristicAgent, run_regression_checks, run_tournament
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
 
+    from skyjo_optimizer.distributed.coordinator import Coordinator
+    from skyjo_optimizer.engine.deal_bank import DealBank
 
 BASELINE_DEFAULTS: dict[str, object] = {
     "rounds": 24,
     "seed": 7,
     "output": None,
+    "coordinator": None,
+    "local_workers": 0,
+    "deal_bank": None,
+    "table_size": None,
+    "round_cache": None,
+    "bootstrap": None,
 }
 
 OPTIMIZE_DEFAULTS: dict[str, object] = {
@@ -22,32 +32,290 @@ OPTIMIZE_DEFAULTS: dict[str, object] = {
     "rounds_per_eval": 120,
     "seed": 7,
     "output_root": Path("artifacts"),
+    "islands": 1,
+    "migration_interval": 5,
+    "migrant_count": 2,
+    "workers": None,
+    "surrogate_pool_factor": 0,
+    "surrogate_exploration": 1.0,
+    "common_random_numbers": False,
+    "time_budget": None,
+    "max_evaluations": None,
+    "evaluator": "synthetic",
+    "opponent_pool": "heuristic,random",
+    "artifact_cache": None,
+    "store": None,
+    "coordinator": None,
+    "local_workers": 0,
+    "deal_bank": None,
 }
 
+RESOLVED_CONFIG_FILENAME = "resolved_config.json"
 
-def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Skyjo optimizer command line tools")
-    subparsers = parser.add_subparsers(dest="command", required=True)
 
-    baseline = subparsers.add_parser("baseline", help="run baseline tournament")
-    baseline.add_argument("--config", type=Path, default=None)
-    baseline.add_argument("--rounds", type=int, default=None)
-    baseline.add_argument("--seed", type=int, default=None)
-    baseline.add_argument("--output", type=Path, default=None)
-
-    optimize = subparsers.add_parser("optimize", help="run evolutionary optimization experiment")
-    optimize.add_argument("--config", type=Path, default=None)
-    optimize.add_argument("--population-size", type=int, default=None)
-    optimize.add_argument("--generations", type=int, default=None)
-    optimize.add_argument("--elite-count", type=int, default=None)
-    optimize.add_argument("--rounds-per-eval", type=int, default=None)
-    optimize.add_argument("--seed", type=int, default=None)
-    optimize.add_argument("--output-root", type=Path, default=None)
-
-    verify = subparsers.add_parser("verify", help="run deterministic replay and benchmark regression checks")
-    verify.add_argument("--rounds", type=int, default=60)
-    verify.add_argument("--seed", type=int, default=11)
+def _add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--config", type=Path, default=None)
+    parser.add_argument("--rounds", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    _add_work_queue_arguments(parser, "tournament shards")
+    _add_deal_bank_argument(parser)
+    parser.add_argument(
+        "--table-size",
+        type=int,
+        default=None,
+        help="play --rounds per combination of this many agents instead of seating everyone every round",
+    )
+    parser.add_argument(
+        "--round-cache",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="reuse round results stored here and simulate only new seatings",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=None,
+        metavar="REPLICATES",
+        help="bootstrap replicates for the 95%% confidence intervals (default: 1000 with NumPy, 200 without; 0 to skip)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write cProfile stats and hot-path counters (turns/s, time per component) with the results",
+    )
+
+
+def _add_optimize_arguments(parser: argparse.ArgumentParser) -> None:
+    from skyjo_optimizer.simulation.backends import EVALUATOR_NAMES
+
+    parser.add_argument("--config", type=Path, default=None)
+    parser.add_argument("--population-size", type=int, default=None)
+    parser.add_argument("--generations", type=int, default=None)
+    parser.add_argument("--elite-count", type=int, default=None)
+    parser.add_argument("--rounds-per-eval", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output-root", type=Path, default=None)
+    parser.add_argument("--islands", type=int, default=None, help="number of island populations (1 disables island mode)")
+    parser.add_argument("--migration-interval", type=int, default=None)
+    parser.add_argument("--migrant-count", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes for island mode")
+    parser.add_argument(
+        "--surrogate-pool-factor",
+        type=int,
+        default=None,
+        help="draw this many times more mutants and evaluate only the surrogate's top picks",
+    )
+    parser.add_argument("--surrogate-exploration", type=float, default=None)
+    parser.add_argument(
+        "--common-random-numbers",
+        action="store_true",
+        default=None,
+        help="rank candidates by paired differences and report the optimized-vs-benchmark comparison",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="stop evolving in time to finish the final holdout pass within this wall-clock budget",
+    )
+    parser.add_argument("--max-evaluations", type=int, default=None, help="cap on strategy/situation evaluations")
+    parser.add_argument(
+        "--evaluator",
+        choices=EVALUATOR_NAMES,
+        default=None,
+        help="fitness source: synthetic score model or real engine rounds",
+    )
+    parser.add_argument(
+        "--opponent-pool",
+        default=None,
+        help="comma-separated engine opponents, steady to volatile (heuristic, random)",
+    )
+    parser.add_argument(
+        "--artifact-cache",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="reuse benchmark and baseline tournament results stored under DIR",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write cProfile stats and hot-path counters (turns/s, time per component) with the results",
+    )
+    parser.add_argument("--store", type=Path, default=None, metavar="DIR", help="also index the run in this artifact store")
+    _add_work_queue_arguments(parser, "evaluation batches")
+    _add_deal_bank_argument(parser)
+    parser.add_argument(
+        "--resume",
+        type=Path,
+        default=None,
+        metavar="RUN_DIR",
+        help="continue an interrupted run from its checkpoint (other options are taken from the run)",
+    )
+
+
+def _add_sweep_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--spec", type=Path, required=True, help="TOML sweep specification")
+    parser.add_argument("--workers", type=int, default=None, help="override the spec's worker count")
+    parser.add_argument("--output-root", type=Path, default=None, help="defaults to artifacts/sweeps/<spec name>")
+
+
+def _add_league_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--state", type=Path, required=True, help="league file; created if missing")
+    parser.add_argument("--seed", type=int, default=7, help="deal seed of a new league")
+    parser.add_argument("--add-baselines", action="store_true", help="add the heuristic and random baseline agents")
+    parser.add_argument(
+        "--add-report",
+        type=Path,
+        action="append",
+        default=[],
+        metavar="REPORT",
+        help="add the optimized strategy of an optimize run's report.json (repeatable)",
+    )
+    parser.add_argument("--matches", type=int, default=100, help="matches to play this session (two rounds each)")
+    parser.add_argument("--target-sigma", type=float, default=None, help="stop once every rating is this certain")
+    parser.add_argument("--save-every", type=int, default=50, help="matches between state saves")
+
+
+def _add_rule_sweep_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--vary",
+        action="append",
+        default=[],
+        metavar="FIELD=V1,V2",
+        help="RulesConfig field values to sweep (repeatable; default: ender_penalty_mode=strict_lowest_required,off)",
+    )
+    _add_deal_bank_argument(parser)
+
+
+def _add_tail_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("run_dir", type=Path, metavar="RUN_DIR")
+    parser.add_argument("--follow", action="store_true", help="keep printing new generations until the run finishes")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        metavar="SECONDS",
+        help="with --follow, stop once the telemetry has not grown for this long, e.g. after a crash (default: 600)",
+    )
+
+
+def _add_query_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--store", type=Path, required=True)
+    parser.add_argument("--filter", action="append", default=[], metavar="FIELD=VALUE", help="repeatable; all must match")
+    parser.add_argument("--limit", type=int, default=None)
+
+
+def _add_compare_arguments(parser: argparse.ArgumentParser) -> None:
+    from skyjo_optimizer.ml.store import INDEX_FIELDS, METRIC_FIELDS
+
+    parser.add_argument("--store", type=Path, required=True)
+    parser.add_argument("--group-by", choices=INDEX_FIELDS, default="config_hash")
+    parser.add_argument("--metric", choices=METRIC_FIELDS, default="aggregate_fitness")
+    parser.add_argument("--filter", action="append", default=[], metavar="FIELD=VALUE", help="repeatable; all must match")
+
+
+def _add_bench_arguments(parser: argparse.ArgumentParser) -> None:
+    from skyjo_optimizer.bench.runner import DEFAULT_REGRESSION_THRESHOLD
+
+    parser.add_argument("--workload", action="append", default=[], help="repeatable; defaults to every workload")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, default=None, help="fail if throughput regressed against this report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="allowed fractional drop in median throughput, or growth in memory or startup time, before failing (default 0.2)",
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc memory accounting")
+    parser.add_argument("--no-startup", action="store_true", help="skip timing CLI startup in fresh interpreters")
+    parser.add_argument("--no-kernels", action="store_true", help="skip the per-kernel speedup report")
+
+
+def _add_serve_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--socket", type=Path, default=None, metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for evaluation batches")
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=5.0,
+        help="how long to collect concurrent evaluations into one batch",
+    )
+    parser.add_argument("--max-batch-size", type=int, default=64)
+
+
+def _add_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--connect", required=True, metavar="HOST:PORT", help="coordinator address")
+    parser.add_argument("--connect-timeout", type=float, default=30.0, help="seconds to keep retrying the first connection")
+
+
+def _add_work_queue_arguments(parser: argparse.ArgumentParser, work: str) -> None:
+    parser.add_argument(
+        "--coordinator",
+        default=None,
+        metavar="HOST:PORT",
+        help=f"hand {work} to workers that connect here (`worker --connect HOST:PORT`)",
+    )
+    parser.add_argument("--local-workers", type=int, default=None, help=f"start this many localhost workers for {work}")
+
+
+def _add_deal_bank_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--deal-bank",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="read round deals from a file built by `deal-bank`; rounds it lacks are dealt as usual",
+    )
+
 
+def _add_deal_bank_build_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--seed", type=int, default=11, help="tournament seed, as for `baseline`/`verify`")
+    parser.add_argument("--rounds", type=int, default=60, help="tournament rounds")
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 3], help="player counts to deal tournaments for")
+    parser.add_argument(
+        "--holdout-seed",
+        type=int,
+        default=None,
+        help="also bank the engine holdout rounds of an `optimize --seed` run over the default situations",
+    )
+    parser.add_argument("--opponent-pool", default="heuristic,random", help="opponent pool of that optimize run")
+
+
+def _add_verify_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--rounds", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=11)
+    _add_deal_bank_argument(parser)
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="write cProfile stats and hot-path counters (turns/s, time per component) with the results",
+    )
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Parser for every subcommand, with options only for ``command`` (all of them when ``None``).
+
+    Option setup imports constants from the modules a subcommand uses, so leaving
+    the other subcommands bare keeps ``--help`` and each command from loading them.
+    """
+
+    parser = argparse.ArgumentParser(description="Skyjo optimizer command line tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_text, add_arguments, _) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            add_arguments(subparser)
     return parser
 
 
@@ -65,6 +333,8 @@ def _load_config_for_command(path: Path | None, command: str) -> dict[str, objec
     if path is None:
         return {}
 
+    import tomllib
+
     payload = tomllib.loads(path.read_text())
     section = payload.get(command)
     if isinstance(section, dict):
@@ -73,7 +343,7 @@ def _load_config_for_command(path: Path | None, command: str) -> dict[str, objec
 
 
 def _coerce_value(key: str, value: object) -> object:
-    if key in {"output", "output_root"} and value is not None:
+    if key in {"output", "output_root", "artifact_cache", "store", "deal_bank", "round_cache"} and value is not None:
         return Path(value)
     return value
 
@@ -88,71 +358,497 @@ def _serialize_resolved_config(config: dict[str, object]) -> dict[str, object]:
     return serialized
 
 
-def main() -> int:
-    parser = _build_parser()
-    args = parser.parse_args()
+def _parse_filters(parser: argparse.ArgumentParser, items: list[str]) -> dict[str, object]:
+    from skyjo_optimizer.ml.store import INDEX_FIELDS
 
-    if args.command == "baseline":
-        resolved = _resolve_command_config(args, BASELINE_DEFAULTS)
-        rounds = int(resolved["rounds"])
-        seed = int(resolved["seed"])
-        output_path = resolved["output"]
+    filters: dict[str, object] = {}
+    for item in items:
+        name, separator, value = item.partition("=")
+        if not separator or name not in INDEX_FIELDS:
+            parser.error(f"--filter expects FIELD=VALUE with FIELD in {', '.join(INDEX_FIELDS)}")
+        filters[name] = value
+    return filters
 
-        result = run_tournament(
-            [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")],
-            rounds=rounds,
-            seed=seed,
-        )
-        payload = {
-            "rounds": rounds,
-            "seed": seed,
-            "mean_score_by_agent": result.mean_score_by_agent,
-            "median_score_by_agent": result.median_score_by_agent,
-            "tail95_score_by_agent": result.tail95_score_by_agent,
-            "win_rate_by_agent": result.win_rate_by_agent,
-            "win_rate_matrix": result.win_rate_matrix,
-            "resolved_config": _serialize_resolved_config(resolved),
-        }
-        output = json.dumps(payload, indent=2, sort_keys=True)
+
+def _profiling(enabled: bool, destination: Callable[[], Path]) -> AbstractContextManager[object]:
+    """Profile into ``destination()``, which is only called when ``enabled``."""
+
+    if not enabled:
+        from contextlib import nullcontext
+
+        return nullcontext()
+    from skyjo_optimizer.simulation.profiling import profile_session
+
+    path = destination()
+    print(f"profile: {path}", file=sys.stderr)
+    return profile_session(path)
+
+
+def _default_profile_dir() -> Path:
+    from skyjo_optimizer.ml.experiment import new_run_dir
+
+    return new_run_dir(Path("artifacts") / "profiles")
+
+
+def _work_queue(address: object, local_workers: object) -> AbstractContextManager[Coordinator | None]:
+    """Coordinator for ``--coordinator``/``--local-workers``, or ``None`` to run everything in-process."""
+
+    if address is None and not local_workers:
+        from contextlib import nullcontext
+
+        return nullcontext()
+    from skyjo_optimizer.distributed.coordinator import Coordinator, LocalCluster
+
+    host, _, port = str(address or "127.0.0.1:0").rpartition(":")
+    if local_workers:
+        return LocalCluster(int(local_workers), host=host, port=int(port))  # type: ignore[arg-type]
+    coordinator = Coordinator(host, int(port))
+    print(f"coordinator: {coordinator.address}", file=sys.stderr)
+    return coordinator
+
+
+def _open_deal_bank(
+    parser: argparse.ArgumentParser,
+    path: object,
+    coordinator: object = None,
+    local_workers: object = None,
+) -> DealBank | None:
+    if path is None:
+        return None
+    if coordinator is not None or local_workers:
+        parser.error("--deal-bank cannot be combined with --coordinator or --local-workers")
+    from skyjo_optimizer.engine.deal_bank import DealBank
+
+    try:
+        return DealBank(Path(str(path)))
+    except (OSError, ValueError) as error:
+        parser.error(f"--deal-bank: {error}")
+
+
+def _print_csv(rows: list[dict[str, object]], columns: tuple[str, ...]) -> None:
+    print(",".join(columns))
+    for row in rows:
+        print(",".join("" if row[column] is None else str(row[column]) for column in columns))
+
+
+def _run_baseline(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
+    from skyjo_optimizer.simulation.bootstrap import bootstrap_intervals, default_replicates
+
+    resolved = _resolve_command_config(args, BASELINE_DEFAULTS)
+    rounds = int(resolved["rounds"])
+    seed = int(resolved["seed"])
+    if resolved["bootstrap"] is None:
+        resolved["bootstrap"] = default_replicates()
+    replicates = int(resolved["bootstrap"])
+    if replicates < 0 or replicates == 1:
+        parser.error("--bootstrap must be 0 or at least 2")
+    output_path = resolved["output"]
+
+    def profile_dir() -> Path:
         if isinstance(output_path, Path):
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(output + "\n")
+            return output_path.parent / f"{output_path.stem}_profile"
+        return _default_profile_dir()
+
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+    deal_bank = _open_deal_bank(parser, resolved["deal_bank"], resolved["coordinator"], resolved["local_workers"])
+    table_size = None if resolved["table_size"] is None else int(resolved["table_size"])
+    round_cache = resolved["round_cache"]
+    if (table_size is not None or round_cache is not None) and (resolved["coordinator"] or resolved["local_workers"]):
+        parser.error("--table-size and --round-cache cannot be combined with --coordinator or --local-workers")
+    with _profiling(args.profile, profile_dir), _work_queue(resolved["coordinator"], resolved["local_workers"]) as queue:
+        if round_cache is not None:
+            from skyjo_optimizer.ml.round_cache import RoundCache, cached_tournament
+
+            cache = RoundCache(Path(str(round_cache)))
+            result = cached_tournament(
+                agents, rounds=rounds, seed=seed, cache=cache, table_size=table_size, deal_bank=deal_bank
+            )
+            cache.save()
+            print(f"round cache: {cache.hits} reused, {cache.misses} simulated", file=sys.stderr)
+        elif queue is None:
+            result = run_tournament(agents, rounds=rounds, seed=seed, deal_bank=deal_bank, table_size=table_size)
         else:
-            print(output)
-        return 0
+            from skyjo_optimizer.distributed.backend import distributed_tournament
+
+            result = distributed_tournament(queue, agents, rounds=rounds, seed=seed)
+    payload = {
+        "rounds": rounds,
+        "seed": seed,
+        "mean_score_by_agent": result.mean_score_by_agent,
+        "median_score_by_agent": result.median_score_by_agent,
+        "tail95_score_by_agent": result.tail95_score_by_agent,
+        "win_rate_by_agent": result.win_rate_by_agent,
+        "win_rate_matrix": result.win_rate_matrix,
+        "resolved_config": _serialize_resolved_config(resolved),
+    }
+    if replicates:
+        payload["confidence_intervals"] = bootstrap_intervals(result, replicates=replicates, seed=seed).to_dict()
+    output = json.dumps(payload, indent=2, sort_keys=True)
+    if isinstance(output_path, Path):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(output + "\n")
+    else:
+        print(output)
+    return 0
+
 
-    if args.command == "verify":
-        result = run_regression_checks(rounds=args.rounds, seed=args.seed)
-        payload = {
-            "rounds": args.rounds,
-            "seed": args.seed,
-            "deterministic_replay_ok": result.deterministic_replay_ok,
-            "heuristic_beats_random": result.heuristic_beats_random,
-            "heuristic_mean_score": result.heuristic_mean_score,
-            "random_mean_score": result.random_mean_score,
-            "heuristic_win_rate": result.heuristic_win_rate,
-            "random_win_rate": result.random_win_rate,
-        }
+def _run_verify(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.simulation.regression import run_regression_checks
+
+    with _profiling(args.profile, _default_profile_dir):
+        result = run_regression_checks(rounds=args.rounds, seed=args.seed, deal_bank=_open_deal_bank(parser, args.deal_bank))
+    payload = {
+        "rounds": args.rounds,
+        "seed": args.seed,
+        "deterministic_replay_ok": result.deterministic_replay_ok,
+        "heuristic_beats_random": result.heuristic_beats_random,
+        "heuristic_mean_score": result.heuristic_mean_score,
+        "random_mean_score": result.random_mean_score,
+        "heuristic_win_rate": result.heuristic_win_rate,
+        "random_win_rate": result.random_win_rate,
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0 if result.deterministic_replay_ok and result.heuristic_beats_random else 1
+
+
+def _run_bench(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.bench.runner import compare_to_baseline, read_report, run_benchmarks, write_report
+
+    payload = run_benchmarks(
+        args.workload,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        memory=not args.no_memory,
+        startup=not args.no_startup,
+        kernels=not args.no_kernels,
+    )
+    if args.output is not None:
+        write_report(payload, args.output)
+    else:
         print(json.dumps(payload, indent=2, sort_keys=True))
-        return 0 if result.deterministic_replay_ok and result.heuristic_beats_random else 1
+    if args.baseline is None:
+        return 0
+    regressions = compare_to_baseline(payload, read_report(args.baseline), args.threshold)
+    for regression in regressions:
+        suffix = {"per_second": "/s", "bytes": " bytes", "ms": " ms"}[regression.unit]
+        print(
+            f"regression: {regression.name} {regression.current_value:.1f}{suffix} vs "
+            f"{regression.baseline_value:.1f}{suffix} ({regression.change:+.1%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+def _run_serve(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    import asyncio
+
+    from skyjo_optimizer.serve.server import ServeConfig, run_server
+
+    config = ServeConfig(
+        socket_path=args.socket,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        batch_window_ms=args.batch_window_ms,
+        max_batch_size=args.max_batch_size,
+    )
+    stats = asyncio.run(run_server(config, on_ready=lambda address: print(f"listening on {address}", flush=True)))
+    print(json.dumps(stats, indent=2, sort_keys=True))
+    return 0
+
+
+def _run_worker(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.distributed.worker import run_worker
+
+    completed = run_worker(args.connect, connect_timeout=args.connect_timeout)
+    print(f"worker finished after {completed} units", file=sys.stderr)
+    return 0
+
+
+def _run_deal_bank(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.engine import RulesConfig
+    from skyjo_optimizer.engine.deal_bank import DealBank, DealTableSpec, build_deal_bank
+    from skyjo_optimizer.simulation.baseline import tournament_seeds
+
+    rules = RulesConfig()
+    tables: list[DealTableSpec] = [
+        (rules, players, tournament_seeds(range(args.rounds), args.seed)) for players in args.players
+    ]
+    if args.holdout_seed is not None:
+        from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+        from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+        config = EvolutionConfig(seed=args.holdout_seed, evaluator="engine", opponent_pool=args.opponent_pool)
+        tables.extend(EvolutionOptimizer(config).holdout_deal_tables(DEFAULT_SITUATIONS))
+    bank = DealBank(build_deal_bank(args.output, tables))
+    payload = {"path": str(bank.path), "tables": len(bank.tables), "deals": len(bank), "bytes": bank.path.stat().st_size}
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+def _run_league(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+    from skyjo_optimizer.ml.league import League, LeagueEntry, MatchResult
+
+    if args.save_every < 1:
+        parser.error("--save-every must be at least 1")
+    league = League.load(args.state) if args.state.exists() else League(seed=args.seed)
+    if args.add_baselines:
+        for kind in ("heuristic", "random"):
+            if kind not in league.entries:
+                league.add(LeagueEntry(kind, kind))
+    for report_path in args.add_report:
+        strategy = json.loads(report_path.read_text())["optimized"]["strategy"]
+        name = report_path.parent.name
+        if name not in league.entries:
+            league.add(LeagueEntry(name, "strategy", HeuristicStrategy(**strategy)))
+
+    def checkpoint(match: MatchResult) -> None:
+        if (match.match_index + 1) % args.save_every == 0:
+            league.save(args.state)
+
+    try:
+        league.run(args.matches, target_sigma=args.target_sigma, on_match=checkpoint)
+    except ValueError as error:
+        parser.error(str(error))
+    league.save(args.state)
+    print(f"matches: {league.matches_played} rounds: {league.rounds_played}", file=sys.stderr)
+    _print_csv(league.leaderboard(), ("rank", "name", "kind", "conservative", "mu", "sigma", "matches"))
+    return 0
 
-    if args.command == "optimize":
+
+def _run_rule_sweep(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.engine import RulesConfig
+    from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent
+    from skyjo_optimizer.simulation.rule_sweep import RULE_SWEEP_COLUMNS, rule_variants, run_rule_sweep
+
+    grid: dict[str, list[object]] = {}
+    for item in args.vary or ["ender_penalty_mode=strict_lowest_required,off"]:
+        name, separator, values = item.partition("=")
+        default = getattr(RulesConfig(), name, None)
+        if not separator or not isinstance(default, (int, str)):
+            parser.error("--vary expects FIELD=V1,V2 with FIELD an int or string RulesConfig field")
+        try:
+            grid[name] = [type(default)(value) for value in values.split(",")]
+        except ValueError:
+            parser.error(f"--vary {name} expects {type(default).__name__} values")
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+    try:
+        result = run_rule_sweep(
+            agents,
+            rule_variants(RulesConfig(), grid),
+            rounds=args.rounds,
+            seed=args.seed,
+            deal_bank=_open_deal_bank(parser, args.deal_bank),
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"simulated {result.simulated_variants} of {len(result.variants)} variants", file=sys.stderr)
+    _print_csv(result.rows(), RULE_SWEEP_COLUMNS)
+    return 0
+
+
+def _run_tail(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.ml.telemetry import TELEMETRY_FILENAME, format_event, tail_events
+
+    config_path = args.run_dir / RESOLVED_CONFIG_FILENAME
+    if config_path.is_file() and int(json.loads(config_path.read_text()).get("islands") or 1) > 1:
+        print(f"{args.run_dir} is an island run; island runs do not emit telemetry", file=sys.stderr)
+        return 0
+    events = tail_events(
+        args.run_dir / TELEMETRY_FILENAME,
+        follow=args.follow,
+        idle_seconds=args.idle_timeout,
+        finished=lambda: (args.run_dir / "report.json").exists(),
+    )
+    for event in events:
+        print(format_event(event), flush=True)
+    return 0
+
+
+def _run_query(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.ml.store import INDEX_FIELDS, METRIC_FIELDS, ArtifactStore
+
+    rows = ArtifactStore(args.store).query(_parse_filters(parser, args.filter), limit=args.limit)
+    _print_csv(rows, INDEX_FIELDS + METRIC_FIELDS)
+    return 0
+
+
+def _run_compare(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.ml.store import ArtifactStore
+
+    rows = ArtifactStore(args.store).compare(args.group_by, args.metric, _parse_filters(parser, args.filter))
+    _print_csv(rows, (args.group_by, "runs", "mean", "min", "max"))
+    return 0
+
+
+def _run_sweep(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.ml.sweep import SweepSpec, run_sweep
+
+    spec = SweepSpec.from_toml(args.spec)
+    output_root = args.output_root or Path("artifacts") / "sweeps" / args.spec.stem
+    outcome = run_sweep(spec, output_root, workers=args.workers)
+    print(outcome.results_path)
+    return 0
+
+
+def _run_optimize(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from skyjo_optimizer.ml.artifact_cache import ArtifactCache
+    from skyjo_optimizer.ml.checkpoint import CHECKPOINT_FILENAME
+    from skyjo_optimizer.ml.evolution import EvolutionConfig
+    from skyjo_optimizer.ml.experiment import benchmark_round_scores, new_run_dir, run_experiment
+    from skyjo_optimizer.ml.islands import IslandConfig
+    from skyjo_optimizer.ml.store import ArtifactStore
+    from skyjo_optimizer.ml.telemetry import TELEMETRY_FILENAME, JsonlTelemetrySink
+    from skyjo_optimizer.simulation.backends import get_evaluator
+    from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+    if args.resume is not None:
+        run_dir = args.resume
+        if (args.islands or 1) > 1:
+            parser.error("--resume cannot be combined with --islands; island runs are not checkpointed")
+        if not (run_dir / RESOLVED_CONFIG_FILENAME).is_file():
+            parser.error(f"{run_dir} has no checkpoint to resume")
+        stored = json.loads((run_dir / RESOLVED_CONFIG_FILENAME).read_text())
+        resolved = {key: _coerce_value(key, stored.get(key, default)) for key, default in OPTIMIZE_DEFAULTS.items()}
+        if int(resolved["islands"]) > 1:
+            parser.error(f"{run_dir} is an island run; island runs are not checkpointed and cannot be resumed")
+        if not (run_dir / CHECKPOINT_FILENAME).is_file():
+            parser.error(f"{run_dir} has no checkpoint to resume")
+    else:
         resolved = _resolve_command_config(args, OPTIMIZE_DEFAULTS)
-        config = EvolutionConfig(
-            population_size=int(resolved["population_size"]),
-            generations=int(resolved["generations"]),
-            elite_count=int(resolved["elite_count"]),
-            rounds_per_eval=int(resolved["rounds_per_eval"]),
-            seed=int(resolved["seed"]),
+
+    config = EvolutionConfig(
+        population_size=int(resolved["population_size"]),
+        generations=int(resolved["generations"]),
+        elite_count=int(resolved["elite_count"]),
+        rounds_per_eval=int(resolved["rounds_per_eval"]),
+        seed=int(resolved["seed"]),
+        surrogate_pool_factor=int(resolved["surrogate_pool_factor"]),
+        surrogate_exploration=float(resolved["surrogate_exploration"]),
+        common_random_numbers=bool(resolved["common_random_numbers"]),
+        time_budget_seconds=None if resolved["time_budget"] is None else float(resolved["time_budget"]),
+        max_evaluations=None if resolved["max_evaluations"] is None else int(resolved["max_evaluations"]),
+        evaluator=str(resolved["evaluator"]),
+        opponent_pool=str(resolved["opponent_pool"]),
+    )
+    island_count = int(resolved["islands"])
+    islands = None
+    if island_count > 1:
+        workers = resolved["workers"]
+        islands = IslandConfig(
+            island_count=island_count,
+            migration_interval=int(resolved["migration_interval"]),
+            migrant_count=int(resolved["migrant_count"]),
+            workers=None if workers is None else int(workers),
         )
-        report = run_experiment(config=config, resolved_config=_serialize_resolved_config(resolved))
+    try:
+        get_evaluator(config.evaluator, config.opponent_pool)
+        if islands is not None:
+            islands.validate(config)
+    except ValueError as error:
+        parser.error(str(error))
+    if islands is not None and (resolved["coordinator"] is not None or resolved["local_workers"]):
+        parser.error("--islands cannot be combined with --coordinator or --local-workers")
+    artifact_cache = resolved["artifact_cache"]
+    deal_bank = _open_deal_bank(parser, resolved["deal_bank"], resolved["coordinator"], resolved["local_workers"])
+    if deal_bank is not None and (config.evaluator != "engine" or islands is not None):
+        parser.error("--deal-bank needs --evaluator engine and cannot be combined with --islands")
+    # Only a run that passed validation gets a directory under the output root.
+    if args.resume is None:
         output_root = resolved["output_root"]
-        path = report.write_artifacts(output_root if isinstance(output_root, Path) else Path("artifacts"))
-        print(path)
-        return 0
+        run_dir = new_run_dir(output_root if isinstance(output_root, Path) else Path("artifacts"))
+        run_dir.mkdir(parents=True, exist_ok=True)
+        (run_dir / RESOLVED_CONFIG_FILENAME).write_text(
+            json.dumps(_serialize_resolved_config(resolved), indent=2, sort_keys=True) + "\n"
+        )
+    with (
+        _profiling(args.profile, lambda: run_dir / "profile"),
+        _work_queue(resolved["coordinator"], resolved["local_workers"]) as queue,
+    ):
+        evaluator = None if deal_bank is None else get_evaluator(config.evaluator, config.opponent_pool, deal_bank)
+        if queue is not None:
+            from skyjo_optimizer.distributed.backend import DistributedEvaluator
+
+            configured = get_evaluator(config.evaluator, config.opponent_pool)
+            evaluator = DistributedEvaluator(configured.name, configured.opponent_pool, coordinator=queue)
+        report = run_experiment(
+            config=config,
+            resolved_config=_serialize_resolved_config(resolved),
+            checkpoint_path=None if islands is not None else run_dir / CHECKPOINT_FILENAME,
+            resume=args.resume is not None,
+            islands=islands,
+            artifact_cache=None if artifact_cache is None else ArtifactCache(artifact_cache),
+            # A profiled run keeps the tournament in-process so that it shows up in the profile.
+            concurrent_tournament=not args.profile,
+            observers=[JsonlTelemetrySink(run_dir / TELEMETRY_FILENAME)],
+            evaluator=evaluator,
+        )
+    path = report.write_artifacts(run_dir=run_dir)
+    if resolved["store"] is not None:
+        ArtifactStore(resolved["store"]).add_run(
+            run_dir.name,
+            report,
+            round_scores=benchmark_round_scores(report, DEFAULT_SITUATIONS),
+        )
+    print(path)
+    return 0
+
+
+COMMANDS: dict[
+    str,
+    tuple[str, Callable[[argparse.ArgumentParser], None], Callable[[argparse.Namespace, argparse.ArgumentParser], int]],
+] = {
+    "baseline": ("run baseline tournament", _add_baseline_arguments, _run_baseline),
+    "optimize": ("run evolutionary optimization experiment", _add_optimize_arguments, _run_optimize),
+    "sweep": (
+        "run a grid or random hyperparameter sweep over EvolutionConfig",
+        _add_sweep_arguments,
+        _run_sweep,
+    ),
+    "league": (
+        "rate baselines and evolved strategies with scheduled head-to-head matches",
+        _add_league_arguments,
+        _run_league,
+    ),
+    "rule-sweep": (
+        "compare RulesConfig variants on shared deals, rescoring rounds where only scoring differs",
+        _add_rule_sweep_arguments,
+        _run_rule_sweep,
+    ),
+    "tail": ("print an optimize run's per-generation telemetry", _add_tail_arguments, _run_tail),
+    "query": ("list indexed runs from an artifact store as CSV", _add_query_arguments, _run_query),
+    "compare": (
+        "aggregate a run metric per group across an artifact store",
+        _add_compare_arguments,
+        _run_compare,
+    ),
+    "bench": (
+        "run pinned throughput benchmarks and check them against a baseline",
+        _add_bench_arguments,
+        _run_bench,
+    ),
+    "serve": (
+        "answer evaluation, tournament and regression requests over a local socket",
+        _add_serve_arguments,
+        _run_serve,
+    ),
+    "deal-bank": (
+        "precompute round deals into a memory-mapped file for --deal-bank",
+        _add_deal_bank_build_arguments,
+        _run_deal_bank,
+    ),
+    "worker": ("run tournament shards and evaluation batches for a coordinator", _add_worker_arguments, _run_worker),
+    "verify": ("run deterministic replay and benchmark regression checks", _add_verify_arguments, _run_verify),
+}
+
 
-    parser.error(f"unknown command: {args.command}")
-    return 2
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = _build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
+    return COMMANDS[args.command][2](args, parser)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,23 @@
+from skyjo_optimizer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .backend import DistributedEvaluator, distributed_tournament
+    from .coordinator import Coordinator, LocalCluster, WorkUnitError
+    from .units import run_unit
+    from .worker import run_worker
+
+_EXPORTS: dict[str, str] = {
+    "Coordinator": ".coordinator",
+    "DistributedEvaluator": ".backend",
+    "LocalCluster": ".coordinator",
+    "WorkUnitError": ".coordinator",
+    "distributed_tournament": ".backend",
+    "run_unit": ".units",
+    "run_worker": ".worker",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
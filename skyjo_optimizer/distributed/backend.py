@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.distributed.coordinator import Coordinator
+from skyjo_optimizer.distributed.units import (
+    SCORE_BATCH,
+    TOURNAMENT_SHARD,
+    round_results_from_shard,
+    score_batch_payload,
+    tournament_shard_payload,
+)
+from skyjo_optimizer.engine import RulesConfig
+from skyjo_optimizer.simulation.backends import EvaluatorBackend
+from skyjo_optimizer.simulation.baseline import BaselineAgent, TournamentResult, summarize_tournament
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+
+@dataclass(frozen=True)
+class DistributedEvaluator(EvaluatorBackend):
+    """``EvaluatorBackend`` that splits each batch across a coordinator's workers.
+
+    A strategy's scores do not depend on the rest of its batch, so chunked
+    results equal local ones and ``key`` is unchanged: fitness caches and
+    checkpoints are interchangeable with local runs.
+    """
+
+    # Required; the default only exists because the inherited fields have defaults.
+    coordinator: Coordinator = field(default=None, compare=False)  # type: ignore[assignment]
+    chunk_size: int | None = None
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        if self.coordinator is None:
+            raise ValueError("a coordinator is required")
+        if self.chunk_size is not None and self.chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+    def score_batch(
+        self,
+        strategies: list[HeuristicStrategy],
+        situation: GameSituation,
+        rounds: int,
+        seed: int,
+    ) -> list[list[float]]:
+        size = self.chunk_size or -(-len(strategies) // max(1, self.coordinator.worker_count))
+        chunks = [strategies[start : start + size] for start in range(0, len(strategies), size)]
+        results = self.coordinator.run(
+            [
+                (SCORE_BATCH, score_batch_payload(self.name, self.opponent_pool, chunk, situation, rounds, seed))
+                for chunk in chunks
+            ]
+        )
+        return [row for chunk_rows in results for row in chunk_rows]  # type: ignore[attr-defined]
+
+
+def distributed_tournament(
+    coordinator: Coordinator,
+    agents: list[BaselineAgent],
+    *,
+    rounds: int,
+    seed: int,
+    rules: RulesConfig | None = None,
+    shard_rounds: int | None = None,
+) -> TournamentResult:
+    """``run_tournament`` with its rounds played in shards on the coordinator's workers; same result."""
+
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+    size = shard_rounds or -(-rounds // max(1, 4 * coordinator.worker_count))
+    shards = [range(start, min(start + size, rounds)) for start in range(0, rounds, size)]
+    results = coordinator.run(
+        [(TOURNAMENT_SHARD, tournament_shard_payload(agents, shard, seed=seed, rules=rules)) for shard in shards]
+    )
+    round_results = [
+        result for rows in results for result in round_results_from_shard(agents, rows)  # type: ignore[arg-type]
+    ]
+    return summarize_tournament(agents, round_results)
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import socketserver
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from skyjo_optimizer.serve.protocol import JSON_FORMAT, ProtocolError, decode_message, encode_message
+
+
+class WorkUnitError(RuntimeError):
+    """A work unit failed on a worker, or ran out of attempts."""
+
+
+@dataclass
+class _Unit:
+    unit_id: int
+    kind: str
+    payload: dict[str, object]
+    future: Future[object] = field(default_factory=Future)
+    attempts: int = 0
+
+
+class Coordinator:
+    """Hands work units to TCP workers and collects their results.
+
+    Workers (``run_worker``) connect, say hello and then receive one unit at a
+    time. A unit whose worker disconnects or does not answer within
+    ``lease_seconds`` goes back to the front of the queue, up to
+    ``max_attempts`` tries in total. ``run`` returns results in submission
+    order, so assembled results never depend on which worker finished first.
+    It fails with ``WorkUnitError`` once no worker has been connected for
+    ``worker_timeout`` seconds, rather than waiting forever.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        lease_seconds: float = 600.0,
+        max_attempts: int = 3,
+        worker_timeout: float = 300.0,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        if worker_timeout <= 0:
+            raise ValueError("worker_timeout must be positive")
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_timeout = worker_timeout
+        self.counts = {"submitted": 0, "completed": 0, "failed": 0, "retries": 0}
+        self._queue: deque[_Unit] = deque()
+        self._condition = threading.Condition()
+        self._ids = itertools.count()
+        self._workers: set[str] = set()
+        # When the last worker left (or the coordinator started); ``None`` while any is connected.
+        self._workerless_since: float | None = time.monotonic()
+        self._closed = False
+
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                coordinator._serve_worker(self)
+
+        self._server = _WorkerServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="coordinator", daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def worker_count(self) -> int:
+        with self._condition:
+            return len(self._workers)
+
+    def wait_for_workers(self, count: int, timeout: float = 30.0) -> None:
+        with self._condition:
+            if not self._condition.wait_for(lambda: len(self._workers) >= count, timeout):
+                raise TimeoutError(f"only {len(self._workers)} of {count} workers connected within {timeout}s")
+
+    def submit(self, kind: str, payload: dict[str, object]) -> Future[object]:
+        unit = _Unit(next(self._ids), kind, payload)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("coordinator is closed")
+            self._queue.append(unit)
+            self.counts["submitted"] += 1
+            self._condition.notify()
+        return unit.future
+
+    def run(self, units: Sequence[tuple[str, dict[str, object]]]) -> list[object]:
+        """Submit every ``(kind, payload)`` and return their results in the same order."""
+
+        futures = [self.submit(kind, payload) for kind, payload in units]
+        results = []
+        for future in futures:
+            while True:
+                try:
+                    results.append(future.result(timeout=min(1.0, self.worker_timeout)))
+                    break
+                except TimeoutError:
+                    self._check_liveness(futures)
+        return results
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            abandoned = list(self._queue)
+            self._queue.clear()
+            self._condition.notify_all()
+        for unit in abandoned:
+            unit.future.set_exception(RuntimeError("coordinator closed before the unit ran"))
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> Coordinator:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _check_liveness(self, futures: Sequence[Future[object]]) -> None:
+        """Fail the queued units of ``futures`` once no worker has been connected for ``worker_timeout``."""
+
+        with self._condition:
+            since = self._workerless_since
+            if since is None or time.monotonic() - since < self.worker_timeout:
+                return
+            waiting = set(futures)
+            abandoned = [unit for unit in self._queue if unit.future in waiting]
+            for unit in abandoned:
+                self._queue.remove(unit)
+            self.counts["failed"] += len(abandoned)
+        for unit in abandoned:
+            unit.future.set_exception(WorkUnitError(f"unit {unit.unit_id} ({unit.kind}) was never picked up"))
+        raise WorkUnitError(f"no worker connected for {self.worker_timeout}s; {len(abandoned)} units abandoned")
+
+    def _serve_worker(self, handler: socketserver.StreamRequestHandler) -> None:
+        try:
+            hello = _receive(handler.rfile)
+        except (OSError, ProtocolError):
+            return
+        name = f"{hello.get('worker')}@{handler.client_address[0]}:{handler.client_address[1]}"
+        handler.connection.settimeout(self.lease_seconds)
+        with self._condition:
+            self._workers.add(name)
+            self._workerless_since = None
+            self._condition.notify_all()
+        try:
+            while (unit := self._next_unit()) is not None:
+                try:
+                    _send(handler.wfile, {"op": "unit", "unit_id": unit.unit_id, "kind": unit.kind, "payload": unit.payload})
+                    reply = _receive(handler.rfile)
+                    if reply.get("unit_id") != unit.unit_id:
+                        raise ProtocolError(f"reply for unit {reply.get('unit_id')!r}, expected {unit.unit_id}")
+                except (OSError, ProtocolError):
+                    self._retry(unit)
+                    return
+                self._finish(unit, reply)
+            _send(handler.wfile, {"op": "stop"})
+        except OSError:
+            pass
+        finally:
+            with self._condition:
+                self._workers.discard(name)
+                if not self._workers:
+                    self._workerless_since = time.monotonic()
+
+    def _next_unit(self) -> _Unit | None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._queue or self._closed)
+            if self._closed:
+                return None
+            unit = self._queue.popleft()
+            unit.attempts += 1
+            return unit
+
+    def _retry(self, unit: _Unit) -> None:
+        with self._condition:
+            if unit.attempts < self.max_attempts and not self._closed:
+                self.counts["retries"] += 1
+                self._queue.appendleft(unit)
+                self._condition.notify()
+                return
+            self.counts["failed"] += 1
+        unit.future.set_exception(WorkUnitError(f"unit {unit.unit_id} ({unit.kind}) lost after {unit.attempts} attempts"))
+
+    def _finish(self, unit: _Unit, reply: dict[str, object]) -> None:
+        with self._condition:
+            self.counts["completed" if "error" not in reply else "failed"] += 1
+        if "error" in reply:
+            unit.future.set_exception(WorkUnitError(f"unit {unit.unit_id} ({unit.kind}) failed: {reply['error']}"))
+        else:
+            unit.future.set_result(reply.get("result"))
+
+
+class LocalCluster:
+    """A ``Coordinator`` with ``workers`` worker processes on localhost.
+
+    Used by tests and ``--local-workers``; results are the same as with remote
+    workers or none at all.
+    """
+
+    def __init__(self, workers: int, **coordinator_options: object) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        self.workers = workers
+        self.coordinator_options = coordinator_options
+        self._processes: list[multiprocessing.Process] = []
+        self._coordinator: Coordinator | None = None
+
+    def __enter__(self) -> Coordinator:
+        from skyjo_optimizer.distributed.worker import run_worker
+
+        self._coordinator = Coordinator(**self.coordinator_options)  # type: ignore[arg-type]
+        self._processes = [
+            multiprocessing.Process(target=run_worker, args=(self._coordinator.address,), daemon=True)
+            for _ in range(self.workers)
+        ]
+        for process in self._processes:
+            process.start()
+        self._coordinator.wait_for_workers(self.workers)
+        return self._coordinator
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._coordinator is not None:
+            self._coordinator.close()
+        deadline = time.monotonic() + 10
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+
+
+class _WorkerServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def _send(stream: BinaryIO, message: dict[str, object]) -> None:
+    stream.write(encode_message(message, JSON_FORMAT))
+    stream.flush()
+
+
+def _receive(stream: BinaryIO) -> dict[str, object]:
+    line = stream.readline()
+    if not line:
+        raise ProtocolError("connection closed")
+    return decode_message(line, JSON_FORMAT)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import RulesConfig
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import BaselineAgent, RoundResult, tournament_rounds
+from skyjo_optimizer.simulation.engine_evaluator import OPPONENT_FACTORIES
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+# Work units travel as JSON: a ``kind`` naming a handler below and a payload of
+# plain values. Handlers are pure, so a unit can be retried on any worker.
+TOURNAMENT_SHARD = "tournament_shard"
+SCORE_BATCH = "score_batch"
+
+
+def run_unit(kind: str, payload: dict[str, object]) -> object:
+    handler = _HANDLERS.get(kind)
+    if handler is None:
+        raise ValueError(f"unknown work unit kind: {kind!r}")
+    return handler(payload)
+
+
+def tournament_shard_payload(
+    agents: list[BaselineAgent],
+    round_indices: range,
+    *,
+    seed: int,
+    rules: RulesConfig | None,
+) -> dict[str, object]:
+    kinds = {factory: kind for kind, factory in OPPONENT_FACTORIES.items()}
+    unsupported = [agent.name for agent in agents if type(agent) not in kinds]
+    if unsupported:
+        raise ValueError(f"only {sorted(OPPONENT_FACTORIES)} agents can be distributed, not {unsupported}")
+    return {
+        "agents": [[kinds[type(agent)], agent.name] for agent in agents],
+        "start": round_indices.start,
+        "stop": round_indices.stop,
+        "seed": seed,
+        "rules": None if rules is None else rules.to_dict(),
+    }
+
+
+def round_results_from_shard(agents: list[BaselineAgent], rows: list[list[object]]) -> list[RoundResult]:
+    """Rebuild ``RoundResult``s from a shard's compact ``[scores in agent order, winner indices, turns]`` rows."""
+
+    names = [agent.name for agent in agents]
+    return [
+        RoundResult(
+            scores_by_agent=dict(zip(names, scores)),  # type: ignore[call-overload]
+            winner_names=tuple(names[index] for index in winners),  # type: ignore[union-attr]
+            turns=int(turns),  # type: ignore[call-overload]
+        )
+        for scores, winners, turns in rows
+    ]
+
+
+def score_batch_payload(
+    evaluator_name: str,
+    opponent_pool: tuple[str, ...],
+    strategies: list[HeuristicStrategy],
+    situation: GameSituation,
+    rounds: int,
+    seed: int,
+) -> dict[str, object]:
+    return {
+        "evaluator": evaluator_name,
+        "opponent_pool": list(opponent_pool),
+        "strategies": [asdict(strategy) for strategy in strategies],
+        "situation": asdict(situation),
+        "rounds": rounds,
+        "seed": seed,
+    }
+
+
+def _tournament_shard(payload: dict[str, object]) -> list[list[object]]:
+    agents = [OPPONENT_FACTORIES[kind](name) for kind, name in payload["agents"]]  # type: ignore[union-attr]
+    names = [agent.name for agent in agents]
+    rules = None if payload["rules"] is None else RulesConfig.from_dict(payload["rules"])  # type: ignore[arg-type]
+    results = tournament_rounds(
+        agents,
+        range(int(payload["start"]), int(payload["stop"])),  # type: ignore[call-overload]
+        seed=int(payload["seed"]),  # type: ignore[call-overload]
+        rules=rules,
+    )
+    return [
+        [
+            [result.scores_by_agent[name] for name in names],
+            [names.index(name) for name in result.winner_names],
+            result.turns,
+        ]
+        for result in results
+    ]
+
+
+def _score_batch(payload: dict[str, object]) -> list[list[float]]:
+    evaluator = get_evaluator(str(payload["evaluator"]), tuple(payload["opponent_pool"]))  # type: ignore[arg-type]
+    strategies = [HeuristicStrategy(**fields) for fields in payload["strategies"]]  # type: ignore[union-attr]
+    situation = GameSituation(**payload["situation"])  # type: ignore[arg-type]
+    return evaluator.score_batch(strategies, situation, int(payload["rounds"]), int(payload["seed"]))  # type: ignore[call-overload]
+
+
+_HANDLERS: dict[str, Callable[[dict[str, object]], object]] = {
+    TOURNAMENT_SHARD: _tournament_shard,
+    SCORE_BATCH: _score_batch,
+}
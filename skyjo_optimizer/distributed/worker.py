@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import socket
+import time
+
+from skyjo_optimizer.distributed.units import run_unit
+from skyjo_optimizer.serve.protocol import JSON_FORMAT, decode_message, encode_message
+
+
+def run_worker(address: str, *, connect_timeout: float = 30.0) -> int:
+    """Run work units from the coordinator at ``host:port`` until it says stop; return how many ran.
+
+    Connection attempts are retried for ``connect_timeout`` seconds so workers
+    may start before the coordinator. A unit that raises is reported back as an
+    error rather than ending the worker.
+    """
+
+    host, _, port = address.rpartition(":")
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = socket.create_connection((host, int(port)))
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.1)
+
+    completed = 0
+    with connection, connection.makefile("rb") as reader, connection.makefile("wb") as writer:
+        writer.write(encode_message({"op": "hello", "worker": f"{socket.gethostname()}:{os.getpid()}"}, JSON_FORMAT))
+        writer.flush()
+        while line := reader.readline():
+            message = decode_message(line, JSON_FORMAT)
+            if message.get("op") != "unit":
+                break
+            reply: dict[str, object] = {"unit_id": message["unit_id"]}
+            try:
+                reply["result"] = run_unit(str(message["kind"]), message["payload"])  # type: ignore[arg-type]
+            except Exception as error:  # reported to the coordinator, which fails that unit
+                reply["error"] = f"{type(error).__name__}: {error}"
+            writer.write(encode_message(reply, JSON_FORMAT))
+            writer.flush()
+            completed += 1
+    return completed
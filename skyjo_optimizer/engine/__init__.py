@@ -1,22 +1,34 @@
+from skyjo_optimizer.engine.board import BoardGeometry, board_geometry
+from skyjo_optimizer.engine.codec import SharedStateBatch, StateCodec
 from skyjo_optimizer.engine.config import DEFAULT_DECK_COMPOSITION, RulesConfig
+from skyjo_optimizer.engine.deal_bank import DealBank, build_deal_bank, deal_round
 from skyjo_optimizer.engine.state import (
     Action,
     RoundState,
     apply_action,
     card_location_counts,
     initialize_round,
+    is_legal_action,
     is_round_over,
     legal_actions,
 )
 
 __all__ = [
     "Action",
+    "BoardGeometry",
     "DEFAULT_DECK_COMPOSITION",
+    "DealBank",
     "RoundState",
     "RulesConfig",
+    "SharedStateBatch",
+    "StateCodec",
     "apply_action",
+    "board_geometry",
+    "build_deal_bank",
     "card_location_counts",
+    "deal_round",
     "initialize_round",
+    "is_legal_action",
     "is_round_over",
     "legal_actions",
 ]
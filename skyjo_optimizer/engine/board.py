@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from skyjo_optimizer.engine.config import RulesConfig
+from skyjo_optimizer.engine.state import Card
+
+
+@dataclass(frozen=True)
+class BoardGeometry:
+    """Column index tables for a ``rows`` x ``columns`` board, built once per shape.
+
+    An action changes one slot, so whether it clears (or breaks) a column is a
+    lookup of ``column_of[slot]`` plus ``rows`` card comparisons, whatever the
+    board size. Boards with a single row have no clearable columns.
+    """
+
+    rows: int
+    columns: int
+    # Slots of each column, top to bottom.
+    column_slots: tuple[tuple[int, ...], ...]
+    # Column of each slot.
+    column_of: tuple[int, ...]
+    # The other slots of each slot's column.
+    column_partners: tuple[tuple[int, ...], ...]
+
+    @property
+    def clears_columns(self) -> bool:
+        return self.rows > 1
+
+
+def board_geometry(rules: RulesConfig) -> BoardGeometry:
+    return _board_geometry(rules.board_rows, rules.board_columns)
+
+
+@lru_cache(maxsize=64)
+def _board_geometry(rows: int, columns: int) -> BoardGeometry:
+    column_slots = tuple(tuple(range(column, rows * columns, columns)) for column in range(columns))
+    column_of = tuple(slot % columns for slot in range(rows * columns))
+    return BoardGeometry(
+        rows=rows,
+        columns=columns,
+        column_slots=column_slots,
+        column_of=column_of,
+        column_partners=tuple(
+            tuple(other for other in column_slots[column_of[slot]] if other != slot) for slot in range(rows * columns)
+        ),
+    )
+
+
+def column_cleared(
+    geometry: BoardGeometry,
+    column: int,
+    slots: Sequence[int],
+    face_up: Collection[int],
+    cards: Mapping[int, Card],
+) -> bool:
+    """Whether every card of ``column`` is face up and shows the same value."""
+
+    if not geometry.clears_columns:
+        return False
+    column_slots = geometry.column_slots[column]
+    if not all(slot in face_up for slot in column_slots):
+        return False
+    value = cards[slots[column_slots[0]]].value
+    return all(cards[slots[slot]].value == value for slot in column_slots)
+
+
+def cleared_slots(
+    geometry: BoardGeometry,
+    slots: Sequence[int],
+    face_up: Collection[int],
+    cards: Mapping[int, Card],
+) -> set[int]:
+    """Slots of every cleared column; these score zero."""
+
+    removed: set[int] = set()
+    for column in range(geometry.columns):
+        if column_cleared(geometry, column, slots, face_up, cards):
+            removed.update(geometry.column_slots[column])
+    return removed
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
+
+from skyjo_optimizer.engine.config import RulesConfig
+from skyjo_optimizer.engine.state import Card, PlayerState, RoundState, build_deck
+
+# active_player, round_ender (-1 for none), final_turns_remaining (-1 for none),
+# turn_count, draw pile length, discard pile length.
+_HEADER_FORMAT = "BbhIHH"
+_HEADER_FIELDS = 6
+
+
+def face_up_mask(slots: Iterable[int]) -> int:
+    return sum(1 << slot for slot in slots)
+
+
+@lru_cache(maxsize=4096)
+def face_up_slots(mask: int) -> frozenset[int]:
+    return frozenset(slot for slot in range(mask.bit_length()) if mask >> slot & 1)
+
+
+class StateCodec:
+    """Fixed-size little-endian encoding of ``RoundState`` for one ruleset and player count.
+
+    A record is a header (turn counters, pile lengths), one ``uint32`` face-up
+    mask per player, every player's slot card ids and then the draw pile
+    followed by the discard pile as ``uint16`` ids. The piles never hold more
+    than the cards left after dealing, so that many pile entries are reserved
+    (zero-padded) and every record has the same size. Rules and the ``cards``
+    table are not stored; ``decode`` takes them from the codec, which makes a
+    record a few hundred bytes instead of several KB of pickle.
+    """
+
+    def __init__(self, rules: RulesConfig, player_count: int) -> None:
+        rules.validate()
+        if player_count < 2:
+            raise ValueError("player_count must be at least 2")
+        if rules.cards_per_player > 32:
+            raise ValueError("the state codec supports at most 32 cards per player")
+        deck = build_deck(rules)
+        if len(deck) > 0xFFFF:
+            raise ValueError("the state codec supports at most 65535 cards")
+        self.rules = rules
+        self.player_count = player_count
+        self.hand_size = player_count * rules.cards_per_player
+        self.pile_size = len(deck) - self.hand_size
+        if self.pile_size < 1:
+            raise ValueError("deck too small for requested number of players")
+        self._cards: dict[int, Card] = {card.card_id: card for card in deck}
+        self._struct = struct.Struct(f"<{_HEADER_FORMAT}{player_count}I{self.hand_size + self.pile_size}H")
+
+    @property
+    def size(self) -> int:
+        """Bytes per encoded state."""
+
+        return self._struct.size
+
+    def encode(self, state: RoundState) -> bytes:
+        return self._struct.pack(*self._fields(state))
+
+    def encode_into(self, buffer: memoryview | bytearray, index: int, state: RoundState) -> None:
+        """Write ``state`` as record ``index`` of ``buffer``."""
+
+        self._struct.pack_into(buffer, index * self.size, *self._fields(state))
+
+    def decode(self, buffer: bytes | memoryview | bytearray, index: int = 0) -> RoundState:
+        """Read record ``index`` straight from ``buffer`` (no intermediate copy)."""
+
+        values = self._struct.unpack_from(buffer, index * self.size)
+        active_player, round_ender, final_turns, turn_count, draw_length, discard_length = values[:_HEADER_FIELDS]
+        masks = values[_HEADER_FIELDS : _HEADER_FIELDS + self.player_count]
+        ids = values[_HEADER_FIELDS + self.player_count :]
+        discard_start = self.hand_size + draw_length
+        size = self.rules.cards_per_player
+        players = tuple(
+            PlayerState(slots=ids[seat * size : (seat + 1) * size], face_up=face_up_slots(mask))
+            for seat, mask in enumerate(masks)
+        )
+        return RoundState(
+            rules=self.rules,
+            cards=self._cards,
+            players=players,
+            draw_pile=ids[self.hand_size : discard_start],
+            discard_pile=ids[discard_start : discard_start + discard_length],
+            active_player=active_player,
+            turn_count=turn_count,
+            final_turns_remaining=None if final_turns < 0 else final_turns,
+            round_ender=None if round_ender < 0 else round_ender,
+        )
+
+    def encode_batch(self, states: Sequence[RoundState]) -> bytearray:
+        buffer = bytearray(len(states) * self.size)
+        for index, state in enumerate(states):
+            self.encode_into(buffer, index, state)
+        return buffer
+
+    def decode_batch(self, buffer: bytes | memoryview | bytearray) -> list[RoundState]:
+        return [self.decode(buffer, index) for index in range(len(buffer) // self.size)]
+
+    def __reduce__(self) -> tuple[type[StateCodec], tuple[RulesConfig, int]]:
+        return StateCodec, (self.rules, self.player_count)
+
+    def _fields(self, state: RoundState) -> list[int]:
+        players = state.players
+        if len(players) != self.player_count:
+            raise ValueError(f"state has {len(players)} players, codec expects {self.player_count}")
+        pile_count = len(state.draw_pile) + len(state.discard_pile)
+        if pile_count > self.pile_size:
+            raise ValueError("state piles hold more cards than the codec's deck leaves after dealing")
+        fields = [
+            state.active_player,
+            -1 if state.round_ender is None else state.round_ender,
+            -1 if state.final_turns_remaining is None else state.final_turns_remaining,
+            state.turn_count,
+            len(state.draw_pile),
+            len(state.discard_pile),
+        ]
+        fields.extend(face_up_mask(player.face_up) for player in players)
+        for player in players:
+            if len(player.slots) != self.rules.cards_per_player:
+                raise ValueError("state boards do not match the codec's cards_per_player")
+            fields.extend(player.slots)
+        fields.extend(state.draw_pile)
+        fields.extend(state.discard_pile)
+        fields.extend([0] * (self.pile_size - pile_count))
+        return fields
+
+
+class SharedStateBatch:
+    """``capacity`` encoded states in a ``multiprocessing.shared_memory`` block.
+
+    The creating process owns the block and unlinks it on ``close``. Other
+    processes receive the batch by pickling (only the block name is sent) or by
+    forking, and decode states directly from the shared pages. Before Python
+    3.13 they must be started from the creator by ``multiprocessing``: a process
+    with its own resource tracker registers the block when attaching, and that
+    tracker unlinks it when the process exits.
+    """
+
+    def __init__(self, codec: StateCodec, capacity: int, *, name: str | None = None) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.codec = codec
+        self.capacity = capacity
+        # Forked children inherit this object, so ownership is tied to the creating pid.
+        self._owner_pid = os.getpid() if name is None else None
+        if name is None:
+            self._memory = SharedMemory(create=True, size=capacity * codec.size)
+        else:
+            self._memory = _attach(name)
+
+    @classmethod
+    def from_states(cls, codec: StateCodec, states: Sequence[RoundState]) -> SharedStateBatch:
+        batch = cls(codec, len(states))
+        for index, state in enumerate(states):
+            batch[index] = state
+        return batch
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __len__(self) -> int:
+        return self.capacity
+
+    def __getitem__(self, index: int) -> RoundState:
+        return self.codec.decode(self._memory.buf, self._index(index))
+
+    def __setitem__(self, index: int, state: RoundState) -> None:
+        self.codec.encode_into(self._memory.buf, self._index(index), state)
+
+    def __iter__(self) -> Iterator[RoundState]:
+        return (self[index] for index in range(self.capacity))
+
+    def close(self) -> None:
+        self._memory.close()
+        if self._owner_pid == os.getpid():
+            self._memory.unlink()
+
+    def __enter__(self) -> SharedStateBatch:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __reduce__(self) -> tuple[object, tuple[object, ...]]:
+        return _attach_batch, (self.codec, self.capacity, self.name)
+
+    def _index(self, index: int) -> int:
+        if not 0 <= index < self.capacity:
+            raise IndexError("state index out of range")
+        return index
+
+
+def _attach_batch(codec: StateCodec, capacity: int, name: str) -> SharedStateBatch:
+    return SharedStateBatch(codec, capacity, name=name)
+
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    # Before 3.13 attaching registers the block again. Processes started by
+    # multiprocessing share the creator's resource tracker, so that registration
+    # is the creator's own. An unrelated process would register it with its own
+    # tracker, which unlinks the block at exit. Unregistering here is not an option,
+    # because in a child it would drop the creator's registration instead.
+    return SharedMemory(name=name)
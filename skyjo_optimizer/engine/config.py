@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 
 DEFAULT_DECK_COMPOSITION: dict[int, int] = {
@@ -14,17 +14,22 @@ DEFAULT_DECK_COMPOSITION: dict[int, int] = {
 
 @dataclass(frozen=True)
 class RulesConfig:
-    """Configurable Skyjo rule switches and constants."""
+    """Configurable Skyjo rule switches and constants.
 
-    cards_per_player: int = 12
+    Boards are ``board_rows`` x ``board_columns`` grids stored row-major, so slot
+    ``row * board_columns + column``; a column of matching face-up cards scores zero.
+    """
+
+    board_rows: int = 3
+    board_columns: int = 4
     starting_face_up_cards: int = 2
     target_match_score: int = 100
     ender_penalty_mode: str = "strict_lowest_required"
     deck_composition: Mapping[int, int] = field(default_factory=lambda: DEFAULT_DECK_COMPOSITION.copy())
 
     def validate(self) -> None:
-        if self.cards_per_player <= 0:
-            raise ValueError("cards_per_player must be positive")
+        if self.board_rows <= 0 or self.board_columns <= 0:
+            raise ValueError("board_rows and board_columns must be positive")
         if self.starting_face_up_cards < 0:
             raise ValueError("starting_face_up_cards must be non-negative")
         if self.starting_face_up_cards > self.cards_per_player:
@@ -36,6 +41,26 @@ class RulesConfig:
         if any(count <= 0 for count in self.deck_composition.values()):
             raise ValueError("all deck composition counts must be positive")
 
+    @property
+    def cards_per_player(self) -> int:
+        return self.board_rows * self.board_columns
+
     @property
     def total_cards(self) -> int:
         return sum(self.deck_composition.values())
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON-ready fields; ``deck_composition`` becomes sorted ``[value, count]`` pairs."""
+
+        return {**asdict(self), "deck_composition": [list(item) for item in sorted(self.deck_composition.items())]}
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> RulesConfig:
+        fields = dict(payload)
+        deck = {int(value): int(count) for value, count in fields.pop("deck_composition")}  # type: ignore[attr-defined]
+        # Payloads written before board geometry existed only name the slot count.
+        legacy_size = fields.pop("cards_per_player", None)
+        rules = cls(**fields, deck_composition=deck)  # type: ignore[arg-type]
+        if legacy_size is not None and legacy_size != rules.cards_per_player:
+            raise ValueError(f"cannot infer a board shape for cards_per_player={legacy_size}")
+        return rules
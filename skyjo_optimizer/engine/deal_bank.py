@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from skyjo_optimizer.engine.codec import face_up_mask, face_up_slots
+from skyjo_optimizer.engine.config import RulesConfig
+from skyjo_optimizer.engine.state import Card, RoundState, build_deck, dealt_state, initialize_round, shuffled_deal
+
+DEAL_BANK_MAGIC = b"SKYJODB1"
+
+# Deals depend only on the deck, board size, face-up count and player count, so
+# rules that differ elsewhere (such as the ender penalty) share one table.
+LayoutKey = tuple[int, int, tuple[tuple[int, int], ...], int]
+# One table to build: rules, player count and the round seeds to deal.
+DealTableSpec = tuple[RulesConfig, int, Iterable[int]]
+
+
+def layout_key(rules: RulesConfig, player_count: int) -> LayoutKey:
+    return (
+        rules.cards_per_player,
+        rules.starting_face_up_cards,
+        tuple(sorted(rules.deck_composition.items())),
+        player_count,
+    )
+
+
+def build_deal_bank(path: str | Path, tables: Iterable[DealTableSpec]) -> Path:
+    """Precompute the deals ``initialize_round`` makes for each table's seeds into one file.
+
+    Layout: magic, a 4-byte little-endian header length, a JSON header and then,
+    per table and 8-byte aligned, the seeds (``int64``), the shuffled card ids
+    (``uint8`` or ``uint16``, one deck per deal) and the face-up slot masks
+    (``uint32``, one per player per deal), all in native byte order. Tables with
+    the same layout are merged and repeated seeds are stored once.
+    """
+
+    merged: dict[LayoutKey, tuple[RulesConfig, dict[int, None]]] = {}
+    for rules, player_count, seeds in tables:
+        rules.validate()
+        if rules.cards_per_player > 32:
+            raise ValueError("deal banks support at most 32 cards per player")
+        entry = merged.setdefault(layout_key(rules, player_count), (rules, {}))
+        entry[1].update(dict.fromkeys(seeds))
+
+    header_tables: list[dict[str, object]] = []
+    sections: list[array] = []
+    offset = 0
+    for (size, face_up_count, deck, player_count), (rules, seeds) in merged.items():
+        typecode = "B" if rules.total_cards <= 256 else "H"
+        seed_column, card_column, mask_column = array("q"), array(typecode), array("I")
+        for seed in seeds:
+            card_ids, face_up = shuffled_deal(rules, player_count, seed)
+            seed_column.append(seed)
+            card_column.extend(card_ids)
+            mask_column.extend(face_up_mask(slots) for slots in face_up)
+        table: dict[str, object] = {
+            "cards_per_player": size,
+            "starting_face_up_cards": face_up_count,
+            "deck": [list(item) for item in deck],
+            "player_count": player_count,
+            "deals": len(seed_column),
+            "card_typecode": typecode,
+        }
+        for name, column in (("seeds", seed_column), ("cards", card_column), ("masks", mask_column)):
+            table[f"{name}_offset"] = offset
+            sections.append(column)
+            offset += _aligned(len(column) * column.itemsize)
+        header_tables.append(table)
+
+    header = json.dumps({"byteorder": sys.byteorder, "tables": header_tables}, sort_keys=True).encode("utf-8")
+    header += b" " * (_aligned(len(DEAL_BANK_MAGIC) + 4 + len(header)) - len(DEAL_BANK_MAGIC) - 4 - len(header))
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    with destination.open("wb") as stream:
+        stream.write(DEAL_BANK_MAGIC + len(header).to_bytes(4, "little") + header)
+        for column in sections:
+            data = column.tobytes()
+            stream.write(data + b"\0" * (_aligned(len(data)) - len(data)))
+    return destination
+
+
+class DealTable:
+    """The banked deals of one layout; rows are read straight from the mapping."""
+
+    def __init__(self, spec: dict[str, object], view: memoryview) -> None:
+        deals = int(spec["deals"])  # type: ignore[call-overload]
+        self.player_count = int(spec["player_count"])  # type: ignore[call-overload]
+        self.deck_size = sum(count for _, count in spec["deck"])  # type: ignore[attr-defined]
+        self._seeds = _column(view, spec["seeds_offset"], deals, "q")
+        self._cards = _column(view, spec["cards_offset"], deals * self.deck_size, str(spec["card_typecode"]))
+        self._masks = _column(view, spec["masks_offset"], deals * self.player_count, "I")
+        self._rows: dict[int, int] | None = None
+        self._card_table: dict[int, Card] | None = None
+
+    def __len__(self) -> int:
+        return len(self._seeds)
+
+    def __contains__(self, seed: int) -> bool:
+        return seed in self._index()
+
+    def deal(self, rules: RulesConfig, seed: int) -> RoundState | None:
+        """The state ``initialize_round(rules, player_count, seed)`` returns, or ``None`` if not banked."""
+
+        row = self._index().get(seed)
+        if row is None:
+            return None
+        if self._card_table is None:
+            self._card_table = {card.card_id: card for card in build_deck(rules)}
+        start = row * self.deck_size
+        card_ids = self._cards[start : start + self.deck_size].tolist()
+        masks = self._masks[row * self.player_count : (row + 1) * self.player_count].tolist()
+        return dealt_state(rules, self._card_table, card_ids, [face_up_slots(mask) for mask in masks])
+
+    def _index(self) -> dict[int, int]:
+        if self._rows is None:
+            self._rows = {seed: row for row, seed in enumerate(self._seeds.tolist())}
+        return self._rows
+
+
+class DealBank:
+    """Read-only, memory-mapped view of a file written by ``build_deal_bank``.
+
+    Processes that open the same file share its pages through the OS cache, and
+    rows are decoded from the mapping only when a round asks for them. Banks
+    pickle as their path, so process pools reopen the mapping instead of copying it.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mmap)
+        prefix = len(DEAL_BANK_MAGIC)
+        if view[:prefix] != DEAL_BANK_MAGIC:
+            raise ValueError(f"{self.path} is not a deal bank")
+        header_length = int.from_bytes(view[prefix : prefix + 4], "little")
+        header = json.loads(bytes(view[prefix + 4 : prefix + 4 + header_length]))
+        if header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{self.path} was built on a {header['byteorder']}-endian machine")
+        data = view[prefix + 4 + header_length :]
+        self.tables: dict[LayoutKey, DealTable] = {}
+        for spec in header["tables"]:
+            deck = tuple((value, count) for value, count in spec["deck"])
+            key = (spec["cards_per_player"], spec["starting_face_up_cards"], deck, spec["player_count"])
+            self.tables[key] = DealTable(spec, data)
+
+    def table(self, rules: RulesConfig, player_count: int) -> DealTable | None:
+        return self.tables.get(layout_key(rules, player_count))
+
+    def deal(self, rules: RulesConfig, player_count: int, seed: int) -> RoundState | None:
+        table = self.table(rules, player_count)
+        return None if table is None else table.deal(rules, seed)
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self.tables.values())
+
+    def __reduce__(self) -> tuple[type[DealBank], tuple[Path]]:
+        return DealBank, (self.path,)
+
+    def __repr__(self) -> str:
+        return f"DealBank({str(self.path)!r}, tables={len(self.tables)}, deals={len(self)})"
+
+
+def deal_round(rules: RulesConfig, player_count: int, seed: int, bank: DealBank | None = None) -> RoundState:
+    """``initialize_round``, served from ``bank`` when it holds the deal."""
+
+    if bank is not None:
+        state = bank.deal(rules, player_count, seed)
+        if state is not None:
+            return state
+    return initialize_round(rules, player_count=player_count, seed=seed)
+
+
+def _column(view: memoryview, offset: object, length: int, typecode: str) -> memoryview:
+    start = int(offset)  # type: ignore[call-overload]
+    return view[start : start + length * array(typecode).itemsize].cast(typecode)
+
+
+def _aligned(size: int) -> int:
+    return -(-size // 8) * 8
@@ -0,0 +1,316 @@
+"""Array-state kernels for the engine step, scoring and the baseline policies.
+
+Each kernel is a plain function over flat integer arrays, compiled with
+``numba.njit`` when Numba is installed and run as plain Python otherwise (the
+array layout alone makes that several times faster than the object engine).
+``run_round`` plays tables of random and simple-heuristic agents through them.
+A kernel round reproduces the object engine's outcome for the same deal and
+seed, including the agents' draws from the round's ``Random``.
+
+``SKYJO_KERNELS=python`` keeps the kernels uncompiled even with Numba present,
+and ``SKYJO_KERNELS=off`` sends every round through the object engine.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Sequence
+from random import Random
+
+from skyjo_optimizer.engine.state import RoundState
+
+KERNELS_ENV = "SKYJO_KERNELS"
+_MODE = os.environ.get(KERNELS_ENV, "").lower()
+
+try:
+    if _MODE in ("python", "off"):
+        raise ImportError
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+    numpy = None
+
+ENABLED = _MODE != "off"
+COMPILED = numba is not None
+KERNEL_BACKEND = "numba" if COMPILED else "python"
+
+# Action kinds, in ``ACTION_KINDS`` order.
+TAKE_DISCARD_SWAP, DRAW_SWAP, DRAW_DISCARD_FLIP = 0, 1, 2
+# Policies; ``run_round`` maps ``RandomAgent`` and ``SimpleHeuristicAgent`` onto them.
+POLICY_RANDOM, POLICY_HEURISTIC = 0, 1
+
+# Header slots: turn bookkeeping, pile lengths and the random-word cursor.
+ACTIVE, TURN, FINAL_TURNS, ENDER, DRAW_LENGTH, DISCARD_LENGTH, CURSOR, STEPS = range(8)
+HEADER_SIZE = 8
+
+# ``play`` statuses.
+DONE, NEEDS_WORDS, TOO_MANY_TURNS, NO_CARDS = range(4)
+
+# Mersenne Twister outputs fetched per refill; a random turn uses one or two.
+WORD_CHUNK = 256
+
+
+def _jit(function):  # type: ignore[no-untyped-def]
+    return numba.njit(cache=True)(function) if numba is not None else function
+
+
+@_jit
+def _draw(header, draw, discard):  # type: ignore[no-untyped-def]
+    """Pop the draw pile, first turning the discard pile under its top card into it; -1 if empty."""
+
+    if header[DRAW_LENGTH] == 0:
+        if header[DISCARD_LENGTH] <= 1:
+            return -1
+        kept = header[DISCARD_LENGTH] - 1
+        for index in range(kept):
+            draw[index] = discard[index]
+        discard[0] = discard[kept]
+        header[DRAW_LENGTH] = kept
+        header[DISCARD_LENGTH] = 1
+    header[DRAW_LENGTH] -= 1
+    return draw[header[DRAW_LENGTH]]
+
+
+@_jit
+def step(header, slots, face_up, face_count, draw, discard, size, kind, slot):  # type: ignore[no-untyped-def]
+    """``apply_action`` for the active player; ``False`` if a draw finds no cards."""
+
+    players = len(face_count)
+    player = header[ACTIVE]
+    index = player * size + slot
+    if kind == TAKE_DISCARD_SWAP:
+        top = header[DISCARD_LENGTH] - 1
+        incoming = discard[top]
+        discard[top] = slots[index]
+        slots[index] = incoming
+    else:
+        incoming = _draw(header, draw, discard)
+        if incoming < 0:
+            return False
+        if kind == DRAW_SWAP:
+            discard[header[DISCARD_LENGTH]] = slots[index]
+            slots[index] = incoming
+        else:
+            discard[header[DISCARD_LENGTH]] = incoming
+        header[DISCARD_LENGTH] += 1
+    if face_up[index] == 0:
+        face_up[index] = 1
+        face_count[player] += 1
+
+    if header[FINAL_TURNS] < 0:
+        if header[TURN] == 0:
+            for seat in range(players):
+                if face_count[seat] == size:
+                    header[ENDER] = seat
+                    header[FINAL_TURNS] = players - 1
+                    break
+        elif face_count[player] == size:
+            header[ENDER] = player
+            header[FINAL_TURNS] = players - 1
+    elif header[FINAL_TURNS] > 0:
+        header[FINAL_TURNS] -= 1
+    header[ACTIVE] = (player + 1) % players
+    header[TURN] += 1
+    return True
+
+
+@_jit
+def score(slots, face_up, values, size, rows, columns, ender, penalty, out):  # type: ignore[no-untyped-def]
+    """Round scores in seat order: cleared columns count zero, then the ender penalty."""
+
+    players = len(out)
+    for player in range(players):
+        base = player * size
+        total = 0
+        for slot in range(size):
+            total += values[slots[base + slot]]
+        if rows > 1:
+            for column in range(columns):
+                value = values[slots[base + column]]
+                cleared = True
+                for row in range(rows):
+                    index = base + row * columns + column
+                    if face_up[index] == 0 or values[slots[index]] != value:
+                        cleared = False
+                        break
+                if cleared:
+                    total -= value * rows
+        out[player] = total
+    if penalty and ender >= 0:
+        lowest = out[0]
+        for player in range(1, players):
+            lowest = min(lowest, out[player])
+        ties = 0
+        for player in range(players):
+            if out[player] == lowest:
+                ties += 1
+        if out[ender] != lowest or ties > 1:
+            out[ender] *= 2
+
+
+@_jit
+def random_action(header, face_up, face_count, size, words):  # type: ignore[no-untyped-def]
+    """``rng.choice(legal_actions(state))`` as ``(kind, slot)``, or ``(-1, -1)`` if ``words`` run out.
+
+    ``Random.choice`` draws ``getrandbits(n.bit_length())`` until below ``n``,
+    and ``getrandbits(k)`` is the next 32-bit word shifted right by ``32 - k``.
+    The cursor only advances once a choice succeeds, so a refill replays it.
+    """
+
+    player = header[ACTIVE]
+    count = 2 * size + size - face_count[player]
+    bits = 0
+    while count >> bits:
+        bits += 1
+    cursor = header[CURSOR]
+    while True:
+        if cursor >= len(words):
+            return -1, -1
+        choice = words[cursor] >> (32 - bits)
+        cursor += 1
+        if choice < count:
+            break
+    header[CURSOR] = cursor
+    base = player * size
+    for slot in range(size):
+        if choice < 2:
+            return choice, slot
+        choice -= 2
+        if face_up[base + slot] == 0:
+            if choice == 0:
+                return DRAW_DISCARD_FLIP, slot
+            choice -= 1
+    return -1, -1
+
+
+@_jit
+def heuristic_action(header, slots, face_up, discard, values, size):  # type: ignore[no-untyped-def]
+    """``SimpleHeuristicAgent.choose_action`` as ``(kind, slot)``."""
+
+    base = header[ACTIVE] * size
+    first_hidden = -1
+    highest = 0
+    for slot in range(size):
+        if first_hidden < 0 and face_up[base + slot] == 0:
+            first_hidden = slot
+        if values[slots[base + slot]] > values[slots[base + highest]]:
+            highest = slot
+    if values[discard[header[DISCARD_LENGTH] - 1]] <= 2:
+        return TAKE_DISCARD_SWAP, (first_hidden if first_hidden >= 0 else highest)
+    if first_hidden >= 0:
+        return DRAW_DISCARD_FLIP, first_hidden
+    return DRAW_SWAP, highest
+
+
+@_jit
+def play(header, slots, face_up, face_count, draw, discard, values, policies, words, size, max_turns):  # type: ignore[no-untyped-def]
+    """Play until the round ends or a random policy needs more ``words``; returns a status."""
+
+    while True:
+        if header[STEPS] == max_turns:
+            return TOO_MANY_TURNS
+        if header[FINAL_TURNS] == 0:
+            return DONE
+        if policies[header[ACTIVE]] == POLICY_RANDOM:
+            kind, slot = random_action(header, face_up, face_count, size, words)
+            if kind < 0:
+                return NEEDS_WORDS
+        else:
+            kind, slot = heuristic_action(header, slots, face_up, discard, values, size)
+        if not step(header, slots, face_up, face_count, draw, discard, size, kind, slot):
+            return NO_CARDS
+        header[STEPS] += 1
+
+
+class ArrayState:
+    """A ``RoundState`` unpacked into the flat arrays the kernels work on."""
+
+    def __init__(self, state: RoundState) -> None:
+        rules = state.rules
+        self.size = rules.cards_per_player
+        self.rows = rules.board_rows
+        self.columns = rules.board_columns
+        self.penalty = rules.ender_penalty_mode == "strict_lowest_required"
+        capacity = rules.total_cards
+        values = [0] * (max(state.cards) + 1)
+        for card_id, card in state.cards.items():
+            values[card_id] = card.value
+        self.values = _array(values)
+        self.slots = _array([card_id for player in state.players for card_id in player.slots])
+        self.face_up = _array(
+            [int(slot in player.face_up) for player in state.players for slot in range(len(player.slots))]
+        )
+        self.face_count = _array([len(player.face_up) for player in state.players])
+        self.draw = _array(list(state.draw_pile) + [0] * (capacity - len(state.draw_pile)))
+        self.discard = _array(list(state.discard_pile) + [0] * (capacity - len(state.discard_pile)))
+        header = [0] * HEADER_SIZE
+        header[ACTIVE] = state.active_player
+        header[TURN] = state.turn_count
+        header[FINAL_TURNS] = -1 if state.final_turns_remaining is None else state.final_turns_remaining
+        header[ENDER] = -1 if state.round_ender is None else state.round_ender
+        header[DRAW_LENGTH] = len(state.draw_pile)
+        header[DISCARD_LENGTH] = len(state.discard_pile)
+        self.header = _array(header)
+
+    def step(self, kind: int, slot: int) -> None:
+        if not step(self.header, self.slots, self.face_up, self.face_count, self.draw, self.discard, self.size, kind, slot):
+            raise RuntimeError("no cards available to draw")
+
+    def scores(self) -> list[int]:
+        out = _array([0] * len(self.face_count))
+        score(
+            self.slots, self.face_up, self.values, self.size, self.rows, self.columns,
+            int(self.header[ENDER]), self.penalty, out,
+        )
+        return [int(value) for value in out]
+
+
+def kernel_round(
+    policies: Sequence[int],
+    state: RoundState,
+    *,
+    rng: Random,
+    max_turns: int = 1000,
+) -> tuple[list[int], int]:
+    """Play a dealt round with one policy per seat; returns seat-order scores and the turn count.
+
+    Random policies read ``rng``'s output in chunks, so ``rng`` ends in a
+    different state than after the object engine's round: pass a per-round ``Random``.
+    """
+
+    arrays = ArrayState(state)
+    seat_policies = _array(list(policies))
+    words = random_words(rng, WORD_CHUNK) if POLICY_RANDOM in policies else _array([])
+    while True:
+        status = play(
+            arrays.header, arrays.slots, arrays.face_up, arrays.face_count, arrays.draw, arrays.discard,
+            arrays.values, seat_policies, words, arrays.size, max_turns,
+        )
+        if status == DONE:
+            return arrays.scores(), int(arrays.header[TURN])
+        if status == TOO_MANY_TURNS:
+            raise RuntimeError("round exceeded max_turns without termination")
+        if status == NO_CARDS:
+            raise RuntimeError("no cards available to draw")
+        words = _concatenate(words[int(arrays.header[CURSOR]) :], random_words(rng, WORD_CHUNK))
+        arrays.header[CURSOR] = 0
+
+
+def _array(values: list[int]):  # type: ignore[no-untyped-def]
+    return numpy.array(values, dtype=numpy.int64) if numpy is not None else values
+
+
+def random_words(rng: Random, count: int):  # type: ignore[no-untyped-def]
+    """The next ``count`` 32-bit outputs of ``rng``, as the word buffer ``random_action`` reads from."""
+
+    # ``getrandbits(32 * count)`` packs ``count`` consecutive 32-bit outputs, first word lowest.
+    data = rng.getrandbits(32 * count).to_bytes(4 * count, "little")
+    if numpy is not None:
+        return numpy.frombuffer(data, dtype="<u4").astype(numpy.int64)
+    return list(struct.unpack(f"<{count}I", data))
+
+
+def _concatenate(first, second):  # type: ignore[no-untyped-def]
+    return numpy.concatenate((first, second)) if numpy is not None else first + second
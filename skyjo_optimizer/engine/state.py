@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass
 from random import Random
 
@@ -50,6 +51,13 @@ def build_deck(rules: RulesConfig) -> list[Card]:
 
 
 def initialize_round(rules: RulesConfig, player_count: int, seed: int) -> RoundState:
+    card_ids, face_up = shuffled_deal(rules, player_count, seed)
+    return dealt_state(rules, {card.card_id: card for card in build_deck(rules)}, card_ids, face_up)
+
+
+def shuffled_deal(rules: RulesConfig, player_count: int, seed: int) -> tuple[list[int], list[frozenset[int]]]:
+    """The shuffled card order and each player's starting face-up slots for ``seed``."""
+
     if player_count < 2:
         raise ValueError("player_count must be at least 2")
 
@@ -60,27 +68,33 @@ def initialize_round(rules: RulesConfig, player_count: int, seed: int) -> RoundS
     rng = Random(seed)
     card_ids = [card.card_id for card in deck]
     rng.shuffle(card_ids)
+    face_up = [
+        frozenset(rng.sample(range(rules.cards_per_player), rules.starting_face_up_cards))
+        for _ in range(player_count)
+    ]
+    return card_ids, face_up
 
-    players: list[PlayerState] = []
-    cursor = 0
-    for _ in range(player_count):
-        slots = tuple(card_ids[cursor : cursor + rules.cards_per_player])
-        cursor += rules.cards_per_player
-
-        face_up_indices = set(rng.sample(range(rules.cards_per_player), rules.starting_face_up_cards))
-        players.append(PlayerState(slots=slots, face_up=frozenset(face_up_indices)))
 
-    discard_pile = (card_ids[cursor],)
-    cursor += 1
-    draw_pile = tuple(card_ids[cursor:])
-    cards_by_id = {card.card_id: card for card in deck}
+def dealt_state(
+    rules: RulesConfig,
+    cards: dict[int, Card],
+    card_ids: Sequence[int],
+    face_up: Sequence[frozenset[int]],
+) -> RoundState:
+    """Lay out a shuffled deal: hands in seat order, one discard, the rest as draw pile."""
 
+    size = rules.cards_per_player
+    players = tuple(
+        PlayerState(slots=tuple(card_ids[seat * size : (seat + 1) * size]), face_up=slots)
+        for seat, slots in enumerate(face_up)
+    )
+    cursor = len(face_up) * size
     return RoundState(
         rules=rules,
-        cards=cards_by_id,
-        players=tuple(players),
-        draw_pile=draw_pile,
-        discard_pile=discard_pile,
+        cards=cards,
+        players=players,
+        draw_pile=tuple(card_ids[cursor + 1 :]),
+        discard_pile=(card_ids[cursor],),
         active_player=0,
         turn_count=0,
         final_turns_remaining=None,
@@ -88,26 +102,58 @@ def initialize_round(rules: RulesConfig, player_count: int, seed: int) -> RoundS
     )
 
 
+ACTION_KINDS = ("take_discard_swap", "draw_swap", "draw_discard_flip")
+
+# Actions are immutable, so one shared instance per (slot, kind) saves rebuilding
+# dataclasses on every turn.
+_ACTION_TABLE: list[tuple[Action, Action, Action]] = []
+
+
+def _slot_actions(slot_index: int) -> tuple[Action, Action, Action]:
+    while len(_ACTION_TABLE) <= slot_index:
+        index = len(_ACTION_TABLE)
+        _ACTION_TABLE.append(tuple(Action(kind=kind, slot_index=index) for kind in ACTION_KINDS))  # type: ignore[arg-type]
+    return _ACTION_TABLE[slot_index]
+
+
 def legal_actions(state: RoundState) -> list[Action]:
     player = state.players[state.active_player]
-    actions: list[Action] = []
-    for slot_index in range(len(player.slots)):
-        actions.append(Action(kind="take_discard_swap", slot_index=slot_index))
-        actions.append(Action(kind="draw_swap", slot_index=slot_index))
-        if slot_index not in player.face_up:
-            actions.append(Action(kind="draw_discard_flip", slot_index=slot_index))
-    return actions
+    key = (len(player.slots), player.face_up)
+    actions = _LEGAL_ACTIONS_CACHE.get(key)
+    if actions is None:
+        actions = []
+        for slot_index in range(len(player.slots)):
+            take_discard, draw_swap, flip = _slot_actions(slot_index)
+            actions.append(take_discard)
+            actions.append(draw_swap)
+            if slot_index not in player.face_up:
+                actions.append(flip)
+        _LEGAL_ACTIONS_CACHE[key] = actions
+    return list(actions)
+
+
+# Legal actions depend only on board size and face-up slots, which repeat heavily.
+_LEGAL_ACTIONS_CACHE: dict[tuple[int, frozenset[int]], list[Action]] = {}
+
+
+def is_legal_action(state: RoundState, action: Action) -> bool:
+    """Equivalent to ``action in legal_actions(state)`` without building the list."""
+
+    player = state.players[state.active_player]
+    if not 0 <= action.slot_index < len(player.slots):
+        return False
+    if action.kind == "draw_discard_flip":
+        return action.slot_index not in player.face_up
+    return action.kind in ("take_discard_swap", "draw_swap")
 
 
 def apply_action(state: RoundState, action: Action) -> RoundState:
-    if action not in legal_actions(state):
+    if not is_legal_action(state, action):
         raise ValueError("illegal action")
 
-    players = [
-        PlayerState(slots=tuple(player.slots), face_up=frozenset(player.face_up))
-        for player in state.players
-    ]
-    draw_pile = list(state.draw_pile)
+    # States are immutable, so untouched players and piles are shared with the next state.
+    players = list(state.players)
+    draw_pile: tuple[int, ...] | list[int] = state.draw_pile
     discard_pile = list(state.discard_pile)
     player = players[state.active_player]
 
@@ -121,31 +167,25 @@ def apply_action(state: RoundState, action: Action) -> RoundState:
         discard_pile.append(outgoing)
         face_up.add(action.slot_index)
     elif action.kind == "draw_swap":
-        incoming, draw_pile, discard_pile = _draw_card(draw_pile, discard_pile)
+        incoming, draw_pile, discard_pile = _draw_card(list(draw_pile), discard_pile)
         outgoing = slot_cards[action.slot_index]
         slot_cards[action.slot_index] = incoming
         discard_pile.append(outgoing)
         face_up.add(action.slot_index)
     elif action.kind == "draw_discard_flip":
-        _, draw_pile, discard_pile = _draw_card(draw_pile, discard_pile)
+        incoming, draw_pile, discard_pile = _draw_card(list(draw_pile), discard_pile)
+        discard_pile.append(incoming)
         face_up.add(action.slot_index)
     else:
         raise ValueError(f"unknown action kind: {action.kind}")
 
     players[state.active_player] = PlayerState(slots=tuple(slot_cards), face_up=frozenset(face_up))
-
-    next_state = RoundState(
-        rules=state.rules,
-        cards=state.cards,
+    return _advance_turn(
+        state,
         players=tuple(players),
         draw_pile=tuple(draw_pile),
         discard_pile=tuple(discard_pile),
-        active_player=state.active_player,
-        turn_count=state.turn_count,
-        final_turns_remaining=state.final_turns_remaining,
-        round_ender=state.round_ender,
     )
-    return _advance_turn(next_state)
 
 
 def _draw_card(draw_pile: list[int], discard_pile: list[int]) -> tuple[int, list[int], list[int]]:
@@ -160,14 +200,23 @@ def _draw_card(draw_pile: list[int], discard_pile: list[int]) -> tuple[int, list
     return card_id, draw_pile, discard_pile
 
 
-def _advance_turn(state: RoundState) -> RoundState:
-    players = state.players
+def _advance_turn(
+    state: RoundState,
+    *,
+    players: tuple[PlayerState, ...],
+    draw_pile: tuple[int, ...],
+    discard_pile: tuple[int, ...],
+) -> RoundState:
     final_turns_remaining = state.final_turns_remaining
     round_ender = state.round_ender
 
     if final_turns_remaining is None:
-        for index, player in enumerate(players):
-            if len(player.face_up) == len(player.slots):
+        # After the first turn only the acting player's board can have changed,
+        # so checking it alone keeps a turn O(1) in the player count. The first
+        # turn scans every seat, since the deal may leave any board face-up.
+        seats = range(len(players)) if state.turn_count == 0 else (state.active_player,)
+        for index in seats:
+            if len(players[index].face_up) == len(players[index].slots):
                 round_ender = index
                 final_turns_remaining = len(players) - 1
                 break
@@ -178,8 +227,8 @@ def _advance_turn(state: RoundState) -> RoundState:
         rules=state.rules,
         cards=state.cards,
         players=players,
-        draw_pile=state.draw_pile,
-        discard_pile=state.discard_pile,
+        draw_pile=draw_pile,
+        discard_pile=discard_pile,
         active_player=(state.active_player + 1) % len(players),
         turn_count=state.turn_count + 1,
         final_turns_remaining=final_turns_remaining,
@@ -1,11 +1,63 @@
-from .evolution import EvolutionConfig, EvolutionOptimizer, StrategyPerformance
-from .experiment import ExperimentMetadata, ExperimentReport, run_experiment
-
-__all__ = [
-    "EvolutionConfig",
-    "EvolutionOptimizer",
-    "StrategyPerformance",
-    "ExperimentMetadata",
-    "ExperimentReport",
-    "run_experiment",
-]
+from skyjo_optimizer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .evolution import EvolutionConfig, EvolutionOptimizer, GenerationRecord, StrategyPerformance
+    from .artifact_cache import ARTIFACT_CACHE_DIRNAME, ArtifactCache, code_version
+    from .checkpoint import CHECKPOINT_FILENAME, EvolutionCheckpoint, read_checkpoint, write_checkpoint
+    from .islands import IslandConfig, IslandOptimizer
+    from .population import HEURISTIC_SCHEMA, Parameter, ParameterSchema, Population
+    from .surrogate import QuadraticSurrogate, SurrogateStats
+    from .experiment import ExperimentMetadata, ExperimentReport, new_run_dir, run_experiment
+    from .store import ArtifactStore
+    from .telemetry import GenerationEvent, JsonlTelemetrySink, RunFinishedEvent, read_events
+    from .sweep import SweepOutcome, SweepSpec, run_sweep
+    from .league import League, LeagueEntry, MatchResult, Rating, rate_match
+    from .round_cache import RoundCache, agent_fingerprint, cached_tournament
+
+_EXPORTS: dict[str, str] = {
+    "EvolutionConfig": ".evolution",
+    "EvolutionOptimizer": ".evolution",
+    "GenerationRecord": ".evolution",
+    "StrategyPerformance": ".evolution",
+    "ARTIFACT_CACHE_DIRNAME": ".artifact_cache",
+    "ArtifactCache": ".artifact_cache",
+    "ArtifactStore": ".store",
+    "CHECKPOINT_FILENAME": ".checkpoint",
+    "EvolutionCheckpoint": ".checkpoint",
+    "ExperimentMetadata": ".experiment",
+    "ExperimentReport": ".experiment",
+    "GenerationEvent": ".telemetry",
+    "HEURISTIC_SCHEMA": ".population",
+    "IslandConfig": ".islands",
+    "IslandOptimizer": ".islands",
+    "JsonlTelemetrySink": ".telemetry",
+    "Parameter": ".population",
+    "ParameterSchema": ".population",
+    "Population": ".population",
+    "QuadraticSurrogate": ".surrogate",
+    "RunFinishedEvent": ".telemetry",
+    "SurrogateStats": ".surrogate",
+    "League": ".league",
+    "LeagueEntry": ".league",
+    "MatchResult": ".league",
+    "Rating": ".league",
+    "RoundCache": ".round_cache",
+    "SweepOutcome": ".sweep",
+    "SweepSpec": ".sweep",
+    "code_version": ".artifact_cache",
+    "new_run_dir": ".experiment",
+    "read_checkpoint": ".checkpoint",
+    "read_events": ".telemetry",
+    "run_experiment": ".experiment",
+    "agent_fingerprint": ".round_cache",
+    "cached_tournament": ".round_cache",
+    "rate_match": ".league",
+    "run_sweep": ".sweep",
+    "write_checkpoint": ".checkpoint",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
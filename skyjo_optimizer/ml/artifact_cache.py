@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import skyjo_optimizer
+
+ARTIFACT_CACHE_DIRNAME = "cache"
+
+
+class ArtifactCache:
+    """Content-addressed store for sub-results that do not depend on the optimized strategy.
+
+    An artifact lives at ``<root>/<kind>/<key>.json`` where ``key`` hashes the
+    kind, its JSON-serializable inputs and ``code_version()``. Any source change
+    therefore invalidates every entry; stale files are simply never read again.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def key(self, kind: str, inputs: dict[str, object]) -> str:
+        payload = {"kind": kind, "inputs": inputs, "code_version": code_version()}
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def path(self, kind: str, inputs: dict[str, object]) -> Path:
+        return self.root / kind / f"{self.key(kind, inputs)}.json"
+
+    def get(self, kind: str, inputs: dict[str, object]) -> Any | None:
+        path = self.path(kind, inputs)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())["value"]
+
+    def put(self, kind: str, inputs: dict[str, object], value: object) -> Path:
+        """Atomically store ``value``; concurrent writers of one key write identical bytes."""
+
+        destination = self.path(kind, inputs)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        encoded = json.dumps({"kind": kind, "inputs": inputs, "value": value}, sort_keys=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{destination.name}.", dir=destination.parent)
+        try:
+            with os.fdopen(fd, "w") as handle:
+                handle.write(encoded + "\n")
+            os.replace(tmp_name, destination)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return destination
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Hash of every Python source file in the package, so results track the code that made them."""
+
+    package_root = Path(skyjo_optimizer.__file__).parent
+    digest = hashlib.sha256()
+    for path in sorted(package_root.rglob("*.py")):
+        digest.update(path.relative_to(package_root).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
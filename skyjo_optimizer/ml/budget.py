@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class BudgetExhausted(Exception):
+    """Raised before an evaluation that would eat into the reserved final-pass budget."""
+
+
+class EvaluationBudget:
+    """Wall-clock and evaluation-count budget for an anytime optimization run.
+
+    One evaluation is one strategy scored on one situation.
+    Its cost is estimated as ``rounds * seconds_per_round``, where the per-round
+    cost is the wall time elapsed so far over the rounds simulated so far, so
+    selection and mutation overhead is priced in too. ``reserve`` holds back
+    budget for the final holdout pass so that it never overruns the deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        time_budget_seconds: float | None = None,
+        max_evaluations: int | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if time_budget_seconds is not None and time_budget_seconds <= 0:
+            raise ValueError("time_budget_seconds must be positive")
+        if max_evaluations is not None and max_evaluations <= 0:
+            raise ValueError("max_evaluations must be positive")
+        self.time_budget_seconds = time_budget_seconds
+        self.max_evaluations = max_evaluations
+        self.clock = clock
+        self._started = clock()
+        self._finished: float | None = None
+        self.evaluations = 0
+        self.rounds_simulated = 0
+        self.measured_seconds = 0.0
+        self.reserve_evaluations = 0
+        self.reserve_rounds = 0
+        self.exhausted = False
+        self.enforcing = True
+        self.generations_completed = 0
+        self.final_candidates = 0
+
+    @property
+    def elapsed_seconds(self) -> float:
+        end = self._finished if self._finished is not None else self.clock()
+        return end - self._started
+
+    @property
+    def seconds_per_round(self) -> float | None:
+        if self.rounds_simulated == 0:
+            return None
+        return max(self.measured_seconds, self.elapsed_seconds) / self.rounds_simulated
+
+    def finish(self) -> None:
+        """Freeze ``elapsed_seconds`` at the end of the run."""
+
+        self._finished = self.clock()
+
+    def set_reserve(self, evaluations: int, rounds_each: int) -> None:
+        self.reserve_evaluations = evaluations
+        self.reserve_rounds = evaluations * rounds_each
+
+    def check(self, rounds: int, count: int = 1) -> None:
+        """Raise ``BudgetExhausted`` if ``count`` more evaluations would not leave the reserve intact."""
+
+        if not self.enforcing:
+            return
+        if (
+            self.max_evaluations is not None
+            and self.evaluations + count + self.reserve_evaluations > self.max_evaluations
+        ):
+            self.exhausted = True
+            raise BudgetExhausted
+        if self.time_budget_seconds is not None:
+            per_round = self.seconds_per_round
+            if per_round is None:
+                return
+            projected = self.elapsed_seconds + (rounds * count + self.reserve_rounds) * per_round
+            if projected > self.time_budget_seconds:
+                self.exhausted = True
+                raise BudgetExhausted
+
+    def record(self, rounds: int, seconds: float, count: int = 1) -> None:
+        self.evaluations += count
+        self.rounds_simulated += rounds * count
+        self.measured_seconds += seconds
+
+    def affordable_evaluations(self, rounds_each: int) -> int:
+        """How many more evaluations of ``rounds_each`` rounds fit in what is left."""
+
+        limits: list[int] = []
+        if self.max_evaluations is not None:
+            limits.append(self.max_evaluations - self.evaluations)
+        if self.time_budget_seconds is not None and self.seconds_per_round is not None:
+            remaining = self.time_budget_seconds - self.elapsed_seconds
+            limits.append(int(remaining / (rounds_each * self.seconds_per_round)))
+        return max(0, min(limits)) if limits else 2**31
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "time_budget_seconds": self.time_budget_seconds,
+            "max_evaluations": self.max_evaluations,
+            "elapsed_seconds": self.elapsed_seconds,
+            "evaluations": self.evaluations,
+            "rounds_simulated": self.rounds_simulated,
+            "estimated_seconds_per_round": self.seconds_per_round,
+            "stopped_by_budget": self.exhausted,
+            "generations_completed": self.generations_completed,
+            "final_candidates": self.final_candidates,
+        }
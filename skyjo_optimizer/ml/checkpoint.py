@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml.population import HEURISTIC_SCHEMA, ParameterSchema, Population
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+CHECKPOINT_FILENAME = "checkpoint.json.gz"
+CHECKPOINT_VERSION = 1
+
+# (strategy, situation name, rounds, seed, evaluator backend key)
+FitnessKey = tuple[HeuristicStrategy, str, int, int, str]
+
+
+@dataclass(frozen=True)
+class EvolutionCheckpoint:
+    """Everything needed to continue an ``EvolutionOptimizer.optimize`` run.
+
+    ``next_generation`` is the first generation that has not been evaluated yet.
+    It equals ``config["generations"]`` once the loop has finished or stopped early.
+    Individuals are stored as rows of the population's schema, whose parameter
+    names are recorded so a checkpoint is only read back with the same genome.
+    """
+
+    config: dict[str, object]
+    situations: tuple[GameSituation, ...]
+    next_generation: int
+    population: Population
+    rng_state: tuple[object, ...]
+    best_holdout: float
+    stagnant_generations: int
+    fitness_cache: dict[FitnessKey, float]
+    history: tuple[tuple[Any, float], ...] = ()
+    surrogate: dict[str, float | int] = field(default_factory=dict)
+    pending_predictions: dict[Any, float] = field(default_factory=dict)
+    generation_records: tuple[dict[str, object], ...] = ()
+
+
+def write_checkpoint(path: str | Path, checkpoint: EvolutionCheckpoint) -> Path:
+    """Atomically write ``checkpoint`` as gzip-compressed compact JSON."""
+
+    return write_gzip_json(path, _to_payload(checkpoint))
+
+
+def read_checkpoint(path: str | Path, schema: ParameterSchema = HEURISTIC_SCHEMA) -> EvolutionCheckpoint:
+    payload = read_gzip_json(path)
+    if payload.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version: {payload.get('version')!r}")
+    # Checkpoints written before schemas were recorded hold HeuristicStrategy rows.
+    parameters = tuple(payload.get("parameters", HEURISTIC_SCHEMA.names))
+    if parameters != schema.names:
+        raise ValueError(f"checkpoint parameters {list(parameters)} do not match the schema {list(schema.names)}")
+    return _from_payload(payload, schema)
+
+
+def write_fitness_cache(path: str | Path, cache: dict[FitnessKey, float]) -> Path:
+    """Atomically persist a fitness cache so separate runs can share evaluations."""
+
+    return write_gzip_json(path, {"version": CHECKPOINT_VERSION, "fitness_cache": _cache_to_rows(cache)})
+
+
+def read_fitness_cache(path: str | Path) -> dict[FitnessKey, float]:
+    if not Path(path).exists():
+        return {}
+    return _cache_from_rows(read_gzip_json(path)["fitness_cache"])
+
+
+def write_gzip_json(path: str | Path, payload: dict[str, object]) -> Path:
+    """Atomically write ``payload`` as gzipped JSON; used by checkpoints, leagues and round caches."""
+
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{destination.name}.", dir=destination.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            # mtime=0 keeps the bytes stable for identical checkpoints.
+            with gzip.GzipFile(fileobj=handle, mode="wb", mtime=0) as compressed:
+                compressed.write(encoded)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, destination)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def read_gzip_json(path: str | Path) -> dict[str, Any]:
+    """Read a file written by ``write_gzip_json``."""
+
+    return json.loads(gzip.decompress(Path(path).read_bytes()).decode("utf-8"))
+
+
+def _to_payload(checkpoint: EvolutionCheckpoint) -> dict[str, object]:
+    version, internal_state, gauss_next = checkpoint.rng_state
+    population = checkpoint.population
+    encode = population.schema.encode
+    return {
+        "version": CHECKPOINT_VERSION,
+        "config": dict(checkpoint.config),
+        "situations": [asdict(situation) for situation in checkpoint.situations],
+        "next_generation": checkpoint.next_generation,
+        "parameters": list(population.schema.names),
+        "population": [list(population.row(index)) for index in range(len(population))],
+        "rng_state": [version, list(internal_state), gauss_next],
+        "best_holdout": None if checkpoint.best_holdout == float("-inf") else checkpoint.best_holdout,
+        "stagnant_generations": checkpoint.stagnant_generations,
+        "fitness_cache": _cache_to_rows(checkpoint.fitness_cache),
+        "history": [[list(encode(individual)), fitness] for individual, fitness in checkpoint.history],
+        "surrogate": dict(checkpoint.surrogate),
+        "pending_predictions": [
+            [list(encode(individual)), predicted] for individual, predicted in checkpoint.pending_predictions.items()
+        ],
+        "generation_records": [dict(record) for record in checkpoint.generation_records],
+    }
+
+
+def _from_payload(payload: dict[str, Any], schema: ParameterSchema) -> EvolutionCheckpoint:
+    version, internal_state, gauss_next = payload["rng_state"]
+    best_holdout = payload["best_holdout"]
+    return EvolutionCheckpoint(
+        config=dict(payload["config"]),
+        situations=tuple(GameSituation(**row) for row in payload["situations"]),
+        next_generation=int(payload["next_generation"]),
+        population=Population(schema, [float(value) for row in payload["population"] for value in row]),
+        rng_state=(version, tuple(internal_state), gauss_next),
+        best_holdout=float("-inf") if best_holdout is None else float(best_holdout),
+        stagnant_generations=int(payload["stagnant_generations"]),
+        fitness_cache=_cache_from_rows(payload["fitness_cache"]),
+        history=tuple((schema.decode(row), float(fitness)) for row, fitness in payload.get("history", [])),
+        surrogate=dict(payload.get("surrogate", {})),
+        pending_predictions={
+            schema.decode(row): float(predicted) for row, predicted in payload.get("pending_predictions", [])
+        },
+        generation_records=tuple(payload.get("generation_records", [])),
+    )
+
+
+def _cache_to_rows(cache: dict[FitnessKey, float]) -> list[list[object]]:
+    return [
+        [_strategy_to_list(strategy), situation_name, rounds, seed, fitness, evaluator]
+        for (strategy, situation_name, rounds, seed, evaluator), fitness in cache.items()
+    ]
+
+
+def _cache_from_rows(rows: list[list[Any]]) -> dict[FitnessKey, float]:
+    cache: dict[FitnessKey, float] = {}
+    for strategy, situation_name, rounds, seed, fitness, *rest in rows:
+        # Rows written before evaluator backends existed hold synthetic-model fitness.
+        evaluator = rest[0] if rest else "synthetic"
+        cache[(_strategy_from_list(strategy), situation_name, int(rounds), int(seed), evaluator)] = float(fitness)
+    return cache
+
+
+def _strategy_to_list(strategy: HeuristicStrategy) -> list[float]:
+    return list(HEURISTIC_SCHEMA.encode(strategy))
+
+
+def _strategy_from_list(values: list[float]) -> HeuristicStrategy:
+    return HEURISTIC_SCHEMA.decode(values)
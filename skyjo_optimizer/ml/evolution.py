@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+import statistics
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 
 from skyjo_optimizer.agents.heuristic import HeuristicStrategy
-from skyjo_optimizer.simulation.evaluator import evaluate_strategy
+from skyjo_optimizer.ml.budget import BudgetExhausted, EvaluationBudget
+from skyjo_optimizer.ml.checkpoint import EvolutionCheckpoint, FitnessKey, read_checkpoint, write_checkpoint
+from skyjo_optimizer.ml.population import HEURISTIC_SCHEMA, Population
+from skyjo_optimizer.ml.surrogate import HISTORY_WINDOW, QuadraticSurrogate, SurrogateStats
+from skyjo_optimizer.ml.telemetry import GenerationEvent, Observer, PhaseTimer, RunFinishedEvent
+from skyjo_optimizer.engine.deal_bank import DealTableSpec
+from skyjo_optimizer.simulation.backends import EvaluatorBackend, get_evaluator
+from skyjo_optimizer.simulation.engine_evaluator import engine_deal_tables
+from skyjo_optimizer.simulation.evaluator import PairedComparison, compare_paired
 from skyjo_optimizer.simulation.scenarios import GameSituation
 
 
@@ -19,6 +31,29 @@ class EvolutionConfig:
     holdout_every: int = 2
     early_stop_patience: int = 5
     seed: int = 7
+    # Surrogate pre-screening: draw ``surrogate_pool_factor`` times more mutants than
+    # needed and evaluate only the best by upper confidence bound. ``0`` or ``1`` disables it.
+    surrogate_pool_factor: int = 0
+    surrogate_exploration: float = 1.0
+    # Anytime mode: stop early at either limit and keep enough budget for the final holdout pass.
+    time_budget_seconds: float | None = None
+    max_evaluations: int | None = None
+    # Common random numbers: candidates compared in one selection step share one seed
+    # and are ranked by paired differences.
+    common_random_numbers: bool = False
+    # Fitness source: "synthetic" score model or "engine" rounds against a
+    # comma-separated ``opponent_pool`` (ignored by the synthetic model).
+    evaluator: str = "synthetic"
+    opponent_pool: str = "heuristic,random"
+
+    def validate(self) -> None:
+        if self.surrogate_pool_factor < 0:
+            raise ValueError("surrogate_pool_factor must be non-negative")
+        if self.elite_count <= 0:
+            raise ValueError("elite_count must be positive")
+        if self.elite_count > self.population_size:
+            raise ValueError("elite_count cannot exceed population_size")
+        get_evaluator(self.evaluator, self.opponent_pool)
 
 
 @dataclass(frozen=True)
@@ -28,74 +63,288 @@ class StrategyPerformance:
     aggregate_fitness: float
 
 
+@dataclass(frozen=True)
+class GenerationRecord:
+    """Summary of one completed generation; ``holdout_score`` is ``None`` when no holdout ran."""
+
+    generation: int
+    best_fitness: float
+    mean_fitness: float
+    holdout_score: float | None
+
+
+@dataclass
+class EvolutionState:
+    """Mutable state of one evolving population between generations.
+
+    ``next_generation`` reaches ``config.generations`` when the loop has finished
+    or stopped early; the population is then ready for final holdout selection.
+    The population holds ``HEURISTIC_SCHEMA`` rows, elites first; rows carried
+    over from earlier generations keep their decoded strategies, so each
+    generation only decodes its new children.
+    """
+
+    population: Population
+    rng: random.Random
+    best_holdout: float = float("-inf")
+    stagnant_generations: int = 0
+    next_generation: int = 0
+    history: list[tuple[HeuristicStrategy, float]] = field(default_factory=list)
+    surrogate: SurrogateStats = field(default_factory=SurrogateStats)
+    pending_predictions: dict[HeuristicStrategy, float] = field(default_factory=dict)
+    generation_records: list[GenerationRecord] = field(default_factory=list)
+
+
 class EvolutionOptimizer:
-    def __init__(self, config: EvolutionConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: EvolutionConfig | None = None,
+        *,
+        fitness_cache: dict[FitnessKey, float] | None = None,
+        observers: Sequence[Observer] = (),
+        evaluator: EvaluatorBackend | None = None,
+    ) -> None:
         self.config = config or EvolutionConfig()
+        # ``evaluator`` replaces how scores are computed (e.g. on remote workers), not
+        # what they are, so it must produce the same key as the configured backend.
+        configured = get_evaluator(self.config.evaluator, self.config.opponent_pool)
+        if evaluator is not None and evaluator.key != configured.key:
+            raise ValueError(f"evaluator {evaluator.key!r} does not match the configured {configured.key!r}")
+        self.evaluator: EvaluatorBackend = evaluator or configured
+        # Keys include the evaluation seed, round count and evaluator backend, so a cache
+        # can be shared by any runs over the same situations without changing their results.
+        self._fitness_cache: dict[FitnessKey, float] = {} if fitness_cache is None else fitness_cache
+        self.last_state: EvolutionState | None = None
+        self.budget: EvaluationBudget | None = None
+        self.last_comparison: PairedComparison | None = None
+        # Observers receive a GenerationEvent after every generation and a RunFinishedEvent
+        # at the end of ``optimize``; they must not mutate optimizer state.
+        self.observers: list[Observer] = list(observers)
+        self.evaluations = 0
 
-    def optimize(self, situations: list[GameSituation]) -> StrategyPerformance:
-        if not situations:
-            raise ValueError("at least one game situation is required")
+    def optimize(
+        self,
+        situations: list[GameSituation],
+        *,
+        checkpoint_path: str | Path | None = None,
+        resume: bool = False,
+    ) -> StrategyPerformance:
+        """Evolve a strategy for ``situations``.
 
-        rng = random.Random(self.config.seed)
-        if self.config.elite_count <= 0:
-            raise ValueError("elite_count must be positive")
-        if self.config.elite_count > self.config.population_size:
-            raise ValueError("elite_count cannot exceed population_size")
+        With ``checkpoint_path`` set, a checkpoint is written after every generation.
+        ``resume=True`` continues from that checkpoint and yields the same result as
+        an uninterrupted run with the same config. A time or evaluation budget
+        applies to each invocation separately.
+        """
 
+        self._validate(situations)
+        if resume:
+            if checkpoint_path is None:
+                raise ValueError("resume requires a checkpoint_path")
+            state = self._restore_state(read_checkpoint(checkpoint_path), situations)
+        else:
+            state = self.initial_state()
+
+        self.last_state = state
+        self.evaluations = 0
+        started = time.perf_counter()
+        self.budget = None
+        if self.config.time_budget_seconds is not None or self.config.max_evaluations is not None:
+            self.budget = EvaluationBudget(
+                time_budget_seconds=self.config.time_budget_seconds,
+                max_evaluations=self.config.max_evaluations,
+            )
+            self.budget.set_reserve(len(state.population) * len(situations), self.config.holdout_rounds)
+
+        self.advance(state, situations, self.config.generations, checkpoint_path=checkpoint_path)
+
+        candidates = state.population.individuals()
+        if self.budget is not None:
+            # After a completed generation the population is elites-first, so truncation keeps
+            # the best candidates found so far. If the budget ran out in generation 0 nothing
+            # was ranked yet, and truncation keeps an arbitrary prefix of the initial draw.
+            self.budget.set_reserve(0, self.config.holdout_rounds)
+            self.budget.enforcing = False
+            affordable = self.budget.affordable_evaluations(self.config.holdout_rounds) // len(situations)
+            candidates = candidates[: max(1, affordable)]
+            self.budget.final_candidates = len(candidates)
+        ranking_started = time.perf_counter()
+        best = self.final_ranking(candidates, situations)[0]
+        if self.budget is not None:
+            self.budget.finish()
+        self._emit(
+            RunFinishedEvent(
+                generations_completed=len(state.generation_records),
+                evaluations=self.evaluations,
+                final_ranking_seconds=time.perf_counter() - ranking_started,
+                elapsed_seconds=time.perf_counter() - started,
+                best_fitness=best.aggregate_fitness,
+            )
+        )
+        return best
+
+    def initial_state(self, population_seed: int | None = None) -> EvolutionState:
+        """Create a random starting population.
+
+        ``population_seed`` overrides ``config.seed`` for the population RNG only;
+        train/holdout seed banks always derive from ``config.seed``.
+        """
+
+        rng = random.Random(self.config.seed if population_seed is None else population_seed)
+        population = Population.random(HEURISTIC_SCHEMA, self.config.population_size, rng)
+        return EvolutionState(population=population, rng=rng)
+
+    def advance(
+        self,
+        state: EvolutionState,
+        situations: list[GameSituation],
+        until_generation: int,
+        *,
+        checkpoint_path: str | Path | None = None,
+    ) -> None:
+        """Run generations in place until ``until_generation`` or early stop."""
+
+        self._validate(situations)
         train_seeds, holdout_seeds = self._build_seed_splits()
-        population = [self._random_strategy(rng) for _ in range(self.config.population_size)]
-        best_holdout = float("-inf")
-        stagnant_generations = 0
-
-        for generation in range(self.config.generations):
-            scored = [
-                self._score_strategy(
-                    strategy=s,
-                    situations=situations,
-                    generation=generation,
-                    eval_rounds=self.config.rounds_per_eval,
-                    seed_bank=train_seeds,
+        until_generation = min(until_generation, self.config.generations)
+
+        run_started = time.perf_counter()
+        while state.next_generation < until_generation:
+            generation = state.next_generation
+            timer = PhaseTimer()
+            evaluations_before = self.evaluations
+            try:
+                with timer.phase("scoring"):
+                    scored = self._score_population(
+                        strategies=state.population.individuals(),
+                        situations=situations,
+                        generation=generation,
+                        eval_rounds=self.config.rounds_per_eval,
+                        seed_bank=train_seeds,
+                    )
+                holdout_score = None
+                if generation % self.config.holdout_every == 0:
+                    best = max(scored, key=lambda x: x.aggregate_fitness)
+                    with timer.phase("holdout"):
+                        holdout_score = self._score_population(
+                            strategies=[best.strategy],
+                            situations=situations,
+                            generation=generation,
+                            eval_rounds=self.config.holdout_rounds,
+                            seed_bank=holdout_seeds,
+                        )[0].aggregate_fitness
+            except BudgetExhausted:
+                # The interrupted generation is discarded; the population is the last complete one.
+                state.next_generation = self.config.generations
+                break
+            with timer.phase("selection"):
+                for row in scored:
+                    state.history.append((row.strategy, row.aggregate_fitness))
+                    predicted = state.pending_predictions.pop(row.strategy, None)
+                    if predicted is not None:
+                        state.surrogate.record_error(predicted, row.aggregate_fitness)
+                del state.history[:-HISTORY_WINDOW]
+                ranking = sorted(range(len(scored)), key=lambda index: scored[index].aggregate_fitness, reverse=True)
+                scored = [scored[index] for index in ranking]
+                elites = state.population.take(ranking[: self.config.elite_count])
+                state.generation_records.append(
+                    GenerationRecord(
+                        generation=generation,
+                        best_fitness=scored[0].aggregate_fitness,
+                        mean_fitness=sum(row.aggregate_fitness for row in scored) / len(scored),
+                        holdout_score=holdout_score,
+                    )
                 )
-                for s in population
-            ]
-            scored.sort(key=lambda x: x.aggregate_fitness, reverse=True)
-            elites = [row.strategy for row in scored[: self.config.elite_count]]
-
-            if generation % self.config.holdout_every == 0:
-                holdout_score = self._score_strategy(
-                    strategy=elites[0],
-                    situations=situations,
-                    generation=generation,
-                    eval_rounds=self.config.holdout_rounds,
-                    seed_bank=holdout_seeds,
-                ).aggregate_fitness
-                if holdout_score > best_holdout:
-                    best_holdout = holdout_score
-                    stagnant_generations = 0
-                else:
-                    stagnant_generations += 1
-
-                if stagnant_generations >= self.config.early_stop_patience:
-                    break
-
-            next_population = elites.copy()
-            while len(next_population) < self.config.population_size:
-                parent = rng.choice(elites)
-                next_population.append(self._mutate(parent, rng))
-            population = next_population
-
-        final_scores = [
-            self._score_strategy(
-                strategy=s,
-                situations=situations,
-                generation=self.config.generations,
-                eval_rounds=self.config.holdout_rounds,
-                seed_bank=holdout_seeds,
-            )
-            for s in population
-        ]
+
+                stop_early = False
+                if holdout_score is not None:
+                    if holdout_score > state.best_holdout:
+                        state.best_holdout = holdout_score
+                        state.stagnant_generations = 0
+                    else:
+                        state.stagnant_generations += 1
+
+                    stop_early = state.stagnant_generations >= self.config.early_stop_patience
+
+            if stop_early:
+                # No children are bred, but final selection (and budget truncation) expects elites first.
+                state.population = state.population.take(ranking)
+            else:
+                with timer.phase("mutation"):
+                    state.population = elites + self._breed(elites, state)
+
+            state.next_generation = self.config.generations if stop_early else generation + 1
+            if self.budget is not None:
+                self.budget.generations_completed += 1
+            if checkpoint_path is not None:
+                write_checkpoint(checkpoint_path, self._checkpoint(state, situations))
+            if self.observers:
+                evaluations = self.evaluations - evaluations_before
+                evaluation_seconds = timer.seconds["scoring"] + timer.seconds["holdout"]
+                self._emit(
+                    GenerationEvent(
+                        generation=generation,
+                        evaluations=evaluations,
+                        evaluations_per_second=evaluations / evaluation_seconds if evaluation_seconds > 0 else 0.0,
+                        best_fitness=scored[0].aggregate_fitness,
+                        median_fitness=statistics.median(row.aggregate_fitness for row in scored),
+                        holdout_score=holdout_score,
+                        best_holdout=None if state.best_holdout == float("-inf") else state.best_holdout,
+                        stagnant_generations=state.stagnant_generations,
+                        stopped_early=stop_early,
+                        phase_seconds=dict(timer.seconds),
+                        elapsed_seconds=time.perf_counter() - run_started,
+                    )
+                )
+
+    def _breed(self, elites: Population, state: EvolutionState) -> Population:
+        needed = self.config.population_size - len(elites)
+        sigma = self.config.mutation_sigma
+        surrogate = QuadraticSurrogate()
+        if self.config.surrogate_pool_factor <= 1 or needed == 0 or not surrogate.fit(state.history):
+            return elites.mutants(needed, sigma, state.rng)
+
+        pool = elites.mutants(needed * self.config.surrogate_pool_factor, sigma, state.rng)
+        # The pool is screened on its genes; only the chosen children are ever decoded.
+        predictions = surrogate.predict_population(pool)
+        ranked = sorted(
+            range(len(pool)),
+            key=lambda i: predictions[i][0] + self.config.surrogate_exploration * predictions[i][1],
+            reverse=True,
+        )
+        chosen = sorted(ranked[:needed])
+        state.surrogate.screened += len(pool)
+        state.surrogate.evaluated += needed
+        children = pool.take(chosen)
+        for index, child in zip(chosen, children.individuals()):
+            state.pending_predictions[child] = predictions[index][0]
+        return children
+
+    def final_ranking(
+        self,
+        population: list[HeuristicStrategy],
+        situations: list[GameSituation],
+    ) -> list[StrategyPerformance]:
+        """Score ``population`` on the holdout seed bank, best first."""
+
+        _, holdout_seeds = self._build_seed_splits()
+        final_scores = self._score_population(
+            strategies=population,
+            situations=situations,
+            generation=self.config.generations,
+            eval_rounds=self.config.holdout_rounds,
+            seed_bank=holdout_seeds,
+        )
         final_scores.sort(key=lambda x: x.aggregate_fitness, reverse=True)
-        return final_scores[0]
+        return final_scores
+
+    def holdout_deal_tables(self, situations: list[GameSituation]) -> list[DealTableSpec]:
+        """Deal-bank tables for every holdout round the engine evaluator plays on ``situations``."""
+
+        if self.evaluator.name != "engine":
+            raise ValueError("only the engine evaluator deals rounds")
+        _, holdout_seeds = self._build_seed_splits()
+        return engine_deal_tables(situations, holdout_seeds, self.config.holdout_rounds, self.evaluator.opponent_pool)
 
     def select_best_for_situation(
         self,
@@ -106,6 +355,22 @@ class EvolutionOptimizer:
         if not candidates:
             raise ValueError("at least one candidate strategy is required")
 
+        if self.config.common_random_numbers:
+            comparison = compare_paired(
+                candidates,
+                situation,
+                rounds,
+                seed=self.config.seed,
+                sampler=self.evaluator.score_batch,
+            )
+            self.last_comparison = comparison
+            result = comparison.results[comparison.best_index]
+            return StrategyPerformance(
+                strategy=candidates[comparison.best_index],
+                scenario_scores={situation.name: result.fitness},
+                aggregate_fitness=result.fitness,
+            )
+
         scored = [
             self._single_situation_score(strategy, situation, rounds, eval_seed=idx)
             for idx, strategy in enumerate(candidates)
@@ -113,32 +378,120 @@ class EvolutionOptimizer:
         scored.sort(key=lambda x: x.aggregate_fitness, reverse=True)
         return scored[0]
 
-    def _score_strategy(
+    def _score_population(
         self,
-        strategy: HeuristicStrategy,
+        strategies: list[HeuristicStrategy],
         situations: list[GameSituation],
         generation: int,
         eval_rounds: int,
         seed_bank: tuple[int, ...],
-    ) -> StrategyPerformance:
-        scenario_scores: dict[str, float] = {}
-        total = 0.0
+    ) -> list[StrategyPerformance]:
+        """Score ``strategies`` on every situation, batching cache misses per situation."""
 
+        evaluator_key = self.evaluator.key
         for idx, situation in enumerate(situations):
+            # The seed depends only on generation and situation, so every strategy scored
+            # in the same selection step sees common random numbers.
             eval_seed = seed_bank[(generation + idx) % len(seed_bank)]
-            result = evaluate_strategy(
-                strategy,
-                situation,
-                rounds=eval_rounds,
-                seed=eval_seed,
+            missing = list(
+                dict.fromkeys(
+                    strategy
+                    for strategy in strategies
+                    if (strategy, situation.name, eval_rounds, eval_seed, evaluator_key) not in self._fitness_cache
+                )
             )
-            scenario_scores[situation.name] = result.fitness
-            total += result.fitness
+            if not missing:
+                continue
+            if self.budget is not None:
+                self.budget.check(eval_rounds, count=len(missing))
+                started = self.budget.clock()
+            results = self.evaluator.evaluate_batch(missing, situation, eval_rounds, eval_seed)
+            self.evaluations += len(missing)
+            if self.budget is not None:
+                self.budget.record(eval_rounds, self.budget.clock() - started, count=len(missing))
+            for strategy, result in zip(missing, results):
+                self._fitness_cache[(strategy, situation.name, eval_rounds, eval_seed, evaluator_key)] = result.fitness
 
-        return StrategyPerformance(
-            strategy=strategy,
-            scenario_scores=scenario_scores,
-            aggregate_fitness=total / len(situations),
+        performances: list[StrategyPerformance] = []
+        for strategy in strategies:
+            scenario_scores: dict[str, float] = {}
+            for idx, situation in enumerate(situations):
+                eval_seed = seed_bank[(generation + idx) % len(seed_bank)]
+                key = (strategy, situation.name, eval_rounds, eval_seed, evaluator_key)
+                scenario_scores[situation.name] = self._fitness_cache[key]
+            performances.append(
+                StrategyPerformance(
+                    strategy=strategy,
+                    scenario_scores=scenario_scores,
+                    aggregate_fitness=sum(scenario_scores.values()) / len(situations),
+                )
+            )
+        return performances
+
+    def relevant_fitness(
+        self, cache: dict[FitnessKey, float], situations: list[GameSituation]
+    ) -> dict[FitnessKey, float]:
+        """The entries of ``cache`` that ``optimize`` on ``situations`` could look up.
+
+        Those are the keys for this evaluator with the training rounds on a training
+        seed or the holdout rounds on a holdout seed.
+        """
+
+        train_seeds, holdout_seeds = self._build_seed_splits()
+        lookups = {(self.config.rounds_per_eval, seed) for seed in train_seeds}
+        lookups.update((self.config.holdout_rounds, seed) for seed in holdout_seeds)
+        names = {situation.name for situation in situations}
+        evaluator_key = self.evaluator.key
+        return {
+            key: fitness
+            for key, fitness in cache.items()
+            if key[4] == evaluator_key and key[1] in names and (key[2], key[3]) in lookups
+        }
+
+    def _emit(self, event: GenerationEvent | RunFinishedEvent) -> None:
+        for observer in self.observers:
+            observer(event)
+
+    def _validate(self, situations: list[GameSituation]) -> None:
+        self.config.validate()
+        if not situations:
+            raise ValueError("at least one game situation is required")
+
+    def _checkpoint(self, state: EvolutionState, situations: list[GameSituation]) -> EvolutionCheckpoint:
+        return EvolutionCheckpoint(
+            config=asdict(self.config),
+            situations=tuple(situations),
+            next_generation=state.next_generation,
+            population=state.population,
+            rng_state=state.rng.getstate(),
+            best_holdout=state.best_holdout,
+            stagnant_generations=state.stagnant_generations,
+            fitness_cache=self._fitness_cache,
+            history=tuple(state.history),
+            generation_records=tuple(asdict(record) for record in state.generation_records),
+            surrogate=asdict(state.surrogate),
+            pending_predictions=dict(state.pending_predictions),
+        )
+
+    def _restore_state(self, checkpoint: EvolutionCheckpoint, situations: list[GameSituation]) -> EvolutionState:
+        if checkpoint.config != asdict(self.config):
+            raise ValueError("checkpoint was written with a different EvolutionConfig")
+        if checkpoint.situations != tuple(situations):
+            raise ValueError("checkpoint was written for different game situations")
+
+        rng = random.Random()
+        rng.setstate(checkpoint.rng_state)
+        self._fitness_cache.update(checkpoint.fitness_cache)
+        return EvolutionState(
+            population=checkpoint.population,
+            rng=rng,
+            best_holdout=checkpoint.best_holdout,
+            stagnant_generations=checkpoint.stagnant_generations,
+            next_generation=checkpoint.next_generation,
+            history=list(checkpoint.history),
+            generation_records=[GenerationRecord(**record) for record in checkpoint.generation_records],
+            surrogate=SurrogateStats(**checkpoint.surrogate),
+            pending_predictions=dict(checkpoint.pending_predictions),
         )
 
     def _build_seed_splits(self) -> tuple[tuple[int, ...], tuple[int, ...]]:
@@ -154,7 +507,7 @@ class EvolutionOptimizer:
         rounds: int,
         eval_seed: int,
     ) -> StrategyPerformance:
-        result = evaluate_strategy(
+        result = self.evaluator.evaluate(
             strategy,
             situation,
             rounds=rounds,
@@ -165,22 +518,3 @@ class EvolutionOptimizer:
             scenario_scores={situation.name: result.fitness},
             aggregate_fitness=result.fitness,
         )
-
-    @staticmethod
-    def _random_strategy(rng: random.Random) -> HeuristicStrategy:
-        return HeuristicStrategy(
-            risk_tolerance=rng.random(),
-            reveal_priority=rng.random(),
-            column_focus=rng.random(),
-            discard_aggression=rng.random(),
-        )
-
-    def _mutate(self, parent: HeuristicStrategy, rng: random.Random) -> HeuristicStrategy:
-        child = HeuristicStrategy(
-            risk_tolerance=parent.risk_tolerance + rng.gauss(0, self.config.mutation_sigma),
-            reveal_priority=parent.reveal_priority + rng.gauss(0, self.config.mutation_sigma),
-            column_focus=parent.column_focus + rng.gauss(0, self.config.mutation_sigma),
-            discard_aggression=parent.discard_aggression
-            + rng.gauss(0, self.config.mutation_sigma),
-        )
-        return child.clipped()
@@ -2,17 +2,31 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import subprocess
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import UTC, datetime
+from functools import lru_cache
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from skyjo_optimizer.simulation import RandomAgent, SimpleHeuristicAgent, run_tournament
 from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml.artifact_cache import ArtifactCache
+from skyjo_optimizer.ml.checkpoint import FitnessKey
 from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer, StrategyPerformance
-from skyjo_optimizer.simulation.evaluator import EvaluationResult, evaluate_strategy
+from skyjo_optimizer.ml.islands import IslandConfig, IslandOptimizer
+from skyjo_optimizer.ml.surrogate import SurrogateStats
+from skyjo_optimizer.ml.telemetry import Observer
+from skyjo_optimizer.simulation.backends import EvaluatorBackend, get_evaluator
+from skyjo_optimizer.simulation.bootstrap import bootstrap_intervals, default_replicates
+from skyjo_optimizer.simulation.evaluator import EvaluationResult, compare_paired
 from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS, GameSituation
 
+# Set by job schedulers that launch many runs from one checkout to skip ``git rev-parse``.
+COMMIT_HASH_ENV = "SKYJO_GIT_COMMIT"
+
 
 @dataclass(frozen=True)
 class ExperimentMetadata:
@@ -32,6 +46,15 @@ class ExperimentReport:
     benchmark: StrategyPerformance
     tournament_benchmark: dict[str, object]
     holdout_score: float | None
+    surrogate: dict[str, object] | None = None
+    budget: dict[str, object] | None = None
+    # Content-addressed artifact key and whether it was reused, per cached sub-result.
+    cached_artifacts: dict[str, dict[str, object]] | None = None
+    # One ``GenerationRecord`` per completed generation, tagged with its island index.
+    generations: tuple[dict[str, object], ...] = ()
+    # With common random numbers: a ``PairedComparison`` of the optimized strategy
+    # against the benchmark (the reference) per situation.
+    paired_comparison: dict[str, dict[str, object]] | None = None
 
     def to_dict(self) -> dict[str, object]:
         data = asdict(self)
@@ -44,9 +67,12 @@ class ExperimentReport:
         destination.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True) + "\n")
         return destination
 
-    def write_artifacts(self, root: str | Path = "artifacts") -> Path:
-        run_id = f"{self.metadata.run_timestamp_utc.replace(':', '').replace('-', '')}_{self.metadata.git_commit_hash[:7]}"
-        run_dir = Path(root) / run_id
+    def write_artifacts(self, root: str | Path = "artifacts", *, run_dir: str | Path | None = None) -> Path:
+        """Write report artifacts into ``run_dir`` or a new timestamped folder under ``root``."""
+
+        if run_dir is None:
+            run_dir = Path(root) / _run_id(self.metadata.run_timestamp_utc, self.metadata.git_commit_hash)
+        run_dir = Path(run_dir)
         self.write_json(run_dir / "report.json")
         _write_tournament_csv(self.tournament_benchmark, run_dir / "tournament_summary.csv")
         return run_dir
@@ -59,27 +85,121 @@ def run_experiment(
     holdout_situation: GameSituation | None = None,
     benchmark_strategy: HeuristicStrategy | None = None,
     tournament_rounds: int = 24,
+    bootstrap_replicates: int | None = None,
     resolved_config: dict[str, object] | None = None,
+    checkpoint_path: str | Path | None = None,
+    resume: bool = False,
+    islands: IslandConfig | None = None,
+    fitness_cache: dict[FitnessKey, float] | None = None,
+    artifact_cache: ArtifactCache | None = None,
+    concurrent_tournament: bool = False,
+    observers: Sequence[Observer] = (),
+    evaluator: EvaluatorBackend | None = None,
 ) -> ExperimentReport:
+    """Optimize, benchmark and package one experiment.
+
+    The benchmark-strategy scores and the baseline tournament do not depend on
+    the optimized strategy. With ``artifact_cache`` they are reused across runs
+    and their keys are listed in ``cached_artifacts``. With
+    ``concurrent_tournament`` a tournament that is not cached runs in a separate
+    process while the optimizer works. ``observers`` receive telemetry events;
+    island runs do not emit them. ``evaluator`` (e.g. a ``DistributedEvaluator``)
+    scores the optimizer's populations; island runs use their own processes.
+    ``bootstrap_replicates`` sets the tournament's confidence intervals (0 skips
+    them; ``None`` uses ``default_replicates()``).
+    """
+
     scenarios = situations or DEFAULT_SITUATIONS
-    optimizer = EvolutionOptimizer(config)
-    optimized = optimizer.optimize(scenarios)
-
-    benchmark = benchmark_strategy or HeuristicStrategy(0.5, 0.5, 0.5, 0.5)
-    benchmark_perf = _score_static_strategy(
-        benchmark,
-        scenarios,
-        rounds=optimizer.config.rounds_per_eval,
-        seed=optimizer.config.seed,
-    )
-    tournament_benchmark = _run_baseline_tournament_benchmark(
-        seed=optimizer.config.seed,
-        rounds=tournament_rounds,
-    )
+    optimizer = EvolutionOptimizer(config, fitness_cache=fitness_cache, observers=observers, evaluator=evaluator)
+    if islands is not None and (checkpoint_path is not None or resume):
+        raise ValueError("checkpointing is not supported in island mode")
+    if islands is not None and evaluator is not None:
+        raise ValueError("a custom evaluator is not supported in island mode")
+
+    replicates = default_replicates() if bootstrap_replicates is None else bootstrap_replicates
+    cached_artifacts: dict[str, dict[str, object]] = {}
+    tournament_benchmark: dict[str, object] | None = None
+    if artifact_cache is not None:
+        inputs = _tournament_inputs(optimizer.config.seed, tournament_rounds, replicates)
+        tournament_benchmark = artifact_cache.get("baseline_tournament", inputs)
+        cached_artifacts["tournament_benchmark"] = {
+            "key": artifact_cache.key("baseline_tournament", inputs),
+            "reused": tournament_benchmark is not None,
+        }
+
+    executor = ProcessPoolExecutor(max_workers=1) if concurrent_tournament and tournament_benchmark is None else None
+    try:
+        pending_tournament: Future | None = None
+        if executor is not None:
+            pending_tournament = executor.submit(
+                run_baseline_tournament_benchmark,
+                seed=optimizer.config.seed,
+                rounds=tournament_rounds,
+                bootstrap_replicates=replicates,
+            )
+
+        if islands is not None:
+            island_optimizer = IslandOptimizer(optimizer.config, islands)
+            optimized = island_optimizer.optimize(scenarios)
+            final_states = island_optimizer.last_states
+        else:
+            optimized = optimizer.optimize(scenarios, checkpoint_path=checkpoint_path, resume=resume)
+            final_states = [optimizer.last_state] if optimizer.last_state is not None else []
+
+        if pending_tournament is not None:
+            tournament_benchmark = pending_tournament.result()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if tournament_benchmark is None:
+        tournament_benchmark = run_baseline_tournament_benchmark(
+            seed=optimizer.config.seed, rounds=tournament_rounds, bootstrap_replicates=replicates
+        )
+    if artifact_cache is not None and not cached_artifacts["tournament_benchmark"]["reused"]:
+        artifact_cache.put(
+            "baseline_tournament",
+            _tournament_inputs(optimizer.config.seed, tournament_rounds, replicates),
+            tournament_benchmark,
+        )
+
+    surrogate = None
+    if optimizer.config.surrogate_pool_factor > 1:
+        surrogate = SurrogateStats.merged([state.surrogate for state in final_states]).to_dict()
+
+    if artifact_cache is not None:
+        benchmark_perf, cached_artifacts["benchmark"] = cached_benchmark_strategy(
+            scenarios,
+            config=optimizer.config,
+            benchmark_strategy=benchmark_strategy,
+            cache=artifact_cache,
+        )
+    else:
+        benchmark_perf = score_benchmark_strategy(
+            scenarios,
+            config=optimizer.config,
+            benchmark_strategy=benchmark_strategy,
+        )
+
+    paired_comparison = None
+    if optimizer.config.common_random_numbers:
+        # Same seeds as the benchmark scores above, so both strategies play identical rounds.
+        paired_comparison = {
+            scenario.name: asdict(
+                compare_paired(
+                    [benchmark_perf.strategy, optimized.strategy],
+                    scenario,
+                    optimizer.config.rounds_per_eval,
+                    optimizer.config.seed + index * 37,
+                    sampler=optimizer.evaluator.score_batch,
+                )
+            )
+            for index, scenario in enumerate(scenarios)
+        }
 
     holdout_score = None
     if holdout_situation is not None:
-        result = evaluate_strategy(
+        result = optimizer.evaluator.evaluate(
             optimized.strategy,
             holdout_situation,
             rounds=optimizer.config.rounds_per_eval,
@@ -103,10 +223,129 @@ def run_experiment(
         benchmark=benchmark_perf,
         tournament_benchmark=tournament_benchmark,
         holdout_score=holdout_score,
+        surrogate=surrogate,
+        budget=optimizer.budget.to_dict() if optimizer.budget is not None else None,
+        cached_artifacts=cached_artifacts or None,
+        generations=tuple(
+            {"island": index, **asdict(record)}
+            for index, state in enumerate(final_states)
+            for record in state.generation_records
+        ),
+        paired_comparison=paired_comparison,
+    )
+
+
+def new_run_dir(root: str | Path = "artifacts") -> Path:
+    """Return a fresh timestamped run folder path under ``root`` (not created)."""
+
+    timestamp = datetime.now(UTC).isoformat(timespec="seconds")
+    run_dir = Path(root) / _run_id(timestamp, _current_commit_hash())
+    # Runs started within the same second get a numeric suffix instead of sharing a folder.
+    suffix = 1
+    candidate = run_dir
+    while candidate.exists():
+        candidate = run_dir.with_name(f"{run_dir.name}-{suffix}")
+        suffix += 1
+    return candidate
+
+
+def _run_id(timestamp_utc: str, commit_hash: str) -> str:
+    return f"{timestamp_utc.replace(':', '').replace('-', '')}_{commit_hash[:7]}"
+
+
+def score_benchmark_strategy(
+    situations: list[GameSituation],
+    *,
+    config: EvolutionConfig,
+    benchmark_strategy: HeuristicStrategy | None = None,
+) -> StrategyPerformance:
+    """Score the frozen benchmark strategy the way ``run_experiment`` does."""
+
+    return _score_static_strategy(
+        benchmark_strategy or HeuristicStrategy(0.5, 0.5, 0.5, 0.5),
+        situations,
+        rounds=config.rounds_per_eval,
+        seed=config.seed,
+        evaluator=get_evaluator(config.evaluator, config.opponent_pool),
     )
 
 
-def _run_baseline_tournament_benchmark(*, seed: int, rounds: int) -> dict[str, object]:
+def benchmark_round_scores(report: ExperimentReport, situations: list[GameSituation]) -> dict[str, list[float]]:
+    """Per-round scores of the optimized and benchmark strategies on the benchmark seeds.
+
+    Both strategies share each round's seed, so the columns can be compared
+    round by round. ``situation`` holds the index into ``situations``.
+    """
+
+    config = report.metadata.optimizer_config
+    evaluator = get_evaluator(config.evaluator, config.opponent_pool)
+    columns: dict[str, list[float]] = {"situation": [], "round": [], "optimized_score": [], "benchmark_score": []}
+    for index, situation in enumerate(situations):
+        optimized, benchmark = evaluator.score_batch(
+            [report.optimized.strategy, report.benchmark.strategy],
+            situation,
+            config.rounds_per_eval,
+            config.seed + index * 37,
+        )
+        columns["situation"].extend([index] * len(optimized))
+        columns["round"].extend(range(len(optimized)))
+        columns["optimized_score"].extend(optimized)
+        columns["benchmark_score"].extend(benchmark)
+    return columns
+
+
+def cached_benchmark_strategy(
+    situations: list[GameSituation],
+    *,
+    config: EvolutionConfig,
+    cache: ArtifactCache,
+    benchmark_strategy: HeuristicStrategy | None = None,
+) -> tuple[StrategyPerformance, dict[str, object]]:
+    """``score_benchmark_strategy`` through ``cache``; also returns the artifact key and reuse flag."""
+
+    strategy = benchmark_strategy or HeuristicStrategy(0.5, 0.5, 0.5, 0.5)
+    inputs = {
+        "strategy": asdict(strategy),
+        "situations": [asdict(situation) for situation in situations],
+        "rounds": config.rounds_per_eval,
+        "seed": config.seed,
+        "evaluator": get_evaluator(config.evaluator, config.opponent_pool).key,
+    }
+    entry: dict[str, object] = {"key": cache.key("benchmark_strategy", inputs), "reused": False}
+    stored = cache.get("benchmark_strategy", inputs)
+    if stored is not None:
+        entry["reused"] = True
+        return StrategyPerformance(strategy=strategy, **stored), entry
+
+    performance = score_benchmark_strategy(situations, config=config, benchmark_strategy=strategy)
+    cache.put(
+        "benchmark_strategy",
+        inputs,
+        {"scenario_scores": performance.scenario_scores, "aggregate_fitness": performance.aggregate_fitness},
+    )
+    return performance, entry
+
+
+def cached_baseline_tournament(
+    *, seed: int, rounds: int, cache: ArtifactCache, bootstrap_replicates: int | None = None
+) -> dict[str, object]:
+    """``run_baseline_tournament_benchmark`` through ``cache``."""
+
+    replicates = default_replicates() if bootstrap_replicates is None else bootstrap_replicates
+    inputs = _tournament_inputs(seed, rounds, replicates)
+    stored = cache.get("baseline_tournament", inputs)
+    if stored is None:
+        stored = run_baseline_tournament_benchmark(seed=seed, rounds=rounds, bootstrap_replicates=replicates)
+        cache.put("baseline_tournament", inputs, stored)
+    return stored
+
+
+def run_baseline_tournament_benchmark(
+    *, seed: int, rounds: int, bootstrap_replicates: int | None = None
+) -> dict[str, object]:
+    """The baseline tournament's metrics; ``bootstrap_replicates=0`` skips the intervals."""
+
+    replicates = default_replicates() if bootstrap_replicates is None else bootstrap_replicates
     result = run_tournament(
         [
             SimpleHeuristicAgent("heuristic"),
@@ -117,7 +356,7 @@ def _run_baseline_tournament_benchmark(*, seed: int, rounds: int) -> dict[str, o
         seed=seed + 20_000,
     )
 
-    return {
+    benchmark: dict[str, object] = {
         "rounds": rounds,
         "seed": seed + 20_000,
         "mean_score_by_agent": result.mean_score_by_agent,
@@ -126,6 +365,15 @@ def _run_baseline_tournament_benchmark(*, seed: int, rounds: int) -> dict[str, o
         "win_rate_by_agent": result.win_rate_by_agent,
         "win_rate_matrix": result.win_rate_matrix,
     }
+    if replicates:
+        benchmark["confidence_intervals"] = bootstrap_intervals(
+            result, replicates=replicates, seed=seed + 20_000
+        ).to_dict()
+    return benchmark
+
+
+def _tournament_inputs(seed: int, rounds: int, replicates: int) -> dict[str, object]:
+    return {"seed": seed, "rounds": rounds, "bootstrap_replicates": replicates}
 
 
 def _score_static_strategy(
@@ -133,12 +381,13 @@ def _score_static_strategy(
     situations: list[GameSituation],
     rounds: int,
     seed: int,
+    evaluator: EvaluatorBackend,
 ) -> StrategyPerformance:
     scores: dict[str, float] = {}
     total = 0.0
 
     for index, scenario in enumerate(situations):
-        result: EvaluationResult = evaluate_strategy(
+        result: EvaluationResult = evaluator.evaluate(
             strategy,
             scenario,
             rounds=rounds,
@@ -160,9 +409,15 @@ def _ruleset_hash(situations: list[GameSituation]) -> str:
     return hashlib.sha256(encoded).hexdigest()
 
 
+@lru_cache(maxsize=1)
 def _current_commit_hash() -> str:
+    """``COMMIT_HASH_ENV`` if set, else ``git rev-parse HEAD``; resolved once per process."""
+
+    override = os.environ.get(COMMIT_HASH_ENV)
+    if override:
+        return override
     try:
-        output = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+        output = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
         return output
     except Exception:
         return "unknown"
@@ -175,14 +430,19 @@ def _seed_bank_id(seed: int) -> str:
 
 def _write_tournament_csv(tournament: dict[str, object], destination: Path) -> None:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    means: dict[str, float] = tournament["mean_score_by_agent"]  # type: ignore[assignment]
-    medians: dict[str, float] = tournament["median_score_by_agent"]  # type: ignore[assignment]
-    tails: dict[str, float] = tournament["tail95_score_by_agent"]  # type: ignore[assignment]
-    wins: dict[str, float] = tournament["win_rate_by_agent"]  # type: ignore[assignment]
-
-    rows = ["agent,mean_score,median_score,tail95_score,win_rate"]
-    for agent_name in sorted(means):
-        rows.append(
-            f"{agent_name},{means[agent_name]:.6f},{medians[agent_name]:.6f},{tails[agent_name]:.6f},{wins[agent_name]:.6f}"
-        )
+    metrics = ("mean_score", "median_score", "tail95_score", "win_rate")
+    columns: dict[str, dict[str, float]] = {
+        metric: tournament[f"{metric}_by_agent"] for metric in metrics  # type: ignore[misc]
+    }
+    intervals: dict[str, dict[str, list[float]]] | None = tournament.get("confidence_intervals")  # type: ignore[assignment]
+
+    header = ["agent", *metrics]
+    if intervals is not None:
+        header += [f"{metric}_{bound}" for metric in metrics for bound in ("low", "high")]
+    rows = [",".join(header)]
+    for agent_name in sorted(columns["mean_score"]):
+        values = [columns[metric][agent_name] for metric in metrics]
+        if intervals is not None:
+            values += [bound for metric in metrics for bound in intervals[f"{metric}_by_agent"][agent_name]]
+        rows.append(",".join([agent_name, *(f"{value:.6f}" for value in values)]))
     destination.write_text("\n".join(rows) + "\n")
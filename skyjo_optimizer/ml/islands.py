@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from skyjo_optimizer.ml.checkpoint import FitnessKey
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer, EvolutionState, StrategyPerformance
+from skyjo_optimizer.ml.population import Population
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+
+@dataclass(frozen=True)
+class IslandConfig:
+    """Island-model settings layered on top of an ``EvolutionConfig``.
+
+    Every island evolves a full ``population_size`` population. After each
+    ``migration_interval`` generations, island ``i`` sends its top
+    ``migrant_count`` elites to island ``(i + 1) % island_count`` (a fixed ring),
+    where they replace the newest mutants.
+    """
+
+    island_count: int = 4
+    migration_interval: int = 5
+    migrant_count: int = 2
+    workers: int | None = None
+
+    def validate(self, evolution: EvolutionConfig) -> None:
+        if self.island_count <= 0:
+            raise ValueError("island_count must be positive")
+        if self.migration_interval <= 0:
+            raise ValueError("migration_interval must be positive")
+        if self.migrant_count < 0:
+            raise ValueError("migrant_count must be non-negative")
+        if self.migrant_count > evolution.elite_count:
+            raise ValueError("migrant_count cannot exceed elite_count")
+        if self.migrant_count > evolution.population_size - evolution.elite_count:
+            raise ValueError("migrant_count cannot exceed the number of mutants per generation")
+        if self.workers is not None and self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if evolution.time_budget_seconds is not None or evolution.max_evaluations is not None:
+            raise ValueError("time and evaluation budgets are not supported in island mode")
+
+
+class IslandOptimizer:
+    """Run ``island_count`` independent populations with periodic ring migration.
+
+    Islands share the train/holdout seed banks of ``config.seed`` but draw their
+    populations and mutations from separate seed substreams, so the result only
+    depends on ``config`` and ``islands`` and not on the number of worker processes.
+    """
+
+    def __init__(self, config: EvolutionConfig | None = None, islands: IslandConfig | None = None) -> None:
+        self.config = config or EvolutionConfig()
+        self.islands = islands or IslandConfig()
+        self.islands.validate(self.config)
+        self.last_states: list[EvolutionState] = []
+
+    def optimize(self, situations: list[GameSituation]) -> StrategyPerformance:
+        if not situations:
+            raise ValueError("at least one game situation is required")
+
+        optimizer = EvolutionOptimizer(self.config)
+        states = [
+            optimizer.initial_state(population_seed=island_seed(self.config.seed, index))
+            for index in range(self.islands.island_count)
+        ]
+
+        workers = self.islands.workers or self.islands.island_count
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Fitness depends only on its cache key, so one cache serves every island. In a
+        # pool each worker keeps its own (``_WORKER_FITNESS_CACHE``) for this run.
+        fitness_cache: dict[FitnessKey, float] | None = {} if executor is None else None
+        try:
+            generation = 0
+            while generation < self.config.generations:
+                generation = min(generation + self.islands.migration_interval, self.config.generations)
+                jobs = [(self.config, situations, state, generation, fitness_cache) for state in states]
+                states = self._map(executor, _advance_island, jobs)
+                if generation < self.config.generations:
+                    migrate(states, self.islands.migrant_count, generation)
+
+            jobs = [(self.config, situations, state.population) for state in states]
+            rankings = self._map(executor, _rank_island, jobs)
+            self.last_states = states
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Stable sort keeps the island order as the tie-breaker.
+        candidates = [row for ranking in rankings for row in ranking]
+        candidates.sort(key=lambda row: row.aggregate_fitness, reverse=True)
+        return candidates[0]
+
+    @staticmethod
+    def _map(executor: ProcessPoolExecutor | None, fn, jobs: list[tuple]) -> list:
+        if executor is None:
+            return [fn(*job) for job in jobs]
+        return list(executor.map(fn, *zip(*jobs)))
+
+
+def island_seed(seed: int, index: int) -> int:
+    """Deterministic population seed for island ``index`` of a run seeded with ``seed``."""
+
+    digest = hashlib.sha256(f"island::{seed}::{index}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def migrate(states: list[EvolutionState], migrant_count: int, generation: int) -> None:
+    """Ring migration: each island's top elites replace the next island's newest mutants.
+
+    Populations are ordered elites-first after ``EvolutionOptimizer.advance``, so
+    the migrants are the leading entries and the replaced ones the trailing entries.
+    Islands that already stopped early (their ``next_generation`` ran past
+    ``generation``) neither send nor receive migrants.
+    """
+
+    if migrant_count == 0 or len(states) < 2:
+        return
+
+    migrants = [state.population.take(range(migrant_count)) for state in states]
+    finished = [state.next_generation != generation for state in states]
+    for index, state in enumerate(states):
+        source = (index - 1) % len(states)
+        if finished[index] or finished[source]:
+            continue
+        kept = state.population.take(range(len(state.population) - migrant_count))
+        state.population = kept + migrants[source]
+
+
+# Worker processes belong to one ``IslandOptimizer.optimize`` call, so this cache
+# lives exactly as long as the run and survives across migration intervals.
+_WORKER_FITNESS_CACHE: dict[FitnessKey, float] = {}
+
+
+def _advance_island(
+    config: EvolutionConfig,
+    situations: list[GameSituation],
+    state: EvolutionState,
+    until_generation: int,
+    fitness_cache: dict[FitnessKey, float] | None = None,
+) -> EvolutionState:
+    cache = _WORKER_FITNESS_CACHE if fitness_cache is None else fitness_cache
+    EvolutionOptimizer(config, fitness_cache=cache).advance(state, situations, until_generation)
+    return state
+
+
+def _rank_island(
+    config: EvolutionConfig,
+    situations: list[GameSituation],
+    population: Population,
+) -> list[StrategyPerformance]:
+    return EvolutionOptimizer(config).final_ranking(population.individuals(), situations)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import RulesConfig
+from skyjo_optimizer.ml.checkpoint import read_gzip_json, write_gzip_json
+from skyjo_optimizer.simulation.baseline import BaselineAgent, run_round
+from skyjo_optimizer.simulation.engine_evaluator import OPPONENT_FACTORIES, StrategyAgent
+
+LEAGUE_FILENAME = "league.json.gz"
+LEAGUE_VERSION = 1
+
+# TrueSkill's conventional scale: new entries start at 25 +- 25/3 and one rating
+# point of skill difference (beta) is worth about a 76% win chance.
+DEFAULT_MU = 25.0
+DEFAULT_SIGMA = DEFAULT_MU / 3
+BETA = DEFAULT_SIGMA / 2
+# Floor on the factor a single match may shrink a variance by.
+KAPPA = 1e-4
+
+MatchCallback = Callable[["MatchResult"], None]
+
+
+@dataclass(frozen=True)
+class Rating:
+    """Gaussian skill belief; leaderboards rank by the conservative ``mu - 3 * sigma``."""
+
+    mu: float = DEFAULT_MU
+    sigma: float = DEFAULT_SIGMA
+
+    @property
+    def conservative(self) -> float:
+        return self.mu - 3 * self.sigma
+
+
+def rate_match(first: Rating, second: Rating, outcome: float) -> tuple[Rating, Rating]:
+    """Update both ratings after a match; ``outcome`` is 1 if ``first`` won, 0.5 for a tie, 0 if it lost.
+
+    This is the Bradley-Terry update of Weng and Lin (2011), a closed-form
+    approximation of TrueSkill that handles ties without a draw margin.
+    """
+
+    c = math.sqrt(first.sigma**2 + second.sigma**2 + 2 * BETA**2)
+    p_first = 1 / (1 + math.exp((second.mu - first.mu) / c))
+    updated = []
+    for rating, score, p_win in ((first, outcome, p_first), (second, 1 - outcome, 1 - p_first)):
+        variance = rating.sigma**2
+        gamma = rating.sigma / c
+        mu = rating.mu + variance / c * (score - p_win)
+        shrink = max(1 - gamma * variance / c**2 * p_win * (1 - p_win), KAPPA)
+        updated.append(Rating(mu, math.sqrt(variance * shrink)))
+    return updated[0], updated[1]
+
+
+def match_quality(first: Rating, second: Rating) -> float:
+    """TrueSkill's draw probability for the pairing: close to 1 for even, certain matches."""
+
+    spread = 2 * BETA**2 + first.sigma**2 + second.sigma**2
+    return math.sqrt(2 * BETA**2 / spread) * math.exp(-((first.mu - second.mu) ** 2) / (2 * spread))
+
+
+@dataclass(frozen=True)
+class LeagueEntry:
+    """A league member: a baseline agent kind or an evolved ``HeuristicStrategy``."""
+
+    name: str
+    kind: str
+    strategy: HeuristicStrategy | None = None
+
+    def __post_init__(self) -> None:
+        if self.kind == "strategy":
+            if self.strategy is None:
+                raise ValueError(f"entry {self.name!r} needs a strategy")
+        elif self.kind not in OPPONENT_FACTORIES or self.strategy is not None:
+            raise ValueError(f"entry kind must be 'strategy' or one of {sorted(OPPONENT_FACTORIES)}, got {self.kind!r}")
+
+    def agent(self) -> BaselineAgent:
+        if self.strategy is not None:
+            return StrategyAgent(self.name, self.strategy)
+        return OPPONENT_FACTORIES[self.kind](self.name)
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """One scheduled pairing: the same deal played twice with seats swapped.
+
+    ``scores`` are each side's totals over both rounds; the lower total wins.
+    """
+
+    match_index: int
+    seed: int
+    first: str
+    second: str
+    scores: tuple[int, int]
+    outcome: float
+
+
+@dataclass
+class League:
+    """Incrementally rated league with uncertainty-driven matchmaking.
+
+    Each match seats the entry whose rating is least certain against a close,
+    still-uncertain opponent (see ``schedule``), so matches go where they teach
+    the most instead of covering every pair. Ratings update after every match, and
+    match ``k`` always uses deal seed ``seed + 13 * k``, so a league continued
+    from a saved state plays exactly what an uninterrupted one would.
+    """
+
+    seed: int = 0
+    rules: RulesConfig = field(default_factory=RulesConfig)
+    entries: dict[str, LeagueEntry] = field(default_factory=dict)
+    ratings: dict[str, Rating] = field(default_factory=dict)
+    match_counts: dict[str, int] = field(default_factory=dict)
+    matches_played: int = 0
+    rounds_played: int = 0
+
+    def add(self, entry: LeagueEntry, rating: Rating | None = None) -> None:
+        if entry.name in self.entries:
+            raise ValueError(f"league already has an entry named {entry.name!r}")
+        self.entries[entry.name] = entry
+        self.ratings[entry.name] = rating or Rating()
+        self.match_counts[entry.name] = 0
+
+    def schedule(self) -> tuple[str, str]:
+        """The next pairing: the least certain entry against the opponent it learns most from.
+
+        Opponents are scored by ``match_quality`` times the pair's total variance.
+        Quality alone would keep pairing everyone with the best-known entries;
+        the variance term prefers opponents whose rating is still uncertain.
+        """
+
+        if len(self.entries) < 2:
+            raise ValueError("a league needs at least two entries")
+        ratings, counts = self.ratings, self.match_counts
+        focus = min(ratings, key=lambda name: (-ratings[name].sigma, counts[name], name))
+
+        def information(name: str) -> float:
+            first, second = ratings[focus], ratings[name]
+            return match_quality(first, second) * (first.sigma**2 + second.sigma**2 + 2 * BETA**2)
+
+        opponent = min(
+            (name for name in ratings if name != focus),
+            key=lambda name: (-information(name), counts[name], name),
+        )
+        return focus, opponent
+
+    def play_match(self, first: str, second: str) -> MatchResult:
+        """Play and rate one match between two entries."""
+
+        seed = self.seed + self.matches_played * 13
+        agents = [self.entries[first].agent(), self.entries[second].agent()]
+        totals = [0, 0]
+        for seating in (agents, agents[::-1]):
+            result = run_round(seating, seed=seed, rules=self.rules)
+            totals[0] += result.scores_by_agent[first]
+            totals[1] += result.scores_by_agent[second]
+        outcome = 1.0 if totals[0] < totals[1] else 0.5 if totals[0] == totals[1] else 0.0
+
+        self.ratings[first], self.ratings[second] = rate_match(self.ratings[first], self.ratings[second], outcome)
+        self.match_counts[first] += 1
+        self.match_counts[second] += 1
+        match = MatchResult(self.matches_played, seed, first, second, (totals[0], totals[1]), outcome)
+        self.matches_played += 1
+        self.rounds_played += 2
+        return match
+
+    def run(
+        self,
+        matches: int,
+        *,
+        target_sigma: float | None = None,
+        on_match: MatchCallback | None = None,
+    ) -> list[MatchResult]:
+        """Play up to ``matches`` scheduled matches, stopping once every sigma is at most ``target_sigma``."""
+
+        if matches < 0:
+            raise ValueError("matches must be non-negative")
+        played: list[MatchResult] = []
+        for _ in range(matches):
+            if target_sigma is not None and max(rating.sigma for rating in self.ratings.values()) <= target_sigma:
+                break
+            match = self.play_match(*self.schedule())
+            played.append(match)
+            if on_match is not None:
+                on_match(match)
+        return played
+
+    def leaderboard(self) -> list[dict[str, object]]:
+        rows = [
+            {
+                "rank": 0,
+                "name": name,
+                "kind": self.entries[name].kind,
+                "conservative": rating.conservative,
+                "mu": rating.mu,
+                "sigma": rating.sigma,
+                "matches": self.match_counts[name],
+            }
+            for name, rating in self.ratings.items()
+        ]
+        rows.sort(key=lambda row: (-row["conservative"], row["name"]))  # type: ignore[operator]
+        for rank, row in enumerate(rows, start=1):
+            row["rank"] = rank
+        return rows
+
+    def save(self, path: str | Path) -> Path:
+        """Atomically write the league (entries, ratings and match counter) as gzip JSON."""
+
+        return write_gzip_json(
+            path,
+            {
+                "version": LEAGUE_VERSION,
+                "seed": self.seed,
+                "rules": self.rules.to_dict(),
+                "matches_played": self.matches_played,
+                "rounds_played": self.rounds_played,
+                "entries": [
+                    {
+                        "name": name,
+                        "kind": entry.kind,
+                        "strategy": None if entry.strategy is None else asdict(entry.strategy),
+                        "mu": self.ratings[name].mu,
+                        "sigma": self.ratings[name].sigma,
+                        "matches": self.match_counts[name],
+                    }
+                    for name, entry in self.entries.items()
+                ],
+            },
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> League:
+        payload = read_gzip_json(path)
+        if payload.get("version") != LEAGUE_VERSION:
+            raise ValueError(f"unsupported league version: {payload.get('version')!r}")
+        league = cls(
+            seed=int(payload["seed"]),
+            rules=RulesConfig.from_dict(payload["rules"]),
+            matches_played=int(payload["matches_played"]),
+            rounds_played=int(payload["rounds_played"]),
+        )
+        for row in payload["entries"]:
+            strategy = None if row["strategy"] is None else HeuristicStrategy(**row["strategy"])
+            league.add(LeagueEntry(row["name"], row["kind"], strategy), Rating(row["mu"], row["sigma"]))
+            league.match_counts[row["name"]] = int(row["matches"])
+        return league
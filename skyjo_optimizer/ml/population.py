@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import random
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field, fields
+from itertools import repeat
+from operator import add
+from typing import Any
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+
+
+@dataclass(frozen=True)
+class Parameter:
+    """One gene: a named float kept within ``[low, high]``."""
+
+    name: str
+    low: float = 0.0
+    high: float = 1.0
+
+    def __post_init__(self) -> None:
+        if not self.low <= self.high:
+            raise ValueError(f"parameter {self.name!r} needs low <= high")
+
+
+@dataclass(frozen=True)
+class ParameterSchema:
+    """Genome layout: one ``Parameter`` per column and the type a row materializes as.
+
+    ``factory`` receives a row's values positionally; without one, rows
+    materialize as tuples, so genomes need no class of their own.
+    """
+
+    parameters: tuple[Parameter, ...]
+    factory: Callable[..., Any] | None = None
+
+    def __post_init__(self) -> None:
+        if not self.parameters:
+            raise ValueError("a schema needs at least one parameter")
+        if len(set(self.names)) != len(self.parameters):
+            raise ValueError("parameter names must be unique")
+
+    @classmethod
+    def of(cls, dataclass_type: type, low: float = 0.0, high: float = 1.0) -> ParameterSchema:
+        """One ``[low, high]`` parameter per field of ``dataclass_type``, which is also the factory."""
+
+        return cls(tuple(Parameter(item.name, low, high) for item in fields(dataclass_type)), dataclass_type)
+
+    @property
+    def width(self) -> int:
+        return len(self.parameters)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(parameter.name for parameter in self.parameters)
+
+    def encode(self, individual: Any) -> tuple[float, ...]:
+        if self.factory is None:
+            return tuple(individual)
+        return tuple(getattr(individual, name) for name in self.names)
+
+    def decode(self, row: Sequence[float]) -> Any:
+        return tuple(row) if self.factory is None else self.factory(*row)
+
+    def clip(self, genes: array) -> array:
+        """Clip the flat rows of ``genes`` to the bounds in place, in one pass over the buffer."""
+
+        rows = len(genes) // self.width
+        lows = array("d", [parameter.low for parameter in self.parameters]) * rows
+        highs = array("d", [parameter.high for parameter in self.parameters]) * rows
+        genes[:] = array("d", map(max, lows, map(min, highs, genes)))
+        return genes
+
+
+HEURISTIC_SCHEMA = ParameterSchema.of(HeuristicStrategy)
+
+
+@dataclass
+class Population:
+    """Individuals as the rows of one flat, row-major ``array('d')``.
+
+    Mutation, clipping and elite selection work on the array directly;
+    individuals are only materialized (``schema.decode``) where evaluators and
+    fitness caches need them. Decoded rows are memoized and carried along by
+    ``take`` and ``+``, so elites are decoded once rather than every
+    generation; ``genes`` must therefore not be modified in place once a
+    population is in use. A population pickles as a single buffer, without
+    the memo, so process pools ship it without per-individual objects.
+    """
+
+    schema: ParameterSchema
+    genes: array = field(default_factory=lambda: array("d"))
+    _decoded: list[Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.genes, array) or self.genes.typecode != "d":
+            self.genes = array("d", self.genes)
+        if len(self.genes) % self.schema.width:
+            raise ValueError("genes must hold whole rows of schema.width values")
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"schema": self.schema, "genes": self.genes, "_decoded": None}
+
+    @classmethod
+    def random(cls, schema: ParameterSchema, size: int, rng: random.Random) -> Population:
+        """``size`` individuals drawn uniformly within each parameter's bounds, row by row."""
+
+        spans = [(parameter.low, parameter.high - parameter.low) for parameter in schema.parameters]
+        return cls(schema, array("d", [low + span * rng.random() for _ in range(size) for low, span in spans]))
+
+    @classmethod
+    def of(cls, individuals: Iterable[Any], schema: ParameterSchema = HEURISTIC_SCHEMA) -> Population:
+        return cls(schema, array("d", [value for individual in individuals for value in schema.encode(individual)]))
+
+    def __len__(self) -> int:
+        return len(self.genes) // self.schema.width
+
+    def __add__(self, other: Population) -> Population:
+        if other.schema != self.schema:
+            raise ValueError("cannot combine populations with different schemas")
+        combined = Population(self.schema, self.genes + other.genes)
+        if self._decoded is not None or other._decoded is not None:
+            combined._decoded = self._memo() + other._memo()
+        return combined
+
+    def row(self, index: int) -> tuple[float, ...]:
+        start = self._start(index)
+        return tuple(self.genes[start : start + self.schema.width])
+
+    def individuals(self) -> list[Any]:
+        """Every row materialized through ``schema.decode``, in order; only rows not seen before are decoded."""
+
+        decoded = self._memo()
+        width, genes, decode = self.schema.width, self.genes, self.schema.decode
+        for index, individual in enumerate(decoded):
+            if individual is None:
+                start = index * width
+                decoded[index] = decode(genes[start : start + width])
+        self._decoded = decoded
+        return list(decoded)
+
+    def take(self, indices: Iterable[int]) -> Population:
+        """The rows at ``indices``, in that order (e.g. elites by rank)."""
+
+        indices = list(indices)
+        width, genes = self.schema.width, self.genes
+        taken = array("d")
+        for index in indices:
+            start = self._start(index)
+            taken.extend(genes[start : start + width])
+        population = Population(self.schema, taken)
+        if self._decoded is not None:
+            population._decoded = [self._decoded[index] for index in indices]
+        return population
+
+    def mutants(self, count: int, sigma: float, rng: random.Random) -> Population:
+        """``count`` children: a uniformly chosen row plus Gaussian noise, clipped to the bounds.
+
+        All parents are drawn first, then one ``gauss`` per gene of the whole
+        child buffer; noise, addition and clipping each run as one pass over it.
+        """
+
+        if count and not len(self):
+            raise ValueError("cannot breed from an empty population")
+        parents = self.take([rng.randrange(len(self)) for _ in range(count)]).genes
+        size = len(parents)
+        noise = map(rng.gauss, repeat(0.0, size), repeat(sigma, size))
+        return Population(self.schema, self.schema.clip(array("d", map(add, parents, noise))))
+
+    def _memo(self) -> list[Any]:
+        return list(self._decoded) if self._decoded is not None else [None] * len(self)
+
+    def _start(self, index: int) -> int:
+        if not 0 <= index < len(self):
+            raise IndexError(f"population index {index} out of range")
+        return index * self.schema.width
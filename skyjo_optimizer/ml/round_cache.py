@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+from skyjo_optimizer.engine import DealBank, RulesConfig
+from skyjo_optimizer.ml.artifact_cache import code_version
+from skyjo_optimizer.ml.checkpoint import read_gzip_json, write_gzip_json
+from skyjo_optimizer.simulation.baseline import (
+    BaselineAgent,
+    RoundResult,
+    TournamentResult,
+    run_round,
+    summarize_tournament,
+    tournament_seatings,
+)
+
+# Bump when the entry layout changes; files with another version are ignored.
+ROUND_CACHE_VERSION = 1
+
+
+def agent_fingerprint(agent: BaselineAgent) -> str:
+    """Hash of an agent's class, its parameters other than ``name`` and ``code_version()``.
+
+    Names only label results, so a renamed agent keeps its cached rounds.
+    """
+
+    parameters = {key: repr(value) for key, value in sorted(vars(agent).items()) if key != "name"}
+    payload = {
+        "class": f"{type(agent).__module__}.{type(agent).__qualname__}",
+        "parameters": parameters,
+        "code_version": code_version(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class RoundCache:
+    """Tournament round results keyed by seating fingerprints, deal seed and rules.
+
+    A round's outcome depends only on who sits where, the deal and the rules,
+    so a cached round is reused by any tournament that seats the same agents
+    the same way. Entries hold ``[scores in seat order, winner seats, turns]``
+    and persist in the fitness cache's gzip JSON format.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = None if path is None else Path(path)
+        self._rounds: dict[str, list[object]] = {}
+        if self.path is not None and self.path.exists():
+            payload = read_gzip_json(self.path)
+            if payload.get("version") == ROUND_CACHE_VERSION:
+                self._rounds = dict(payload["rounds"])
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._rounds)
+
+    def key(self, fingerprints: list[str], seed: int, rules: RulesConfig) -> str:
+        encoded = json.dumps([fingerprints, seed, rules.to_dict()], sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()[:24]
+
+    def round(
+        self,
+        seating: list[BaselineAgent],
+        fingerprints: list[str],
+        seed: int,
+        rules: RulesConfig,
+        deal_bank: DealBank | None = None,
+    ) -> RoundResult:
+        """The result of ``run_round(seating, seed=seed, rules=rules)``, simulated only on a miss."""
+
+        key = self.key(fingerprints, seed, rules)
+        row = self._rounds.get(key)
+        names = [agent.name for agent in seating]
+        if row is None:
+            self.misses += 1
+            result = run_round(seating, seed=seed, rules=rules, deal_bank=deal_bank)
+            self._rounds[key] = [
+                [result.scores_by_agent[name] for name in names],
+                [names.index(name) for name in result.winner_names],
+                result.turns,
+            ]
+            return result
+        self.hits += 1
+        scores, winners, turns = row
+        return RoundResult(
+            scores_by_agent=dict(zip(names, scores)),  # type: ignore[call-overload]
+            winner_names=tuple(sorted(names[index] for index in winners)),  # type: ignore[union-attr]
+            turns=int(turns),  # type: ignore[call-overload]
+        )
+
+    def save(self, path: str | Path | None = None) -> Path:
+        destination = path or self.path
+        if destination is None:
+            raise ValueError("no path to save the round cache to")
+        return write_gzip_json(destination, {"version": ROUND_CACHE_VERSION, "rounds": self._rounds})
+
+
+def cached_tournament(
+    agents: list[BaselineAgent],
+    *,
+    rounds: int,
+    seed: int,
+    cache: RoundCache,
+    rules: RulesConfig | None = None,
+    table_size: int | None = None,
+    deal_bank: DealBank | None = None,
+) -> TournamentResult:
+    """``run_tournament`` that simulates only rounds missing from ``cache``.
+
+    The result is identical to ``run_tournament`` with the same arguments.
+    With ``table_size`` below ``len(agents)``, adding an agent leaves every
+    existing table's seatings unchanged, so only the new agent's tables run.
+    """
+
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+    config = rules or RulesConfig()
+    prints = {id(agent): agent_fingerprint(agent) for agent in agents}
+    seatings = tournament_seatings(agents, rounds=rounds, seed=seed, table_size=table_size or len(agents))
+    round_results = [
+        cache.round(seating, [prints[id(agent)] for agent in seating], round_seed, config, deal_bank)
+        for seating, round_seed in seatings
+    ]
+    return summarize_tournament(agents, round_results)
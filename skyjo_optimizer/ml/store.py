@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import sqlite3
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from skyjo_optimizer.ml.experiment import ExperimentReport
+
+INDEX_FILENAME = "index.sqlite"
+MANIFEST_FILENAME = "manifest.json"
+
+# Index columns that ``query`` and ``compare`` may filter or group on.
+INDEX_FIELDS: tuple[str, ...] = (
+    "run_id",
+    "run_timestamp_utc",
+    "git_commit_hash",
+    "config_hash",
+    "ruleset_config_hash",
+    "seed_bank_id",
+    "seed",
+    "evaluator",
+)
+# Per-run summary metrics stored in the index so aggregates never open run folders.
+METRIC_FIELDS: tuple[str, ...] = ("aggregate_fitness", "benchmark_fitness", "holdout_score", "generations")
+
+_NPY_MAGIC = b"\x93NUMPY"
+_DTYPES = {"d": "<f8", "q": "<i8"}
+_TYPECODES = {descr: code for code, descr in _DTYPES.items()}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    {", ".join(f"{name} TEXT" if name != "seed" else "seed INTEGER" for name in INDEX_FIELDS)},
+    {", ".join(f"{name} REAL" for name in METRIC_FIELDS)},
+    optimizer_config TEXT,
+    PRIMARY KEY (run_id)
+);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (git_commit_hash);
+CREATE INDEX IF NOT EXISTS runs_config ON runs (config_hash);
+CREATE INDEX IF NOT EXISTS runs_seed_bank ON runs (seed_bank_id);
+"""
+
+
+class ArtifactStore:
+    """Columnar store for many runs with a SQLite index over run metadata.
+
+    Layout under ``root``::
+
+        index.sqlite                      # one row per run: metadata + summary metrics
+        runs/<run_id>/manifest.json       # tables -> columns -> dtype, rows, file
+        runs/<run_id>/<table>/<column>.npy
+
+    Every column is a standalone NumPy ``.npy`` file (written without requiring
+    NumPy), so one metric of one table can be loaded for thousands of runs
+    without touching the rest. Tables are ``generations`` (one row per
+    generation and island) and ``rounds`` (one row per benchmark round).
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def add_run(
+        self,
+        run_id: str,
+        report: ExperimentReport,
+        *,
+        round_scores: dict[str, Sequence[float]] | None = None,
+    ) -> Path:
+        """Write ``report``'s tables and index it; re-adding a ``run_id`` replaces it."""
+
+        run_root = self.root / "runs" / run_id
+        tables: dict[str, dict[str, array]] = {"generations": _generation_columns(report)}
+        if round_scores is not None:
+            tables["rounds"] = {name: _column(values) for name, values in round_scores.items()}
+
+        manifest: dict[str, dict[str, dict[str, object]]] = {}
+        for table, columns in tables.items():
+            manifest[table] = {}
+            for name, values in columns.items():
+                relative = f"{table}/{name}.npy"
+                write_npy(run_root / relative, values)
+                manifest[table][name] = {"dtype": _DTYPES[values.typecode], "rows": len(values), "file": relative}
+        (run_root / MANIFEST_FILENAME).write_text(json.dumps(manifest, sort_keys=True) + "\n")
+
+        metadata = report.metadata
+        config = asdict(metadata.optimizer_config)
+        row = {
+            "run_id": run_id,
+            "run_timestamp_utc": metadata.run_timestamp_utc,
+            "git_commit_hash": metadata.git_commit_hash,
+            "config_hash": optimizer_config_hash(config),
+            "ruleset_config_hash": metadata.ruleset_config_hash,
+            "seed_bank_id": metadata.seed_bank_id,
+            "seed": metadata.seed,
+            "evaluator": config["evaluator"],
+            "aggregate_fitness": report.optimized.aggregate_fitness,
+            "benchmark_fitness": report.benchmark.aggregate_fitness,
+            "holdout_score": report.holdout_score,
+            "generations": len({record["generation"] for record in report.generations}),
+            "optimizer_config": json.dumps(config, sort_keys=True),
+        }
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO runs ({', '.join(row)}) VALUES ({', '.join('?' for _ in row)})",
+                tuple(row.values()),
+            )
+        return run_root
+
+    def query(
+        self,
+        filters: dict[str, object] | None = None,
+        *,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        """Index rows matching every ``field == value`` filter, newest first."""
+
+        where, params = _where(filters or {})
+        sql = f"SELECT * FROM runs{where} ORDER BY run_timestamp_utc DESC, run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._connect() as connection:
+            connection.row_factory = sqlite3.Row
+            return [dict(row) for row in connection.execute(sql, params)]
+
+    def compare(
+        self,
+        group_by: str,
+        metric: str = "aggregate_fitness",
+        filters: dict[str, object] | None = None,
+    ) -> list[dict[str, object]]:
+        """Count, mean, min and max of ``metric`` per ``group_by`` value, computed inside SQLite."""
+
+        if group_by not in INDEX_FIELDS:
+            raise ValueError(f"cannot group by {group_by!r}; choose from {INDEX_FIELDS}")
+        if metric not in METRIC_FIELDS:
+            raise ValueError(f"unknown metric {metric!r}; choose from {METRIC_FIELDS}")
+        where, params = _where(filters or {})
+        sql = (
+            f"SELECT {group_by} AS grp, COUNT(*) AS runs, AVG({metric}) AS mean, MIN({metric}) AS min, "
+            f"MAX({metric}) AS max FROM runs{where} GROUP BY {group_by} ORDER BY mean DESC"
+        )
+        with self._connect() as connection:
+            return [
+                {group_by: grp, "runs": runs, "mean": mean, "min": low, "max": high}
+                for grp, runs, mean, low, high in connection.execute(sql, params)
+            ]
+
+    def load_column(self, run_id: str, table: str, column: str) -> array:
+        manifest = json.loads((self.root / "runs" / run_id / MANIFEST_FILENAME).read_text())
+        entry = manifest[table][column]
+        return read_npy(self.root / "runs" / run_id / entry["file"])
+
+    def _connect(self) -> sqlite3.Connection:
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Sweep workers add runs concurrently; wait for the writer lock instead of failing.
+        connection = sqlite3.connect(self.root / INDEX_FILENAME, timeout=30.0)
+        connection.executescript(_SCHEMA)
+        return connection
+
+
+def optimizer_config_hash(config: dict[str, object]) -> str:
+    encoded = json.dumps(config, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def write_npy(path: str | Path, values: array) -> Path:
+    """Write a 1-D ``array('d')`` or ``array('q')`` as a version 1.0 ``.npy`` file."""
+
+    destination = Path(path)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    header = f"{{'descr': '{_DTYPES[values.typecode]}', 'fortran_order': False, 'shape': ({len(values)},), }}"
+    # Magic, version and header length take 10 bytes; pad the header to a multiple of 64.
+    padding = 64 - (10 + len(header) + 1) % 64
+    header_bytes = (header + " " * padding + "\n").encode("latin1")
+    data = array(values.typecode, values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    destination.write_bytes(_NPY_MAGIC + b"\x01\x00" + len(header_bytes).to_bytes(2, "little") + header_bytes + data.tobytes())
+    return destination
+
+
+def read_npy(path: str | Path) -> array:
+    payload = Path(path).read_bytes()
+    if payload[:6] != _NPY_MAGIC or payload[6] != 1:
+        raise ValueError(f"{path} is not a version 1.0 .npy file")
+    header_length = int.from_bytes(payload[8:10], "little")
+    header = ast.literal_eval(payload[10 : 10 + header_length].decode("latin1"))
+    values = array(_TYPECODES[header["descr"]])
+    values.frombytes(payload[10 + header_length :])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _generation_columns(report: ExperimentReport) -> dict[str, array]:
+    records = report.generations
+    return {
+        "island": array("q", (record["island"] for record in records)),
+        "generation": array("q", (record["generation"] for record in records)),
+        "best_fitness": array("d", (record["best_fitness"] for record in records)),
+        "mean_fitness": array("d", (record["mean_fitness"] for record in records)),
+        # NaN marks generations without a holdout check.
+        "holdout_score": array(
+            "d",
+            (float("nan") if record["holdout_score"] is None else record["holdout_score"] for record in records),
+        ),
+    }
+
+
+def _column(values: Sequence[float]) -> array:
+    if all(isinstance(value, int) for value in values):
+        return array("q", values)
+    return array("d", values)
+
+
+def _where(filters: dict[str, object]) -> tuple[str, list[object]]:
+    unknown = set(filters) - set(INDEX_FIELDS)
+    if unknown:
+        raise ValueError(f"unknown index fields: {sorted(unknown)}")
+    if not filters:
+        return "", []
+    clauses = [f"{name} = ?" for name in sorted(filters)]
+    return " WHERE " + " AND ".join(clauses), [filters[name] for name in sorted(filters)]
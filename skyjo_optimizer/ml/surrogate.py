@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from skyjo_optimizer.ml.population import HEURISTIC_SCHEMA, ParameterSchema, Population
+
+# Evaluated (strategy, fitness) pairs the surrogate is fit to: the most recent ones,
+# so the fit stays near the current population and checkpoints stay bounded.
+HISTORY_WINDOW = 512
+
+
+@dataclass
+class SurrogateStats:
+    """Running counters for surrogate pre-screening.
+
+    ``screened`` counts every mutant the surrogate ranked (whole pools),
+    ``evaluated`` the ones sent to the real evaluator, so the difference is the
+    evaluations saved. Prediction errors compare the surrogate estimate of an
+    evaluated mutant with its first real training fitness.
+    """
+
+    screened: int = 0
+    evaluated: int = 0
+    error_count: int = 0
+    abs_error_sum: float = 0.0
+    squared_error_sum: float = 0.0
+
+    @property
+    def evaluations_saved(self) -> int:
+        return self.screened - self.evaluated
+
+    @classmethod
+    def merged(cls, stats: Sequence["SurrogateStats"]) -> "SurrogateStats":
+        return cls(
+            screened=sum(item.screened for item in stats),
+            evaluated=sum(item.evaluated for item in stats),
+            error_count=sum(item.error_count for item in stats),
+            abs_error_sum=sum(item.abs_error_sum for item in stats),
+            squared_error_sum=sum(item.squared_error_sum for item in stats),
+        )
+
+    def record_error(self, predicted: float, actual: float) -> None:
+        self.error_count += 1
+        self.abs_error_sum += abs(predicted - actual)
+        self.squared_error_sum += (predicted - actual) ** 2
+
+    def to_dict(self) -> dict[str, float | int | None]:
+        return {
+            "screened": self.screened,
+            "evaluated": self.evaluated,
+            "evaluations_saved": self.evaluations_saved,
+            "prediction_count": self.error_count,
+            "mean_abs_error": self.abs_error_sum / self.error_count if self.error_count else None,
+            "rmse": math.sqrt(self.squared_error_sum / self.error_count) if self.error_count else None,
+        }
+
+
+class QuadraticSurrogate:
+    """Ridge regression on a full quadratic expansion of a genome's parameters.
+
+    ``schema`` says how individuals encode to parameter rows. Predictions come
+    with a standard deviation from the Bayesian linear-regression view of ridge,
+    ``sigma^2 * x^T (X^T X + ridge * I)^-1 x``, which grows for individuals far
+    from anything evaluated so far.
+    """
+
+    def __init__(self, ridge: float = 1e-3, schema: ParameterSchema = HEURISTIC_SCHEMA) -> None:
+        self.ridge = ridge
+        self.schema = schema
+        self._weights: list[float] | None = None
+        self._precision_inverse: list[list[float]] | None = None
+        self._noise_variance = 0.0
+
+    @property
+    def is_fitted(self) -> bool:
+        return self._weights is not None
+
+    def fit(self, history: Sequence[tuple[Any, float]]) -> bool:
+        """Fit on ``(individual, fitness)`` pairs; returns ``False`` if there is too little data."""
+
+        if not history:
+            return False
+        rows = [_features(self.schema.encode(individual)) for individual, _ in history]
+        targets = [fitness for _, fitness in history]
+        width = len(rows[0])
+        if len(rows) <= width:
+            return False
+
+        gram = [[0.0] * width for _ in range(width)]
+        moment = [0.0] * width
+        for row, target in zip(rows, targets):
+            for i, xi in enumerate(row):
+                moment[i] += xi * target
+                gram_row = gram[i]
+                for j in range(i, width):
+                    gram_row[j] += xi * row[j]
+        for i in range(width):
+            gram[i][i] += self.ridge
+            for j in range(i):
+                gram[i][j] = gram[j][i]
+
+        inverse = _invert(gram)
+        weights = [sum(inverse[i][j] * moment[j] for j in range(width)) for i in range(width)]
+        residuals = [target - _dot(weights, row) for row, target in zip(rows, targets)]
+        self._weights = weights
+        self._precision_inverse = inverse
+        self._noise_variance = sum(r * r for r in residuals) / (len(rows) - width)
+        return True
+
+    def predict(self, individual: Any) -> tuple[float, float]:
+        """Return ``(mean, std)`` of the predicted fitness."""
+
+        return self._predict_row(self.schema.encode(individual))
+
+    def predict_population(self, population: Population) -> list[tuple[float, float]]:
+        """``predict`` for every row of ``population``, read straight from its genes."""
+
+        if population.schema != self.schema:
+            raise ValueError("population schema does not match the surrogate schema")
+        width, genes = self.schema.width, population.genes
+        return [self._predict_row(genes[start : start + width]) for start in range(0, len(genes), width)]
+
+    def _predict_row(self, values: Sequence[float]) -> tuple[float, float]:
+        if self._weights is None or self._precision_inverse is None:
+            raise RuntimeError("surrogate has not been fitted")
+        row = _features(values)
+        leverage = sum(xi * _dot(self._precision_inverse[i], row) for i, xi in enumerate(row))
+        return _dot(self._weights, row), math.sqrt(max(0.0, self._noise_variance * leverage))
+
+
+def _features(values: Sequence[float]) -> list[float]:
+    features = [1.0, *values]
+    for i, xi in enumerate(values):
+        for xj in values[i:]:
+            features.append(xi * xj)
+    return features
+
+
+def _dot(left: Sequence[float], right: Sequence[float]) -> float:
+    return sum(a * b for a, b in zip(left, right))
+
+
+def _invert(matrix: list[list[float]]) -> list[list[float]]:
+    """Gauss-Jordan inverse with partial pivoting for the small normal-equation matrix."""
+
+    size = len(matrix)
+    augmented = [row[:] + [1.0 if i == j else 0.0 for j in range(size)] for i, row in enumerate(matrix)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(augmented[r][column]))
+        if abs(augmented[pivot][column]) < 1e-12:
+            raise ValueError("surrogate normal equations are singular")
+        augmented[column], augmented[pivot] = augmented[pivot], augmented[column]
+        scale = augmented[column][column]
+        augmented[column] = [value / scale for value in augmented[column]]
+        for r in range(size):
+            if r == column:
+                continue
+            factor = augmented[r][column]
+            if factor:
+                pivot_row = augmented[column]
+                augmented[r] = [value - factor * p for value, p in zip(augmented[r], pivot_row)]
+    return [row[size:] for row in augmented]
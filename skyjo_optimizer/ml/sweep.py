@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import random
+import tomllib
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+
+from skyjo_optimizer.ml.artifact_cache import ARTIFACT_CACHE_DIRNAME, ArtifactCache
+from skyjo_optimizer.ml.checkpoint import FitnessKey, read_fitness_cache, write_fitness_cache
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.experiment import (
+    benchmark_round_scores,
+    cached_baseline_tournament,
+    cached_benchmark_strategy,
+    run_experiment,
+)
+from skyjo_optimizer.ml.store import ArtifactStore
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS, GameSituation
+
+SWEEP_RESULTS_FILENAME = "sweep_results.csv"
+FITNESS_CACHE_FILENAME = "fitness_cache.json.gz"
+STORE_DIRNAME = "store"
+
+_CONFIG_FIELDS = frozenset(item.name for item in fields(EvolutionConfig))
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    """Grid or random search over ``EvolutionConfig`` fields.
+
+    TOML layout::
+
+        [sweep]
+        mode = "grid"            # or "random"
+        samples = 16             # random mode only
+        seed = 7                 # random mode sampling seed
+        workers = 4
+        tournament_rounds = 24
+
+        [base]                   # fixed EvolutionConfig values
+        generations = 20
+
+        [grid]                   # grid mode: list of values per field
+        population_size = [12, 24]
+
+        [random]                 # random mode: {low, high} range or list of choices
+        mutation_sigma = { low = 0.05, high = 0.2 }
+        elite_count = [3, 6]
+    """
+
+    mode: str = "grid"
+    base: dict[str, object] = field(default_factory=dict)
+    parameters: dict[str, object] = field(default_factory=dict)
+    samples: int = 8
+    seed: int = 7
+    workers: int = 1
+    tournament_rounds: int = 24
+
+    @classmethod
+    def from_toml(cls, path: str | Path) -> "SweepSpec":
+        payload = tomllib.loads(Path(path).read_text())
+        settings = payload.get("sweep", {})
+        mode = settings.get("mode", "grid")
+        return cls(
+            mode=mode,
+            base=payload.get("base", {}),
+            parameters=payload.get(mode, {}),
+            samples=int(settings.get("samples", 8)),
+            seed=int(settings.get("seed", 7)),
+            workers=int(settings.get("workers", 1)),
+            tournament_rounds=int(settings.get("tournament_rounds", 24)),
+        )
+
+    def validate(self) -> None:
+        if self.mode not in {"grid", "random"}:
+            raise ValueError("sweep mode must be 'grid' or 'random'")
+        unknown = (set(self.base) | set(self.parameters)) - _CONFIG_FIELDS
+        if unknown:
+            raise ValueError(f"unknown EvolutionConfig fields in sweep spec: {sorted(unknown)}")
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if self.mode == "random" and self.samples <= 0:
+            raise ValueError("samples must be positive")
+
+    def expand(self) -> list[EvolutionConfig]:
+        """Resolve the spec into concrete configs, in a deterministic order.
+
+        Every config is validated, so a bad combination fails before any run starts.
+        """
+
+        self.validate()
+        if self.mode == "grid":
+            names = sorted(self.parameters)
+            value_lists = [_as_list(self.parameters[name]) for name in names]
+            overrides = [dict(zip(names, values)) for values in itertools.product(*value_lists)]
+        else:
+            rng = random.Random(self.seed)
+            overrides = [
+                {name: _sample(rng, self.parameters[name]) for name in sorted(self.parameters)}
+                for _ in range(self.samples)
+            ]
+        configs = []
+        for override in overrides:
+            config = EvolutionConfig(**{**self.base, **override})
+            try:
+                config.validate()
+            except ValueError as error:
+                raise ValueError(f"invalid sweep config {override}: {error}") from error
+            configs.append(config)
+        return configs
+
+
+@dataclass(frozen=True)
+class SweepOutcome:
+    results_path: Path
+    executed: tuple[str, ...]
+    skipped: tuple[str, ...]
+
+
+def run_sweep(
+    spec: SweepSpec,
+    output_root: str | Path,
+    *,
+    situations: list[GameSituation] | None = None,
+    workers: int | None = None,
+) -> SweepOutcome:
+    """Run every config of ``spec`` once, skipping configs that already have a report.
+
+    Runs share one fitness cache (persisted in ``output_root``), of which each
+    run receives only the entries its config can look up, and an artifact
+    cache that holds the baseline tournament and benchmark-strategy scores, which
+    are computed once per distinct input before any run starts.
+    Each run lands in ``runs/<config_hash>/`` and is indexed in the ``store/``
+    ``ArtifactStore``; all reports are consolidated into ``sweep_results.csv``.
+    """
+
+    scenarios = situations or DEFAULT_SITUATIONS
+    root = Path(output_root)
+    configs = spec.expand()
+    cache_path = root / FITNESS_CACHE_FILENAME
+    shared_cache = read_fitness_cache(cache_path)
+
+    pending: list[tuple[str, EvolutionConfig]] = []
+    skipped: list[str] = []
+    seen: set[str] = set()
+    for config in configs:
+        digest = config_hash(config, scenarios, spec.tournament_rounds)
+        if digest in seen:
+            continue
+        seen.add(digest)
+        if (root / "runs" / digest / "report.json").exists():
+            skipped.append(digest)
+        else:
+            pending.append((digest, config))
+
+    artifact_cache = ArtifactCache(root / ARTIFACT_CACHE_DIRNAME)
+    for _, config in pending:
+        cached_benchmark_strategy(scenarios, config=config, cache=artifact_cache)
+        cached_baseline_tournament(seed=config.seed, rounds=spec.tournament_rounds, cache=artifact_cache)
+
+    def job(digest: str, config: EvolutionConfig) -> tuple:
+        # Only the entries this run can hit are copied (and pickled to workers).
+        return (
+            config,
+            scenarios,
+            spec.tournament_rounds,
+            EvolutionOptimizer(config).relevant_fitness(shared_cache, scenarios),
+            artifact_cache.root,
+            root / STORE_DIRNAME,
+            root / "runs" / digest,
+        )
+
+    pool_size = workers or spec.workers
+    if pool_size <= 1:
+        for digest, config in pending:
+            shared_cache.update(_run_sweep_job(*job(digest, config)))
+            write_fitness_cache(cache_path, shared_cache)
+    else:
+        with ProcessPoolExecutor(max_workers=pool_size) as executor:
+            queue = list(pending)
+            running: set[Future] = set()
+            while queue or running:
+                # Submit lazily so later runs start from a cache warmed by earlier ones.
+                while queue and len(running) < pool_size:
+                    digest, config = queue.pop(0)
+                    running.add(executor.submit(_run_sweep_job, *job(digest, config)))
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shared_cache.update(future.result())
+                write_fitness_cache(cache_path, shared_cache)
+
+    results_path = write_sweep_results(root)
+    return SweepOutcome(
+        results_path=results_path,
+        executed=tuple(digest for digest, _ in pending),
+        skipped=tuple(skipped),
+    )
+
+
+def config_hash(config: EvolutionConfig, situations: list[GameSituation], tournament_rounds: int) -> str:
+    """Stable identifier of a fully resolved sweep run."""
+
+    payload = {
+        "evolution": asdict(config),
+        "situations": [asdict(situation) for situation in situations],
+        "tournament_rounds": tournament_rounds,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def write_sweep_results(root: str | Path) -> Path:
+    """Consolidate every ``runs/*/report.json`` under ``root`` into one CSV table."""
+
+    root = Path(root)
+    config_names = sorted(_CONFIG_FIELDS)
+    rows = [",".join(["config_hash", *config_names, "aggregate_fitness", "benchmark_fitness", "seed_bank_id"])]
+    for report_path in sorted((root / "runs").glob("*/report.json")):
+        payload = json.loads(report_path.read_text())
+        config = payload["metadata"]["optimizer_config"]
+        rows.append(
+            ",".join(
+                [
+                    report_path.parent.name,
+                    *(_csv_value(config.get(name)) for name in config_names),
+                    f"{payload['optimized']['aggregate_fitness']:.6f}",
+                    f"{payload['benchmark']['aggregate_fitness']:.6f}",
+                    payload["metadata"]["seed_bank_id"],
+                ]
+            )
+        )
+    destination = root / SWEEP_RESULTS_FILENAME
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text("\n".join(rows) + "\n")
+    return destination
+
+
+def _run_sweep_job(
+    config: EvolutionConfig,
+    situations: list[GameSituation],
+    tournament_rounds: int,
+    fitness_cache: dict[FitnessKey, float],
+    artifact_root: Path,
+    store_root: Path,
+    run_dir: Path,
+) -> dict[FitnessKey, float]:
+    known = set(fitness_cache)
+    report = run_experiment(
+        situations,
+        config=config,
+        tournament_rounds=tournament_rounds,
+        resolved_config=asdict(config),
+        fitness_cache=fitness_cache,
+        artifact_cache=ArtifactCache(artifact_root),
+    )
+    report.write_artifacts(run_dir=run_dir)
+    ArtifactStore(store_root).add_run(run_dir.name, report, round_scores=benchmark_round_scores(report, situations))
+    return {key: value for key, value in fitness_cache.items() if key not in known}
+
+
+def _as_list(value: object) -> list[object]:
+    return list(value) if isinstance(value, list) else [value]
+
+
+def _sample(rng: random.Random, choice: object) -> object:
+    if isinstance(choice, dict):
+        low, high = choice["low"], choice["high"]
+        if isinstance(low, int) and isinstance(high, int):
+            return rng.randint(low, high)
+        return rng.uniform(float(low), float(high))
+    if isinstance(choice, list):
+        return rng.choice(choice)
+    return choice
+
+
+def _csv_value(value: object) -> str:
+    return "" if value is None else str(value)
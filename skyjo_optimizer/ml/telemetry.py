@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+TELEMETRY_FILENAME = "telemetry.jsonl"
+PHASES: tuple[str, ...] = ("scoring", "holdout", "selection", "mutation")
+
+
+@dataclass(frozen=True)
+class GenerationEvent:
+    """Progress of one completed generation.
+
+    ``evaluations`` counts new (uncached) strategy/situation evaluations in this
+    generation; ``phase_seconds`` splits its wall time into ``PHASES``.
+    """
+
+    generation: int
+    evaluations: int
+    evaluations_per_second: float
+    best_fitness: float
+    median_fitness: float
+    holdout_score: float | None
+    best_holdout: float | None
+    stagnant_generations: int
+    stopped_early: bool
+    phase_seconds: dict[str, float]
+    elapsed_seconds: float
+    event: str = "generation"
+
+
+@dataclass(frozen=True)
+class RunFinishedEvent:
+    """Emitted once ``optimize`` has picked its final strategy."""
+
+    generations_completed: int
+    evaluations: int
+    final_ranking_seconds: float
+    elapsed_seconds: float
+    best_fitness: float
+    event: str = "finished"
+
+
+TelemetryEvent = GenerationEvent | RunFinishedEvent
+Observer = Callable[[TelemetryEvent], None]
+
+
+@dataclass
+class PhaseTimer:
+    """Accumulates wall time per phase; use ``with timer.phase("scoring"):``."""
+
+    seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+
+    def phase(self, name: str) -> "_Phase":
+        return _Phase(self, name)
+
+
+class _Phase:
+    def __init__(self, timer: PhaseTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.timer.seconds[self.name] += time.perf_counter() - self.started
+
+
+class JsonlTelemetrySink:
+    """Observer that appends each event as one JSON line and flushes it immediately."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __call__(self, event: TelemetryEvent) -> None:
+        with self.path.open("a") as handle:
+            handle.write(json.dumps(asdict(event), sort_keys=True) + "\n")
+            handle.flush()
+
+
+def read_events(path: str | Path) -> list[dict[str, object]]:
+    return list(tail_events(path, follow=False))
+
+
+def tail_events(
+    path: str | Path,
+    *,
+    follow: bool = False,
+    poll_seconds: float = 0.5,
+    idle_seconds: float | None = None,
+    finished: Callable[[], bool] | None = None,
+) -> Iterator[dict[str, object]]:
+    """Yield events from a telemetry file; with ``follow``, wait for new ones until the run finishes.
+
+    A run that crashed never writes its ``finished`` event, so following also
+    stops once ``finished()`` is true (e.g. the run's report exists) or the file
+    has not grown for ``idle_seconds``.
+    """
+
+    path = Path(path)
+    last_growth = time.monotonic()
+
+    def writer_gone() -> bool:
+        if finished is not None and finished():
+            return True
+        return idle_seconds is not None and time.monotonic() - last_growth >= idle_seconds
+
+    while follow and not path.exists():
+        if writer_gone():
+            return
+        time.sleep(poll_seconds)
+    if not path.exists():
+        return
+    with path.open() as handle:
+        buffer = ""
+        draining = not follow
+        while True:
+            chunk = handle.readline()
+            if chunk:
+                last_growth = time.monotonic()
+                buffer += chunk
+                # A line without a newline is still being written; wait for the rest.
+                if not buffer.endswith("\n"):
+                    continue
+                event = json.loads(buffer)
+                buffer = ""
+                yield event
+                if follow and event.get("event") == "finished":
+                    return
+            elif draining:
+                return
+            elif writer_gone():
+                # One more pass picks up lines written just before the writer stopped.
+                draining = True
+            else:
+                time.sleep(poll_seconds)
+
+
+def format_event(event: dict[str, object]) -> str:
+    """One human-readable line per event, as printed by ``cli tail``."""
+
+    if event.get("event") == "finished":
+        return (
+            f"finished  generations {event['generations_completed']}  evaluations {event['evaluations']}  "
+            f"best {event['best_fitness']:.3f}  final ranking {event['final_ranking_seconds']:.2f}s  "
+            f"elapsed {event['elapsed_seconds']:.2f}s"
+        )
+    phases: dict[str, float] = event["phase_seconds"]  # type: ignore[assignment]
+    holdout = event["holdout_score"]
+    return (
+        f"gen {event['generation']:>4}  evals/s {event['evaluations_per_second']:>9.1f}  "
+        f"best {event['best_fitness']:.3f}  median {event['median_fitness']:.3f}  "
+        f"holdout {'-' if holdout is None else f'{holdout:.3f}'}  stagnant {event['stagnant_generations']}  "
+        + "  ".join(f"{name} {phases.get(name, 0.0):.3f}s" for name in PHASES)
+    )
@@ -0,0 +1,22 @@
+from skyjo_optimizer._lazy import lazy_exports
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .client import ServeClient, ServeError
+    from .protocol import ProtocolError
+    from .server import OPERATIONS, EvaluationServer, ServeConfig, run_server
+
+_EXPORTS: dict[str, str] = {
+    "EvaluationServer": ".server",
+    "OPERATIONS": ".server",
+    "ProtocolError": ".protocol",
+    "ServeClient": ".client",
+    "ServeConfig": ".server",
+    "ServeError": ".client",
+    "run_server": ".server",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
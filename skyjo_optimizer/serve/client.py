@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import itertools
+import socket
+from dataclasses import asdict
+from pathlib import Path
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.serve.protocol import FRAME_HEADER, JSON_FORMAT, MSGPACK_FORMAT, decode_message, encode_message
+
+
+class ServeClient:
+    """Blocking client for one connection to ``serve``.
+
+    ``address`` is what the server prints on start-up: ``unix:<path>`` or
+    ``<host>:<port>``. Failed requests raise ``ServeError``.
+    """
+
+    def __init__(self, address: str, *, message_format: str = JSON_FORMAT, timeout: float | None = 60.0) -> None:
+        if message_format not in (JSON_FORMAT, MSGPACK_FORMAT):
+            raise ValueError(f"unknown message format: {message_format!r}")
+        self.message_format = message_format
+        if address.startswith("unix:"):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(timeout)
+            self._socket.connect(str(Path(address.removeprefix("unix:"))))
+        else:
+            host, _, port = address.rpartition(":")
+            self._socket = socket.create_connection((host, int(port)), timeout=timeout)
+        self._stream = self._socket.makefile("rb")
+        self._ids = itertools.count()
+
+    def request(self, op: str, **fields: object) -> object:
+        """Send one request and return its ``result``."""
+
+        request_id = next(self._ids)
+        self.send({"id": request_id, "op": op, **fields})
+        response = self.receive()
+        if response.get("id") != request_id:
+            raise ServeError(f"response for request {response.get('id')!r}, expected {request_id}")
+        if not response.get("ok"):
+            raise ServeError(str(response.get("error")))
+        return response.get("result")
+
+    def send(self, message: dict[str, object]) -> None:
+        self._socket.sendall(encode_message(message, self.message_format))
+
+    def receive(self) -> dict[str, object]:
+        if self.message_format == JSON_FORMAT:
+            body = self._stream.readline()
+        else:
+            header = self._stream.read(FRAME_HEADER.size)
+            body = self._stream.read(FRAME_HEADER.unpack(header)[0]) if len(header) == FRAME_HEADER.size else b""
+        if not body:
+            raise ServeError("server closed the connection")
+        return decode_message(body, self.message_format)
+
+    def evaluate(self, strategy: HeuristicStrategy, **fields: object) -> dict[str, object]:
+        return self.request("evaluate", strategy=asdict(strategy), **fields)  # type: ignore[return-value]
+
+    def close(self) -> None:
+        self._stream.close()
+        self._socket.close()
+
+    def __enter__(self) -> ServeClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+class ServeError(RuntimeError):
+    """The server answered a request with an error, or the connection broke."""
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+
+# Requests and responses are JSON objects, one per line. A connection whose first
+# byte is not ``{`` speaks msgpack instead, each message prefixed by its length.
+JSON_FORMAT = "json"
+MSGPACK_FORMAT = "msgpack"
+FRAME_HEADER = struct.Struct(">I")
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class ProtocolError(ValueError):
+    """A message could not be framed or decoded."""
+
+
+def encode_message(message: dict[str, object], message_format: str) -> bytes:
+    if message_format == JSON_FORMAT:
+        return json.dumps(message, sort_keys=True).encode("utf-8") + b"\n"
+    body = _msgpack().packb(message, use_bin_type=True)
+    return FRAME_HEADER.pack(len(body)) + body
+
+
+def decode_message(body: bytes, message_format: str) -> dict[str, object]:
+    try:
+        message = json.loads(body) if message_format == JSON_FORMAT else _msgpack().unpackb(body, raw=False)
+    except ProtocolError:
+        raise
+    except Exception as error:
+        raise ProtocolError(f"undecodable {message_format} message: {error}") from error
+    if not isinstance(message, dict):
+        raise ProtocolError("a message must be an object")
+    return message
+
+
+def detect_format(first_byte: bytes) -> str:
+    return JSON_FORMAT if first_byte == b"{" else MSGPACK_FORMAT
+
+
+def check_format(message_format: str) -> None:
+    """Raise ``ProtocolError`` if this process cannot encode ``message_format``."""
+
+    if message_format == MSGPACK_FORMAT:
+        _msgpack()
+
+
+async def read_message(reader: asyncio.StreamReader, message_format: str, prefix: bytes = b"") -> bytes | None:
+    """Next raw message body from ``reader``, or ``None`` at end of stream.
+
+    ``prefix`` holds bytes of this message already consumed, e.g. by ``detect_format``.
+    """
+
+    if message_format == JSON_FORMAT:
+        try:
+            return prefix + await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            if (prefix + error.partial).strip():
+                raise ProtocolError("connection closed mid-message") from error
+            return None
+        except asyncio.LimitOverrunError as error:
+            raise ProtocolError("message too large") from error
+    try:
+        header = prefix + await reader.readexactly(FRAME_HEADER.size - len(prefix))
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise ProtocolError("message too large")
+    return await reader.readexactly(length)
+
+
+def _msgpack():  # type: ignore[no-untyped-def]
+    try:
+        import msgpack
+    except ImportError as error:
+        raise ProtocolError("msgpack messages need the optional 'msgpack' package") from error
+    return msgpack
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TypeVar
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.serve.protocol import (
+    MAX_MESSAGE_BYTES,
+    JSON_FORMAT,
+    ProtocolError,
+    check_format,
+    decode_message,
+    detect_format,
+    encode_message,
+    read_message,
+)
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import run_tournament
+from skyjo_optimizer.simulation.engine_evaluator import DEFAULT_OPPONENT_POOL, OPPONENT_FACTORIES
+from skyjo_optimizer.simulation.evaluator import EvaluationResult
+from skyjo_optimizer.simulation.regression import RegressionCheckResult, run_regression_checks
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+T = TypeVar("T")
+
+OPERATIONS: tuple[str, ...] = ("evaluate", "tournament", "regression", "stats", "shutdown")
+DEFAULT_EVAL_ROUNDS = 120
+DEFAULT_TOURNAMENT_AGENTS: tuple[str, ...] = ("heuristic", "random", "random")
+
+# Strategies scored together share (evaluator key, situation, rounds, seed).
+BatchKey = tuple[str, tuple[str, ...], str, int, int]
+
+
+@dataclass(frozen=True)
+class ServeConfig:
+    """Where ``serve`` listens and how it batches.
+
+    Evaluations that arrive within ``batch_window_ms`` of each other and share an
+    evaluator, situation, round count and seed are scored in one evaluator call
+    (at most ``max_batch_size`` strategies). ``workers > 1`` runs batches on a
+    process pool; otherwise they run on one background thread.
+    """
+
+    socket_path: Path | None = None
+    host: str = "127.0.0.1"
+    port: int = 0
+    workers: int = 1
+    batch_window_ms: float = 5.0
+    max_batch_size: int = 64
+    latency_window: int = 1000
+
+    def __post_init__(self) -> None:
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if self.batch_window_ms < 0:
+            raise ValueError("batch_window_ms must be non-negative")
+        if self.max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive")
+        if self.latency_window <= 0:
+            raise ValueError("latency_window must be positive")
+
+
+@dataclass
+class _PendingBatch:
+    strategies: list[HeuristicStrategy] = field(default_factory=list)
+    futures: list[asyncio.Future[EvaluationResult]] = field(default_factory=list)
+
+
+class EvaluationServer:
+    """Long-lived asyncio server that answers evaluation, tournament and regression requests.
+
+    The package and engine tables are loaded once, and concurrent evaluation
+    requests are coalesced into evaluator batches (see ``ServeConfig``).
+    """
+
+    def __init__(self, config: ServeConfig | None = None) -> None:
+        self.config = config or ServeConfig()
+        self._server: asyncio.AbstractServer | None = None
+        self._executor: Executor | None = None
+        self._pending: dict[BatchKey, _PendingBatch] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._in_flight_batches = 0
+        self._latencies: deque[float] = deque(maxlen=self.config.latency_window)
+        self._counts = {"requests": 0, "errors": 0, "batches": 0, "batched_evaluations": 0}
+        self._stopped = asyncio.Event()
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+
+    @property
+    def address(self) -> str:
+        """``unix:<path>`` or ``<host>:<port>`` once started."""
+
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        if self.config.socket_path is not None:
+            return f"unix:{self.config.socket_path}"
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"{host}:{port}"
+
+    async def start(self) -> None:
+        if self.config.workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.config.workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        if self.config.socket_path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self.config.socket_path), limit=MAX_MESSAGE_BYTES
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_connection, host=self.config.host, port=self.config.port, limit=MAX_MESSAGE_BYTES
+            )
+
+    async def wait_closed(self) -> None:
+        """Block until a ``shutdown`` request arrives or ``close`` is called, then release resources."""
+
+        await self._stopped.wait()
+        if self._server is not None:
+            # Not ``wait_closed``: on newer Pythons it also waits for idle client connections.
+            self._server.close()
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self.config.socket_path is not None:
+            Path(self.config.socket_path).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self._stopped.set()
+
+    def stats(self) -> dict[str, object]:
+        latencies = sorted(self._latencies)
+        return {
+            **self._counts,
+            "queue_depth": sum(len(batch.strategies) for batch in self._pending.values()),
+            "in_flight_batches": self._in_flight_batches,
+            "mean_batch_size": (
+                self._counts["batched_evaluations"] / self._counts["batches"] if self._counts["batches"] else 0.0
+            ),
+            "latency_ms": {
+                "count": len(latencies),
+                "mean": statistics.fmean(latencies) if latencies else 0.0,
+                "p50": _percentile(latencies, 0.50),
+                "p90": _percentile(latencies, 0.90),
+                "p99": _percentile(latencies, 0.99),
+            },
+        }
+
+    async def handle_request(self, request: dict[str, object]) -> dict[str, object]:
+        """Answer one decoded request; failures become ``{"ok": false, "error": ...}``."""
+
+        started = time.perf_counter()
+        self._counts["requests"] += 1
+        response: dict[str, object] = {"id": request.get("id"), "ok": True}
+        try:
+            op = request.get("op")
+            if op == "evaluate":
+                response["result"] = await self._evaluate(request)
+            elif op == "tournament":
+                response["result"] = await self._run(_tournament_summary, *_tournament_arguments(request))
+            elif op == "regression":
+                rounds, seed = int(request.get("rounds", 60)), int(request.get("seed", 11))
+                response["result"] = asdict(await self._run(_regression_checks, rounds, seed))
+            elif op == "stats":
+                response["result"] = self.stats()
+            elif op == "shutdown":
+                self.close()
+            else:
+                raise ValueError(f"unknown op {op!r}; expected one of {', '.join(OPERATIONS)}")
+        except Exception as error:  # every failure is reported to the caller, never dropped
+            self._counts["errors"] += 1
+            response = {"id": request.get("id"), "ok": False, "error": str(error)}
+        self._latencies.append((time.perf_counter() - started) * 1000)
+        return response
+
+    async def _evaluate(self, request: dict[str, object]) -> dict[str, object]:
+        strategy = HeuristicStrategy(**request["strategy"])  # type: ignore[arg-type]
+        evaluator = get_evaluator(str(request.get("evaluator", "synthetic")), request.get("opponent_pool", DEFAULT_OPPONENT_POOL))  # type: ignore[arg-type]
+        rounds = int(request.get("rounds", DEFAULT_EVAL_ROUNDS))  # type: ignore[arg-type]
+        if rounds <= 0:
+            raise ValueError("rounds must be positive")
+        seeds = [int(seed) for seed in request.get("seeds", [request.get("seed", 0)])]  # type: ignore[union-attr]
+        situations = _situation_names(request.get("situations"))
+
+        loop = asyncio.get_running_loop()
+        cells: list[tuple[str, int, asyncio.Future[EvaluationResult]]] = []
+        for situation in situations:
+            for seed in seeds:
+                future: asyncio.Future[EvaluationResult] = loop.create_future()
+                self._enqueue((evaluator.name, evaluator.opponent_pool, situation, rounds, seed), strategy, future)
+                cells.append((situation, seed, future))
+        results = [(situation, seed, await future) for situation, seed, future in cells]
+        return {
+            "results": [{"situation": situation, "seed": seed, **asdict(result)} for situation, seed, result in results],
+            "mean_fitness": statistics.fmean(result.fitness for _, _, result in results),
+        }
+
+    def _enqueue(self, key: BatchKey, strategy: HeuristicStrategy, future: asyncio.Future[EvaluationResult]) -> None:
+        batch = self._pending.setdefault(key, _PendingBatch())
+        batch.strategies.append(strategy)
+        batch.futures.append(future)
+        if len(batch.strategies) >= self.config.max_batch_size:
+            self._dispatch(key)
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.config.batch_window_ms / 1000, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        for key in list(self._pending):
+            self._dispatch(key)
+
+    def _dispatch(self, key: BatchKey) -> None:
+        batch = self._pending.pop(key)
+        # Identical strategies in one batch are scored once.
+        unique = list(dict.fromkeys(batch.strategies))
+        self._counts["batches"] += 1
+        self._counts["batched_evaluations"] += len(batch.strategies)
+        self._in_flight_batches += 1
+        task = asyncio.ensure_future(self._run(_evaluate_batch, *key, unique))
+
+        def deliver(done: asyncio.Future[list[EvaluationResult]]) -> None:
+            self._in_flight_batches -= 1
+            if done.cancelled():
+                for future in batch.futures:
+                    future.cancel()
+                return
+            error = done.exception()
+            by_strategy = {} if error is not None else dict(zip(unique, done.result()))
+            for strategy, future in zip(batch.strategies, batch.futures):
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(by_strategy[strategy])
+
+        task.add_done_callback(deliver)
+
+    async def _run(self, function: Callable[..., T], *arguments: object) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *arguments)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = asyncio.current_task()
+        if connection is not None:
+            self._connections[connection] = writer
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def answer(body: bytes, message_format: str) -> None:
+            try:
+                response = await self.handle_request(decode_message(body, message_format))
+            except ProtocolError as error:
+                self._counts["errors"] += 1
+                response = {"id": None, "ok": False, "error": str(error)}
+            async with write_lock:
+                writer.write(encode_message(response, message_format))
+                await writer.drain()
+
+        try:
+            first = await reader.read(1)
+            if not first:
+                return
+            message_format = detect_format(first)
+            try:
+                check_format(message_format)
+            except ProtocolError as error:
+                # Without msgpack no reply in the client's format is possible. Answer once in
+                # JSON, which a line-reading client can still show, and close the connection.
+                self._counts["errors"] += 1
+                writer.write(encode_message({"id": None, "ok": False, "error": str(error)}, JSON_FORMAT))
+                await writer.drain()
+                return
+            prefix = first
+            # Requests on one connection are answered concurrently so that a
+            # pipelining client gets its evaluations batched too; ``id`` pairs
+            # responses with requests.
+            while (body := await read_message(reader, message_format, prefix)) is not None:
+                prefix = b""
+                task = asyncio.ensure_future(answer(body, message_format))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (ProtocolError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+            if connection is not None:
+                self._connections.pop(connection, None)
+
+
+async def run_server(config: ServeConfig, *, on_ready: Callable[[str], None] | None = None) -> dict[str, object]:
+    """Serve until a ``shutdown`` request; ``on_ready(address)`` is called once listening. Returns final stats."""
+
+    server = EvaluationServer(config)
+    await server.start()
+    if on_ready is not None:
+        on_ready(server.address)
+    await server.wait_closed()
+    return server.stats()
+
+
+def _evaluate_batch(
+    evaluator_name: str,
+    opponent_pool: tuple[str, ...],
+    situation_name: str,
+    rounds: int,
+    seed: int,
+    strategies: list[HeuristicStrategy],
+) -> list[EvaluationResult]:
+    situation = _SITUATIONS_BY_NAME[situation_name]
+    return get_evaluator(evaluator_name, opponent_pool).evaluate_batch(strategies, situation, rounds, seed)
+
+
+def _tournament_arguments(request: dict[str, object]) -> tuple[tuple[str, ...], int, int]:
+    kinds = tuple(str(kind) for kind in request.get("agents", DEFAULT_TOURNAMENT_AGENTS))  # type: ignore[union-attr]
+    unknown = sorted(set(kinds) - set(OPPONENT_FACTORIES))
+    if len(kinds) < 2 or unknown:
+        raise ValueError(f"agents must name at least two of {sorted(OPPONENT_FACTORIES)}")
+    return kinds, int(request.get("rounds", 24)), int(request.get("seed", 7))  # type: ignore[arg-type]
+
+
+def _tournament_summary(kinds: tuple[str, ...], rounds: int, seed: int) -> dict[str, object]:
+    agents = [OPPONENT_FACTORIES[kind](f"{kind}_{index}") for index, kind in enumerate(kinds)]
+    result = run_tournament(agents, rounds=rounds, seed=seed)
+    summary = asdict(result)
+    summary.pop("rounds")
+    return {"rounds": rounds, "seed": seed, **summary}
+
+
+def _regression_checks(rounds: int, seed: int) -> RegressionCheckResult:
+    return run_regression_checks(rounds=rounds, seed=seed)
+
+
+def _situation_names(requested: object) -> tuple[str, ...]:
+    if requested is None:
+        return tuple(_SITUATIONS_BY_NAME)
+    names = tuple(str(name) for name in requested)  # type: ignore[union-attr]
+    unknown = sorted(set(names) - set(_SITUATIONS_BY_NAME))
+    if not names or unknown:
+        raise ValueError(f"situations must be names from {sorted(_SITUATIONS_BY_NAME)}")
+    return names
+
+
+_SITUATIONS_BY_NAME = {situation.name: situation for situation in DEFAULT_SITUATIONS}
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
@@ -1,28 +1,70 @@
-from .baseline import (
-    BaselineAgent,
-    RandomAgent,
-    RoundResult,
-    SimpleHeuristicAgent,
-    TournamentResult,
-    run_round,
-    run_tournament,
-)
-from .evaluator import EvaluationResult, evaluate_strategy
-from .regression import RegressionCheckResult, run_regression_checks
-from .scenarios import DEFAULT_SITUATIONS, GameSituation
+from skyjo_optimizer._lazy import lazy_exports
 
-__all__ = [
-    "BaselineAgent",
-    "DEFAULT_SITUATIONS",
-    "EvaluationResult",
-    "GameSituation",
-    "RandomAgent",
-    "RegressionCheckResult",
-    "RoundResult",
-    "SimpleHeuristicAgent",
-    "TournamentResult",
-    "evaluate_strategy",
-    "run_regression_checks",
-    "run_round",
-    "run_tournament",
-]
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from .baseline import (
+        BaselineAgent,
+        RandomAgent,
+        RoundResult,
+        SimpleHeuristicAgent,
+        TournamentResult,
+        play_out,
+        play_round,
+        run_round,
+        run_tournament,
+        score_round,
+        summarize_tournament,
+        tournament_rounds,
+        tournament_seatings,
+        tournament_seeds,
+    )
+    from .backends import EVALUATOR_NAMES, EvaluatorBackend, get_evaluator
+    from .bootstrap import TournamentIntervals, bootstrap_intervals, default_replicates
+    from .engine_evaluator import StrategyAgent, situation_setup
+    from .evaluator import EvaluationResult, PairedComparison, compare_paired, evaluate_strategy, score_samples
+    from .regression import RegressionCheckResult, run_regression_checks
+    from .rule_sweep import RuleSweepResult, VariantResult, rule_variants, run_rule_sweep
+    from .scenarios import DEFAULT_SITUATIONS, GameSituation
+
+_EXPORTS: dict[str, str] = {
+    "BaselineAgent": ".baseline",
+    "DEFAULT_SITUATIONS": ".scenarios",
+    "EVALUATOR_NAMES": ".backends",
+    "EvaluationResult": ".evaluator",
+    "EvaluatorBackend": ".backends",
+    "GameSituation": ".scenarios",
+    "PairedComparison": ".evaluator",
+    "RandomAgent": ".baseline",
+    "RegressionCheckResult": ".regression",
+    "RoundResult": ".baseline",
+    "RuleSweepResult": ".rule_sweep",
+    "SimpleHeuristicAgent": ".baseline",
+    "StrategyAgent": ".engine_evaluator",
+    "TournamentIntervals": ".bootstrap",
+    "TournamentResult": ".baseline",
+    "VariantResult": ".rule_sweep",
+    "bootstrap_intervals": ".bootstrap",
+    "compare_paired": ".evaluator",
+    "default_replicates": ".bootstrap",
+    "evaluate_strategy": ".evaluator",
+    "get_evaluator": ".backends",
+    "play_out": ".baseline",
+    "play_round": ".baseline",
+    "rule_variants": ".rule_sweep",
+    "run_regression_checks": ".regression",
+    "run_round": ".baseline",
+    "run_rule_sweep": ".rule_sweep",
+    "run_tournament": ".baseline",
+    "score_round": ".baseline",
+    "score_samples": ".evaluator",
+    "situation_setup": ".engine_evaluator",
+    "summarize_tournament": ".baseline",
+    "tournament_rounds": ".baseline",
+    "tournament_seatings": ".baseline",
+    "tournament_seeds": ".baseline",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import DealBank
+from skyjo_optimizer.simulation import profiling
+from skyjo_optimizer.simulation.engine_evaluator import DEFAULT_OPPONENT_POOL, OPPONENT_FACTORIES, engine_score_batch
+from skyjo_optimizer.simulation.evaluator import EvaluationResult, _result_from_samples, score_samples
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+EVALUATOR_NAMES: tuple[str, ...] = ("synthetic", "engine")
+
+
+@dataclass(frozen=True)
+class EvaluatorBackend:
+    """Source of per-round scores for strategy evaluation.
+
+    ``synthetic`` uses the closed-form score model in ``evaluator``; ``engine``
+    plays real rounds against ``opponent_pool``. Both return the same
+    ``EvaluationResult`` for the same ``(strategy, situation, rounds, seed)``
+    every time. An ``engine`` backend takes banked deals from ``deal_bank``
+    when it has them, which changes speed but not results.
+    """
+
+    name: str = "synthetic"
+    opponent_pool: tuple[str, ...] = DEFAULT_OPPONENT_POOL
+    deal_bank: DealBank | None = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.name not in EVALUATOR_NAMES:
+            raise ValueError(f"unknown evaluator: {self.name!r}")
+        unknown = set(self.opponent_pool) - set(OPPONENT_FACTORIES)
+        if not self.opponent_pool or unknown:
+            raise ValueError(f"invalid opponent pool: {self.opponent_pool!r}")
+
+    @property
+    def key(self) -> str:
+        """Identifies the score source in fitness caches, e.g. ``engine[heuristic,random]``."""
+
+        if self.name == "synthetic":
+            return "synthetic"
+        return f"{self.name}[{','.join(self.opponent_pool)}]"
+
+    def score_batch(
+        self,
+        strategies: list[HeuristicStrategy],
+        situation: GameSituation,
+        rounds: int,
+        seed: int,
+    ) -> list[list[float]]:
+        """Per-round scores for each strategy; strategies in one batch share the seed."""
+
+        profile = profiling.ACTIVE
+        started = perf_counter() if profile is not None else 0.0
+        if self.name == "engine":
+            samples = engine_score_batch(
+                strategies, situation, rounds, seed, opponent_pool=self.opponent_pool, deal_bank=self.deal_bank
+            )
+        else:
+            samples = [score_samples(strategy, situation, rounds, seed) for strategy in strategies]
+        if profile is not None:
+            profile.add("evaluation", perf_counter() - started, len(strategies))
+        return samples
+
+    def evaluate_batch(
+        self,
+        strategies: list[HeuristicStrategy],
+        situation: GameSituation,
+        rounds: int,
+        seed: int,
+    ) -> list[EvaluationResult]:
+        return [_result_from_samples(situation, row) for row in self.score_batch(strategies, situation, rounds, seed)]
+
+    def evaluate(
+        self,
+        strategy: HeuristicStrategy,
+        situation: GameSituation,
+        rounds: int,
+        seed: int,
+    ) -> EvaluationResult:
+        return self.evaluate_batch([strategy], situation, rounds, seed)[0]
+
+
+def get_evaluator(
+    name: str = "synthetic",
+    opponent_pool: str | tuple[str, ...] = DEFAULT_OPPONENT_POOL,
+    deal_bank: DealBank | None = None,
+) -> EvaluatorBackend:
+    """Build a backend; ``opponent_pool`` may be a comma-separated string."""
+
+    if isinstance(opponent_pool, str):
+        opponent_pool = tuple(kind.strip() for kind in opponent_pool.split(",") if kind.strip())
+    return EvaluatorBackend(name=name, opponent_pool=opponent_pool, deal_bank=deal_bank)
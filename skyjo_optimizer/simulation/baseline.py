@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from itertools import combinations
 from dataclasses import dataclass
 from random import Random
 from statistics import mean, median
+from time import perf_counter
 
-from skyjo_optimizer.engine import Action, RoundState, RulesConfig, apply_action, initialize_round, is_round_over, legal_actions
+from skyjo_optimizer.engine import Action, DealBank, RoundState, RulesConfig, apply_action, deal_round, is_round_over, legal_actions
+from skyjo_optimizer.engine.board import board_geometry, cleared_slots
+from skyjo_optimizer.simulation import profiling
+from skyjo_optimizer.simulation.stats import percentile
 
 
 @dataclass(frozen=True)
@@ -83,13 +88,99 @@ def run_round(
     seed: int,
     rules: RulesConfig | None = None,
     max_turns: int = 1000,
+    deal_bank: DealBank | None = None,
 ) -> RoundResult:
+    """Deal a round from ``seed`` (or take it from ``deal_bank``) and play it.
+
+    Tables of only ``RandomAgent`` and ``SimpleHeuristicAgent`` play through
+    the array kernels in ``engine.kernels`` (compiled when Numba is installed);
+    the result is the same as the object engine's. While profiling, such a
+    round is timed as a whole under ``kernel_round``, since its decisions and
+    steps run inside one kernel call.
+    """
+
     if len(agents) < 2:
         raise ValueError("at least two agents are required")
 
     config = rules or RulesConfig()
-    state = initialize_round(config, player_count=len(agents), seed=seed)
-    rng = Random(seed)
+    profile = profiling.ACTIVE
+    started = perf_counter() if profile is not None else 0.0
+    state = deal_round(config, len(agents), seed, deal_bank)
+    if profile is not None:
+        profile.add("deal_setup", perf_counter() - started)
+    policies = _kernel_policies(agents)
+    if policies is None:
+        return play_round(agents, state, rng=Random(seed), max_turns=max_turns)
+    if profile is None:
+        return _play_round_kernels(agents, policies, state, rng=Random(seed), max_turns=max_turns)
+    started = perf_counter()
+    result = _play_round_kernels(agents, policies, state, rng=Random(seed), max_turns=max_turns)
+    profile.add("kernel_round", perf_counter() - started)
+    profile.turns += result.turns
+    profile.rounds += 1
+    return result
+
+
+# Seat policies of ``engine.kernels`` (``POLICY_RANDOM``, ``POLICY_HEURISTIC``) by agent
+# type; exact types only, since a subclass may override ``choose_action``.
+KERNEL_POLICIES: dict[type, int] = {RandomAgent: 0, SimpleHeuristicAgent: 1}
+
+
+def _kernel_policies(agents: list[BaselineAgent]) -> list[int] | None:
+    # Imported here so Numba's import cost is only paid by simulations.
+    from skyjo_optimizer.engine import kernels
+
+    # Scores are keyed by name, so repeated names fall back to the object engine's merging.
+    if not kernels.ENABLED or len({agent.name for agent in agents}) != len(agents):
+        return None
+    policies = [KERNEL_POLICIES.get(type(agent)) for agent in agents]
+    return None if None in policies else policies  # type: ignore[return-value]
+
+
+def _play_round_kernels(
+    agents: list[BaselineAgent],
+    policies: list[int],
+    state: RoundState,
+    *,
+    rng: Random,
+    max_turns: int,
+) -> RoundResult:
+    from skyjo_optimizer.engine.kernels import kernel_round
+
+    seat_scores, turns = kernel_round(policies, state, rng=rng, max_turns=max_turns)
+    scores = {agent.name: score for agent, score in zip(agents, seat_scores)}
+    best_score = min(scores.values())
+    winners = tuple(sorted(name for name, score in scores.items() if score == best_score))
+    return RoundResult(scores_by_agent=scores, winner_names=winners, turns=turns)
+
+
+def play_round(
+    agents: list[BaselineAgent],
+    state: RoundState,
+    *,
+    rng: Random,
+    max_turns: int = 1000,
+) -> RoundResult:
+    """Play an already dealt round to completion and score it.
+
+    ``run_round`` deals from a seed; callers that replay the same deal for many
+    seatings (such as batched evaluators) deal once and call this directly.
+    """
+
+    profile = profiling.ACTIVE
+    if profile is not None:
+        return _play_round_profiled(agents, state, rng=rng, max_turns=max_turns, profile=profile)
+    return score_round(agents, play_out(agents, state, rng=rng, max_turns=max_turns))
+
+
+def play_out(
+    agents: list[BaselineAgent],
+    state: RoundState,
+    *,
+    rng: Random,
+    max_turns: int = 1000,
+) -> RoundState:
+    """Play a dealt round to its final state without scoring it."""
 
     for _ in range(max_turns):
         if is_round_over(state):
@@ -98,6 +189,50 @@ def run_round(
         state = apply_action(state, action)
     else:
         raise RuntimeError("round exceeded max_turns without termination")
+    return state
+
+
+def _play_round_profiled(
+    agents: list[BaselineAgent],
+    state: RoundState,
+    *,
+    rng: Random,
+    max_turns: int,
+    profile: profiling.HotPathProfile,
+) -> RoundResult:
+    """``play_round`` with per-turn timers; kept separate so the default loop has no checks."""
+
+    decision_seconds = 0.0
+    step_seconds = 0.0
+    turns = 0
+    for _ in range(max_turns):
+        if is_round_over(state):
+            break
+        started = perf_counter()
+        actions = legal_actions(state)
+        decided = perf_counter()
+        action = agents[state.active_player].choose_action(state, actions, rng)
+        stepped = perf_counter()
+        state = apply_action(state, action)
+        finished = perf_counter()
+        step_seconds += (decided - started) + (finished - stepped)
+        decision_seconds += stepped - decided
+        turns += 1
+    else:
+        raise RuntimeError("round exceeded max_turns without termination")
+
+    profile.add("agent_decision", decision_seconds, turns)
+    profile.add("engine_step", step_seconds, turns)
+    profile.turns += turns
+    profile.rounds += 1
+    started = perf_counter()
+    result = score_round(agents, state)
+    profile.add("scoring", perf_counter() - started)
+    return result
+
+
+def score_round(agents: list[BaselineAgent], state: RoundState) -> RoundResult:
+    """Score a finished round under ``state.rules``; ``agents`` are in seat order."""
 
     scores = {
         agent.name: _score_player(state, idx)
@@ -116,9 +251,83 @@ def run_tournament(
     rounds: int,
     seed: int,
     rules: RulesConfig | None = None,
+    deal_bank: DealBank | None = None,
+    table_size: int | None = None,
 ) -> TournamentResult:
+    """Play ``rounds`` rounds with every agent seated, or ``rounds`` per table of ``table_size``.
+
+    With ``table_size`` below ``len(agents)`` every combination of that many
+    agents plays its own rounds (see ``tournament_seatings``), so adding an agent
+    only adds tables. Statistics are then per round played and per shared round.
+    """
+
     if rounds <= 0:
         raise ValueError("rounds must be positive")
+    if table_size is None or table_size == len(agents):
+        round_results = tournament_rounds(agents, range(rounds), seed=seed, rules=rules, deal_bank=deal_bank)
+    else:
+        round_results = [
+            run_round(seating, seed=round_seed, rules=rules, deal_bank=deal_bank)
+            for seating, round_seed in tournament_seatings(agents, rounds=rounds, seed=seed, table_size=table_size)
+        ]
+    return summarize_tournament(agents, round_results)
+
+
+def tournament_rounds(
+    agents: list[BaselineAgent],
+    round_indices: range,
+    *,
+    seed: int,
+    rules: RulesConfig | None = None,
+    deal_bank: DealBank | None = None,
+) -> list[RoundResult]:
+    """Rounds ``round_indices`` of ``run_tournament``; any split of the index range replays the same rounds."""
+
+    return [
+        run_round(rotate_agents(agents, round_index), seed=round_seed, rules=rules, deal_bank=deal_bank)
+        for round_index, round_seed in zip(round_indices, tournament_seeds(round_indices, seed))
+    ]
+
+
+def tournament_seeds(round_indices: range, seed: int) -> list[int]:
+    """Deal seeds of ``run_tournament`` rounds, e.g. for building a deal bank."""
+
+    return [seed + round_index * 13 for round_index in round_indices]
+
+
+def tournament_seatings(
+    agents: list[BaselineAgent],
+    *,
+    rounds: int,
+    seed: int,
+    table_size: int,
+) -> list[tuple[list[BaselineAgent], int]]:
+    """``(seating, deal seed)`` for every round of a ``table_size`` tournament, in play order.
+
+    Tables are the combinations of ``table_size`` agents in list order; each
+    plays the rounds and rotations a full tournament of that table would. A
+    table's rounds depend only on its members, never on the other agents.
+    """
+
+    if not 2 <= table_size <= len(agents):
+        raise ValueError("table_size must be between 2 and the number of agents")
+    seeds = tournament_seeds(range(rounds), seed)
+    return [
+        (rotate_agents(list(table), round_index), seeds[round_index])
+        for table in combinations(agents, table_size)
+        for round_index in range(rounds)
+    ]
+
+
+def summarize_tournament(agents: list[BaselineAgent], round_results: list[RoundResult]) -> TournamentResult:
+    """Aggregate per-round results, given in round order, into a ``TournamentResult``.
+
+    Win rates are per round an agent played and matrix entries per round both
+    agents shared, which for full tables is simply per round.
+    """
+
+    if not round_results:
+        raise ValueError("rounds must be positive")
 
     per_agent_scores: dict[str, list[int]] = {agent.name: [] for agent in agents}
     wins: dict[str, float] = {agent.name: 0.0 for agent in agents}
@@ -126,35 +335,36 @@ def run_tournament(
         agent.name: {other.name: 0.0 for other in agents if other.name != agent.name}
         for agent in agents
     }
+    shared_rounds: dict[str, dict[str, int]] = {name: dict.fromkeys(row, 0) for name, row in matrix_counts.items()}
 
-    round_results: list[RoundResult] = []
-    for round_index in range(rounds):
-        seating = _rotate_agents(agents, round_index)
-        result = run_round(seating, seed=seed + round_index * 13, rules=rules)
-        round_results.append(result)
-
-        for name, score in result.scores_by_agent.items():
+    for result in round_results:
+        scores = result.scores_by_agent
+        for name, score in scores.items():
             per_agent_scores[name].append(score)
 
         share = 1.0 / len(result.winner_names)
         for winner in result.winner_names:
             wins[winner] += share
-        for a_name in wins:
-            for b_name in matrix_counts[a_name]:
-                if result.scores_by_agent[a_name] < result.scores_by_agent[b_name]:
-                    matrix_counts[a_name][b_name] += 1.0
-                elif result.scores_by_agent[a_name] == result.scores_by_agent[b_name]:
-                    matrix_counts[a_name][b_name] += 0.5
+        for a_name in scores:
+            row = matrix_counts[a_name]
+            for b_name in scores:
+                if b_name == a_name:
+                    continue
+                shared_rounds[a_name][b_name] += 1
+                if scores[a_name] < scores[b_name]:
+                    row[b_name] += 1.0
+                elif scores[a_name] == scores[b_name]:
+                    row[b_name] += 0.5
 
     mean_scores = {name: mean(scores) for name, scores in per_agent_scores.items()}
     median_scores = {name: median(scores) for name, scores in per_agent_scores.items()}
     tail95_scores = {
-        name: _percentile(scores, 0.95)
+        name: percentile(scores, 0.95)
         for name, scores in per_agent_scores.items()
     }
-    win_rates = {name: value / rounds for name, value in wins.items()}
+    win_rates = {name: value / len(per_agent_scores[name]) for name, value in wins.items()}
     matrix = {
-        a_name: {b_name: value / rounds for b_name, value in row.items()}
+        a_name: {b_name: value / shared_rounds[a_name][b_name] for b_name, value in row.items()}
         for a_name, row in matrix_counts.items()
     }
 
@@ -168,7 +378,9 @@ def run_tournament(
     )
 
 
-def _rotate_agents(agents: list[BaselineAgent], shift: int) -> list[BaselineAgent]:
+def rotate_agents(agents: list[BaselineAgent], shift: int) -> list[BaselineAgent]:
+    """Seat order for round ``shift``: ``agents`` rotated left by ``shift`` seats."""
+
     offset = shift % len(agents)
     return agents[offset:] + agents[:offset]
 
@@ -185,18 +397,7 @@ def _score_player(state: RoundState, player_index: int) -> int:
 
 def _removed_column_slots(state: RoundState, player_index: int) -> set[int]:
     player = state.players[player_index]
-    if len(player.slots) != 12:
-        return set()
-
-    removed: set[int] = set()
-    for column_start in range(4):
-        column_indices = (column_start, column_start + 4, column_start + 8)
-        if not all(index in player.face_up for index in column_indices):
-            continue
-        values = {state.cards[player.slots[index]].value for index in column_indices}
-        if len(values) == 1:
-            removed.update(column_indices)
-    return removed
+    return cleared_slots(board_geometry(state.rules), player.slots, player.face_up, state.cards)
 
 
 def _apply_ender_penalty_if_needed(state: RoundState, agents: list[BaselineAgent], scores: dict[str, int]) -> None:
@@ -207,15 +408,3 @@ def _apply_ender_penalty_if_needed(state: RoundState, agents: list[BaselineAgent
     lowest = min(scores.values())
     if scores[ender_name] != lowest or list(scores.values()).count(lowest) > 1:
         scores[ender_name] *= 2
-
-
-def _percentile(values: list[int], q: float) -> float:
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return float(ordered[0])
-
-    target = (len(ordered) - 1) * q
-    low = int(target)
-    high = min(low + 1, len(ordered) - 1)
-    weight = target - low
-    return ordered[low] * (1 - weight) + ordered[high] * weight
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import importlib.util
+import math
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
+from itertools import accumulate
+from random import Random
+
+from skyjo_optimizer.simulation.baseline import TournamentResult
+from skyjo_optimizer.simulation.stats import percentile
+
+DEFAULT_REPLICATES = 1000
+# The pure-Python resampler suits small tournaments only, so it draws fewer by default.
+PYTHON_REPLICATES = 200
+DEFAULT_CONFIDENCE = 0.95
+
+Interval = tuple[float, float]
+
+
+@dataclass(frozen=True)
+class TournamentIntervals:
+    """Percentile bootstrap intervals for every ``TournamentResult`` metric."""
+
+    replicates: int
+    confidence: float
+    mean_score_by_agent: dict[str, Interval]
+    median_score_by_agent: dict[str, Interval]
+    tail95_score_by_agent: dict[str, Interval]
+    win_rate_by_agent: dict[str, Interval]
+    win_rate_matrix: dict[str, dict[str, Interval]]
+
+    def to_dict(self) -> dict[str, object]:
+        """JSON form; intervals become ``[low, high]`` lists."""
+
+        data: dict[str, object] = {"replicates": self.replicates, "confidence": self.confidence}
+        for metric in ("mean_score_by_agent", "median_score_by_agent", "tail95_score_by_agent", "win_rate_by_agent"):
+            data[metric] = {name: list(interval) for name, interval in getattr(self, metric).items()}
+        data["win_rate_matrix"] = {
+            name: {other: list(interval) for other, interval in row.items()} for name, row in self.win_rate_matrix.items()
+        }
+        return data
+
+
+def default_replicates() -> int:
+    """``DEFAULT_REPLICATES`` with NumPy installed, else ``PYTHON_REPLICATES``."""
+
+    return DEFAULT_REPLICATES if importlib.util.find_spec("numpy") is not None else PYTHON_REPLICATES
+
+
+def bootstrap_intervals(
+    result: TournamentResult,
+    *,
+    replicates: int = DEFAULT_REPLICATES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    seed: int = 0,
+) -> TournamentIntervals:
+    """Bootstrap ``result``'s metrics by resampling its rounds with replacement.
+
+    Every metric depends only on how often each distinct per-round value (a
+    score, a win share, a head-to-head outcome) occurs, so a replicate is drawn
+    as multinomial counts over those values instead of materializing resampled
+    rounds; the replicate statistics are exactly those of resampled rounds.
+    With NumPy all replicates of a metric are drawn and reduced in one
+    vectorized pass; without it a pure-Python loop gives the same intervals up
+    to random variation, which is fine for small tournaments.
+    """
+
+    if replicates < 2:
+        raise ValueError("replicates must be at least 2")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+
+    names = list(result.mean_score_by_agent)
+    scores: dict[str, list[float]] = {name: [] for name in names}
+    win_shares: dict[str, list[float]] = {name: [] for name in names}
+    outcomes: dict[str, dict[str, list[float]]] = {name: {} for name in names}
+    for round_result in result.rounds:
+        round_scores = round_result.scores_by_agent
+        share = 1.0 / len(round_result.winner_names)
+        for name, score in round_scores.items():
+            scores[name].append(score)
+            win_shares[name].append(share if name in round_result.winner_names else 0.0)
+            row = outcomes[name]
+            for other, other_score in round_scores.items():
+                if other != name:
+                    row.setdefault(other, []).append(
+                        1.0 if score < other_score else 0.5 if score == other_score else 0.0
+                    )
+
+    resampler = _numpy_resampler(seed) or _python_resampler(seed)
+    tails = ((1 - confidence) / 2, (1 + confidence) / 2)
+    mean, median, tail95 = {}, {}, {}
+    for name in names:
+        mean[name], median[name], tail95[name] = resampler(scores[name], replicates, (None, 0.5, 0.95), tails)
+    win_rates = {name: resampler(win_shares[name], replicates, (None,), tails)[0] for name in names}
+    matrix = {
+        name: {
+            other: resampler(outcomes[name][other], replicates, (None,), tails)[0]
+            for other in result.win_rate_matrix[name]
+        }
+        for name in names
+    }
+    return TournamentIntervals(
+        replicates=replicates,
+        confidence=confidence,
+        mean_score_by_agent=mean,
+        median_score_by_agent=median,
+        tail95_score_by_agent=tail95,
+        win_rate_by_agent=win_rates,
+        win_rate_matrix=matrix,
+    )
+
+
+# A resampler maps (samples, replicates, statistics, interval tails) to one
+# interval per statistic; a statistic is ``None`` for the mean or a quantile.
+def _numpy_resampler(seed: int):  # type: ignore[no-untyped-def]
+    try:
+        import numpy
+    except ImportError:
+        return None
+    generator = numpy.random.default_rng(seed)
+
+    def resample(
+        samples: list[float], replicates: int, statistics: tuple[float | None, ...], tails: Interval
+    ) -> list[Interval]:
+        values, frequencies = numpy.unique(numpy.asarray(samples, dtype=float), return_counts=True)
+        size = len(samples)
+        counts = generator.multinomial(size, frequencies / size, size=replicates)
+        cumulative = counts.cumsum(axis=1)
+        intervals = []
+        for statistic in statistics:
+            if statistic is None:
+                estimates = counts @ values / size
+            else:
+                # Linear interpolation between order statistics, as ``percentile`` does.
+                position = (size - 1) * statistic
+                low = math.floor(position)
+                high = min(low + 1, size - 1)
+                low_values = values[(cumulative <= low).sum(axis=1)]
+                high_values = values[(cumulative <= high).sum(axis=1)]
+                estimates = low_values + (high_values - low_values) * (position - low)
+            lower, upper = numpy.quantile(estimates, tails)
+            intervals.append((float(lower), float(upper)))
+        return intervals
+
+    return resample
+
+
+def _python_resampler(seed: int):  # type: ignore[no-untyped-def]
+    rng = Random(seed)
+
+    def resample(
+        samples: list[float], replicates: int, statistics: tuple[float | None, ...], tails: Interval
+    ) -> list[Interval]:
+        frequencies = Counter(samples)
+        values = sorted(frequencies)
+        cumulative_weights = list(accumulate(frequencies[value] for value in values))
+        size = len(samples)
+        estimates: list[list[float]] = [[] for _ in statistics]
+        for _ in range(replicates):
+            drawn = Counter(rng.choices(range(len(values)), cum_weights=cumulative_weights, k=size))
+            cumulative = list(accumulate(drawn[index] for index in range(len(values))))
+            for column, statistic in zip(estimates, statistics):
+                if statistic is None:
+                    column.append(sum(values[index] * count for index, count in drawn.items()) / size)
+                    continue
+                position = (size - 1) * statistic
+                low = math.floor(position)
+                low_value = values[bisect_right(cumulative, low)]
+                high_value = values[bisect_right(cumulative, min(low + 1, size - 1))]
+                column.append(low_value + (high_value - low_value) * (position - low))
+        return [(percentile(column, tails[0]), percentile(column, tails[1])) for column in estimates]  # type: ignore[arg-type]
+
+    return resample
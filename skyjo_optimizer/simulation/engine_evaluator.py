@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from random import Random
+from time import perf_counter
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import Action, DealBank, RoundState, RulesConfig, deal_round
+from skyjo_optimizer.engine.board import BoardGeometry, board_geometry
+from skyjo_optimizer.engine.config import DEFAULT_DECK_COMPOSITION
+from skyjo_optimizer.engine.deal_bank import DealTableSpec
+from skyjo_optimizer.simulation import profiling
+from skyjo_optimizer.simulation.baseline import BaselineAgent, RandomAgent, SimpleHeuristicAgent, play_round
+from skyjo_optimizer.simulation.scenarios import GameSituation
+
+OPPONENT_FACTORIES: dict[str, type[BaselineAgent]] = {
+    "heuristic": SimpleHeuristicAgent,
+    "random": RandomAgent,
+}
+# Ordered from steady to volatile; volatile tables seat more of the last entry.
+DEFAULT_OPPONENT_POOL: tuple[str, ...] = ("heuristic", "random")
+
+# Throughput target for the engine backend: at least 10 evaluations/s per core
+# at 120 rounds per evaluation (about 1,200 two-to-four player rounds/s).
+TARGET_EVALUATIONS_PER_SECOND = 10.0
+
+
+class StrategyAgent(BaselineAgent):
+    """Plays real rounds using ``HeuristicStrategy`` weights.
+
+    - ``risk_tolerance`` makes hidden cards look cheaper, so risky players keep them longer.
+    - ``discard_aggression`` lowers the gain needed before taking the discard.
+    - ``column_focus`` rewards placing a card next to matching face-up cards in its column.
+    - ``reveal_priority`` favors flipping hidden cards over blind swaps into high cards.
+    """
+
+    def __init__(self, name: str, strategy: HeuristicStrategy) -> None:
+        super().__init__(name)
+        self.strategy = strategy.clipped()
+
+    def choose_action(self, state: RoundState, actions: list[Action], rng: Random) -> Action:
+        strategy = self.strategy
+        player = state.players[state.active_player]
+        values = [state.cards[card_id].value for card_id in player.slots]
+        face_up = player.face_up
+        expected = _expected_card_value(state.rules)
+        hidden_value = expected + (0.5 - strategy.risk_tolerance) * 4.0
+        discard = state.cards[state.discard_pile[-1]].value
+
+        column_weight = strategy.column_focus * 6.0
+        geometry = board_geometry(state.rules)
+        partners = geometry.column_partners if geometry.clears_columns and column_weight else None
+        best_slot = 0
+        best_gain = float("-inf")
+        for slot_index, value in enumerate(values):
+            current = value if slot_index in face_up else hidden_value
+            gain = current - discard
+            if partners is not None:
+                gain += column_weight * _column_match(partners[slot_index], discard, values, face_up)
+            if gain > best_gain:
+                best_slot, best_gain = slot_index, gain
+        if best_gain > (1.0 - strategy.discard_aggression) * 4.0:
+            return Action(kind="take_discard_swap", slot_index=best_slot)
+
+        hidden = [slot_index for slot_index in range(len(values)) if slot_index not in face_up]
+        if face_up:
+            worst_slot = max(face_up, key=lambda slot_index: (values[slot_index], -slot_index))
+            swap_gain = values[worst_slot] - expected
+            if not hidden or swap_gain > strategy.reveal_priority * 6.0:
+                return Action(kind="draw_swap", slot_index=worst_slot)
+        if hidden:
+            return Action(kind="draw_discard_flip", slot_index=_flip_target(hidden, face_up, geometry, strategy))
+        return Action(kind="draw_swap", slot_index=best_slot)
+
+
+def situation_setup(
+    situation: GameSituation,
+    opponent_pool: tuple[str, ...] = DEFAULT_OPPONENT_POOL,
+) -> tuple[RulesConfig, tuple[str, ...]]:
+    """Map a ``GameSituation`` onto rules and opponent seats.
+
+    - ``deck_richness`` shifts deck counts from the 10-12 cards towards -2..0.
+    - ``endgame_pressure`` raises ``starting_face_up_cards`` from 2 up to 4.
+    - ``opponent_aggression`` seats 1 to 3 opponents.
+    - ``volatility`` is the share of opponents drawn from the volatile end of the pool.
+    """
+
+    if not opponent_pool:
+        raise ValueError("opponent_pool must not be empty")
+    unknown = set(opponent_pool) - set(OPPONENT_FACTORIES)
+    if unknown:
+        raise ValueError(f"unknown opponent kinds: {sorted(unknown)}")
+
+    low_scale = 0.5 + situation.deck_richness
+    high_scale = 1.5 - situation.deck_richness
+    deck = {
+        value: max(1, round(count * (low_scale if value <= 0 else high_scale if value >= 10 else 1.0)))
+        for value, count in DEFAULT_DECK_COMPOSITION.items()
+    }
+    rules = RulesConfig(
+        starting_face_up_cards=2 + round(situation.endgame_pressure * 2),
+        deck_composition=deck,
+    )
+
+    opponent_count = 1 + round(situation.opponent_aggression * 2)
+    volatile_count = round(situation.volatility * opponent_count)
+    steady = opponent_pool[:-1] or opponent_pool
+    opponents = tuple(
+        opponent_pool[-1] if seat >= opponent_count - volatile_count else steady[seat % len(steady)]
+        for seat in range(opponent_count)
+    )
+    return rules, opponents
+
+
+def engine_score_batch(
+    strategies: list[HeuristicStrategy],
+    situation: GameSituation,
+    rounds: int,
+    seed: int,
+    *,
+    opponent_pool: tuple[str, ...] = DEFAULT_OPPONENT_POOL,
+    deal_bank: DealBank | None = None,
+) -> list[list[float]]:
+    """Per-round scores for each strategy, all played on the same deals.
+
+    Round ``r`` is dealt from the ``r``-th seed drawn from ``Random(seed)`` and
+    the strategy sits in seat ``r % players``. Deals are built once (or read
+    from ``deal_bank``) and shared by every strategy in the batch, which also
+    gives common random numbers.
+    """
+
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+
+    rules, opponent_kinds = situation_setup(situation, opponent_pool)
+    player_count = len(opponent_kinds) + 1
+    round_seeds = engine_round_seeds(seed, rounds)
+    profile = profiling.ACTIVE
+    started = perf_counter() if profile is not None else 0.0
+    deals = [deal_round(rules, player_count, round_seed, deal_bank) for round_seed in round_seeds]
+    if profile is not None:
+        profile.add("deal_setup", perf_counter() - started, rounds)
+    opponents = [OPPONENT_FACTORIES[kind](f"opponent_{seat}") for seat, kind in enumerate(opponent_kinds)]
+
+    samples: list[list[float]] = []
+    for strategy in strategies:
+        agent = StrategyAgent("candidate", strategy)
+        row: list[float] = []
+        for round_index, (round_seed, deal) in enumerate(zip(round_seeds, deals)):
+            seat = round_index % player_count
+            seating = opponents[:seat] + [agent] + opponents[seat:]
+            result = play_round(seating, deal, rng=Random(round_seed))
+            row.append(float(result.scores_by_agent["candidate"]))
+        samples.append(row)
+    return samples
+
+
+def engine_round_seeds(seed: int, rounds: int) -> list[int]:
+    seed_rng = Random(seed)
+    return [seed_rng.randrange(2**31) for _ in range(rounds)]
+
+
+def engine_deal_tables(
+    situations: Sequence[GameSituation],
+    seeds: Sequence[int],
+    rounds: int,
+    opponent_pool: tuple[str, ...] = DEFAULT_OPPONENT_POOL,
+) -> list[DealTableSpec]:
+    """Deal-bank tables covering ``engine_score_batch`` for every situation and seed."""
+
+    round_seeds = [round_seed for seed in seeds for round_seed in engine_round_seeds(seed, rounds)]
+    tables: list[DealTableSpec] = []
+    for situation in situations:
+        rules, opponent_kinds = situation_setup(situation, opponent_pool)
+        tables.append((rules, len(opponent_kinds) + 1, round_seeds))
+    return tables
+
+
+def engine_score_samples(
+    strategy: HeuristicStrategy,
+    situation: GameSituation,
+    rounds: int,
+    seed: int,
+    *,
+    opponent_pool: tuple[str, ...] = DEFAULT_OPPONENT_POOL,
+) -> list[float]:
+    return engine_score_batch([strategy], situation, rounds, seed, opponent_pool=opponent_pool)[0]
+
+
+def _column_match(partners: tuple[int, ...], value: int, values: list[int], face_up: frozenset[int]) -> float:
+    """Share of ``partners`` (the rest of a column) that are face-up and equal ``value``."""
+
+    matches = 0
+    for other in partners:
+        if other in face_up and values[other] == value:
+            matches += 1
+    return matches / len(partners)
+
+
+def _flip_target(
+    hidden: list[int], face_up: frozenset[int], geometry: BoardGeometry, strategy: HeuristicStrategy
+) -> int:
+    if strategy.column_focus < 0.5 or not geometry.clears_columns:
+        return hidden[0]
+    # Column-focused players finish the columns that are closest to being cleared.
+    return max(
+        hidden,
+        key=lambda index: (sum(other in face_up for other in geometry.column_slots[geometry.column_of[index]]), -index),
+    )
+
+
+@lru_cache(maxsize=64)
+def _expected_value_for(deck_items: tuple[tuple[int, int], ...]) -> float:
+    total = sum(count for _, count in deck_items)
+    return sum(value * count for value, count in deck_items) / total
+
+
+def _expected_card_value(rules: RulesConfig) -> float:
+    return _expected_value_for(tuple(sorted(rules.deck_composition.items())))
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from skyjo_optimizer.agents.heuristic import HeuristicStrategy
 from skyjo_optimizer.simulation.scenarios import GameSituation
+from skyjo_optimizer.simulation.stats import variance
 
 
 @dataclass(frozen=True)
@@ -50,21 +52,113 @@ def _single_round_score(
     )
 
 
+@dataclass(frozen=True)
+class PairedComparison:
+    """Common-random-numbers comparison of candidates on one situation.
+
+    Every candidate saw the same seed, so per-round score differences cancel the
+    shared noise. ``mean_difference`` is the mean per-round score of the
+    reference minus that of each candidate (positive: the candidate scored
+    lower), and ``best_index`` is the candidate with the largest one. The
+    standard errors are of those differences, paired and as if the rounds were
+    independent; ``variance_reduction`` is ``1 - var(paired) / var(independent)``
+    averaged over all candidates other than the reference.
+    """
+
+    scenario: str
+    results: tuple[EvaluationResult, ...]
+    reference_index: int
+    best_index: int
+    mean_difference: tuple[float, ...]
+    paired_stderr: tuple[float, ...]
+    independent_stderr: tuple[float, ...]
+    variance_reduction: float
+
+
+def score_samples(
+    strategy: HeuristicStrategy,
+    situation: GameSituation,
+    rounds: int,
+    seed: int,
+) -> list[float]:
+    """Per-round scores; the noise stream depends only on ``seed``."""
+
+    rng = random.Random(seed)
+    return [_single_round_score(strategy, situation, rng) for _ in range(rounds)]
+
+
 def evaluate_strategy(
     strategy: HeuristicStrategy,
     situation: GameSituation,
     rounds: int,
     seed: int,
 ) -> EvaluationResult:
-    rng = random.Random(seed)
-    samples = [_single_round_score(strategy, situation, rng) for _ in range(rounds)]
+    return _result_from_samples(situation, score_samples(strategy, situation, rounds, seed))
+
+
+def compare_paired(
+    strategies: list[HeuristicStrategy],
+    situation: GameSituation,
+    rounds: int,
+    seed: int,
+    *,
+    reference: int = 0,
+    sampler: Callable[[list[HeuristicStrategy], GameSituation, int, int], list[list[float]]] | None = None,
+) -> PairedComparison:
+    """Evaluate ``strategies`` on identical noise and rank them by paired differences.
+
+    Each candidate is ranked by the mean of its per-round score differences
+    against ``strategies[reference]``, not by penalized fitness. ``sampler``
+    returns per-round scores for a batch of strategies on one seed (such as
+    ``EvaluatorBackend.score_batch``); it defaults to the synthetic model.
+    """
+
+    if not strategies:
+        raise ValueError("at least one strategy is required")
+    if not 0 <= reference < len(strategies):
+        raise ValueError(f"reference index {reference} out of range")
+
+    if sampler is None:
+        samples = [score_samples(strategy, situation, rounds, seed) for strategy in strategies]
+    else:
+        samples = sampler(strategies, situation, rounds, seed)
+    results = tuple(_result_from_samples(situation, row) for row in samples)
+    baseline = samples[reference]
+
+    differences: list[float] = []
+    paired: list[float] = []
+    independent: list[float] = []
+    reductions: list[float] = []
+    for index, row in enumerate(samples):
+        per_round = [b - x for b, x in zip(baseline, row)]
+        differences.append(sum(per_round) / len(per_round))
+        paired_variance = variance(per_round)
+        independent_variance = results[index].variance + results[reference].variance
+        paired.append((paired_variance / rounds) ** 0.5)
+        independent.append((independent_variance / rounds) ** 0.5)
+        if index != reference and independent_variance > 0:
+            reductions.append(1.0 - paired_variance / independent_variance)
+
+    return PairedComparison(
+        scenario=situation.name,
+        results=results,
+        reference_index=reference,
+        best_index=max(range(len(differences)), key=differences.__getitem__),
+        mean_difference=tuple(differences),
+        paired_stderr=tuple(paired),
+        independent_stderr=tuple(independent),
+        variance_reduction=sum(reductions) / len(reductions) if reductions else 0.0,
+    )
+
+
+def _result_from_samples(situation: GameSituation, samples: list[float]) -> EvaluationResult:
     mean = sum(samples) / len(samples)
-    variance = sum((x - mean) ** 2 for x in samples) / len(samples)
+    spread = variance(samples)
     # Maximize fitness: lower score and lower variance are preferred.
-    fitness = -mean - 0.05 * variance
+    fitness = -mean - 0.05 * spread
     return EvaluationResult(
         scenario=situation.name,
         mean_score=mean,
-        variance=variance,
+        variance=spread,
         fitness=fitness,
     )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import pstats
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROFILE_STATS_FILENAME = "profile.pstats"
+PROFILE_TEXT_FILENAME = "profile.txt"
+PROFILE_SUMMARY_FILENAME = "profile_summary.json"
+
+# Components timed on the hot paths. ``evaluation`` wraps whole evaluator calls and
+# therefore contains the round-level components when the engine backend is used.
+# ``kernel_round`` is a whole round played by the array kernels, whose decisions,
+# steps and scoring are not split out.
+COMPONENTS: tuple[str, ...] = ("deal_setup", "agent_decision", "engine_step", "scoring", "kernel_round", "evaluation")
+
+
+@dataclass
+class HotPathProfile:
+    """Counters and timers filled in by instrumented code while profiling is active."""
+
+    seconds: dict[str, float] = field(default_factory=lambda: dict.fromkeys(COMPONENTS, 0.0))
+    calls: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COMPONENTS, 0))
+    turns: int = 0
+    rounds: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def add(self, component: str, seconds: float, count: int = 1) -> None:
+        self.seconds[component] += seconds
+        self.calls[component] += count
+
+    def summary(self) -> dict[str, object]:
+        wall = time.perf_counter() - self.started
+        return {
+            "wall_seconds": wall,
+            "rounds": self.rounds,
+            "turns": self.turns,
+            "turns_per_second": self.turns / wall if wall > 0 else 0.0,
+            "components": {
+                name: {
+                    "calls": self.calls[name],
+                    "seconds": self.seconds[name],
+                    "percent_of_wall": 100.0 * self.seconds[name] / wall if wall > 0 else 0.0,
+                }
+                for name in COMPONENTS
+            },
+        }
+
+
+# ``None`` while profiling is off. Instrumented code reads this once per round or
+# evaluator call and takes its uninstrumented path when it is ``None``.
+ACTIVE: HotPathProfile | None = None
+
+
+def enable() -> HotPathProfile:
+    global ACTIVE
+    ACTIVE = HotPathProfile()
+    return ACTIVE
+
+
+def disable() -> None:
+    global ACTIVE
+    ACTIVE = None
+
+
+@contextmanager
+def profile_session(destination: str | Path) -> Iterator[HotPathProfile]:
+    """Run the block under cProfile with hot-path counters on, then write both into ``destination``."""
+
+    profiler = cProfile.Profile()
+    hot_paths = enable()
+    profiler.enable()
+    try:
+        yield hot_paths
+    finally:
+        profiler.disable()
+        disable()
+        write_profile(destination, profiler, hot_paths)
+
+
+def write_profile(destination: str | Path, profiler: cProfile.Profile, hot_paths: HotPathProfile) -> Path:
+    """Write ``profile.pstats``, a cumulative-time ``profile.txt`` and ``profile_summary.json``."""
+
+    root = Path(destination)
+    root.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(root / PROFILE_STATS_FILENAME)
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(40)
+    (root / PROFILE_TEXT_FILENAME).write_text(text.getvalue())
+    (root / PROFILE_SUMMARY_FILENAME).write_text(json.dumps(hot_paths.summary(), indent=2, sort_keys=True) + "\n")
+    return root
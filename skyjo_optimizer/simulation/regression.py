@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from skyjo_optimizer.engine import DealBank
+
 from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
 
 
@@ -15,11 +17,11 @@ class RegressionCheckResult:
     random_win_rate: float
 
 
-def run_regression_checks(*, rounds: int = 60, seed: int = 11) -> RegressionCheckResult:
+def run_regression_checks(*, rounds: int = 60, seed: int = 11, deal_bank: DealBank | None = None) -> RegressionCheckResult:
     agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random")]
 
-    first = run_tournament(agents, rounds=rounds, seed=seed)
-    second = run_tournament(agents, rounds=rounds, seed=seed)
+    first = run_tournament(agents, rounds=rounds, seed=seed, deal_bank=deal_bank)
+    second = run_tournament(agents, rounds=rounds, seed=seed, deal_bank=deal_bank)
 
     deterministic_replay_ok = first == second
     heuristic_beats_random = (
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import itertools
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, fields, replace
+from random import Random
+
+from skyjo_optimizer.engine import DealBank, RulesConfig, deal_round
+from skyjo_optimizer.simulation.baseline import (
+    BaselineAgent,
+    TournamentResult,
+    play_out,
+    rotate_agents,
+    score_round,
+    summarize_tournament,
+    tournament_seeds,
+)
+from skyjo_optimizer.simulation.stats import variance
+
+# Fields that change how a finished round is scored but not how it is dealt or
+# played (agents decide from the board, never from these), so variants that
+# differ only here are scored from the same simulated rounds.
+SCORING_ONLY_FIELDS = ("ender_penalty_mode", "target_match_score")
+
+RULE_SWEEP_COLUMNS = (
+    "variant",
+    "agent",
+    "simulated",
+    "mean_score",
+    "win_rate",
+    "mean_difference",
+    "paired_stderr",
+    "independent_stderr",
+)
+
+_RULES_FIELDS = frozenset(item.name for item in fields(RulesConfig))
+
+
+def play_rules(rules: RulesConfig) -> RulesConfig:
+    """``rules`` with scoring-only fields at their defaults: variants with equal play rules play identical rounds."""
+
+    defaults = RulesConfig()
+    return replace(rules, **{name: getattr(defaults, name) for name in SCORING_ONLY_FIELDS})
+
+
+def rule_variants(base: RulesConfig, grid: Mapping[str, Sequence[object]]) -> dict[str, RulesConfig]:
+    """Every combination of ``grid`` values applied to ``base``, named ``field=value;...``."""
+
+    unknown = set(grid) - _RULES_FIELDS
+    if unknown:
+        raise ValueError(f"unknown RulesConfig fields: {sorted(unknown)}")
+    if not grid:
+        return {"base": base}
+    variants: dict[str, RulesConfig] = {}
+    for values in itertools.product(*grid.values()):
+        changes = dict(zip(grid, values))
+        variants[";".join(f"{name}={value}" for name, value in changes.items())] = replace(base, **changes)
+    return variants
+
+
+@dataclass(frozen=True)
+class VariantResult:
+    """One variant's tournament and its per-agent paired differences against the reference variant."""
+
+    name: str
+    rules: RulesConfig
+    simulated: bool
+    tournament: TournamentResult
+    mean_difference_by_agent: dict[str, float]
+    paired_stderr_by_agent: dict[str, float]
+    independent_stderr_by_agent: dict[str, float]
+
+
+@dataclass(frozen=True)
+class RuleSweepResult:
+    """Variants in sweep order; the first is the reference the differences are taken against."""
+
+    rounds: int
+    seed: int
+    variants: tuple[VariantResult, ...]
+
+    @property
+    def simulated_variants(self) -> int:
+        return sum(variant.simulated for variant in self.variants)
+
+    def rows(self) -> list[dict[str, object]]:
+        """One ``RULE_SWEEP_COLUMNS`` row per variant and agent."""
+
+        return [
+            {
+                "variant": variant.name,
+                "agent": name,
+                "simulated": variant.simulated,
+                "mean_score": mean_score,
+                "win_rate": variant.tournament.win_rate_by_agent[name],
+                "mean_difference": variant.mean_difference_by_agent[name],
+                "paired_stderr": variant.paired_stderr_by_agent[name],
+                "independent_stderr": variant.independent_stderr_by_agent[name],
+            }
+            for variant in self.variants
+            for name, mean_score in variant.tournament.mean_score_by_agent.items()
+        ]
+
+
+def run_rule_sweep(
+    agents: list[BaselineAgent],
+    variants: Mapping[str, RulesConfig],
+    *,
+    rounds: int,
+    seed: int,
+    deal_bank: DealBank | None = None,
+) -> RuleSweepResult:
+    """Play ``run_tournament(agents, rounds=rounds, seed=seed, rules=...)`` for every variant, sharing rounds.
+
+    Variants with the same ``play_rules`` are simulated once and every one of
+    them scores the final states, so a sweep costs one tournament per distinct
+    play ruleset rather than per variant. All variants use the same seeds and
+    seatings, so even variants that deal differently are compared on common
+    random numbers. Each variant's tournament equals the independent one.
+    """
+
+    if rounds <= 0:
+        raise ValueError("rounds must be positive")
+    if not variants:
+        raise ValueError("at least one variant is required")
+    groups: dict[str, list[str]] = {}
+    for name, rules in variants.items():
+        rules.validate()
+        groups.setdefault(json.dumps(play_rules(rules).to_dict(), sort_keys=True), []).append(name)
+
+    seeds = tournament_seeds(range(rounds), seed)
+    tournaments: dict[str, TournamentResult] = {}
+    simulated: set[str] = set()
+    for names in groups.values():
+        first = variants[names[0]]
+        finished = []
+        for round_index, round_seed in enumerate(seeds):
+            seating = rotate_agents(agents, round_index)
+            state = deal_round(first, len(seating), round_seed, deal_bank)
+            finished.append((seating, play_out(seating, state, rng=Random(round_seed))))
+        simulated.add(names[0])
+        for name in names:
+            rules = variants[name]
+            tournaments[name] = summarize_tournament(
+                agents, [score_round(seating, replace(state, rules=rules)) for seating, state in finished]
+            )
+
+    reference = tournaments[next(iter(variants))]
+    return RuleSweepResult(
+        rounds=rounds,
+        seed=seed,
+        variants=tuple(
+            _compare(name, variants[name], name in simulated, tournaments[name], reference) for name in variants
+        ),
+    )
+
+
+def _compare(
+    name: str,
+    rules: RulesConfig,
+    simulated: bool,
+    tournament: TournamentResult,
+    reference: TournamentResult,
+) -> VariantResult:
+    differences: dict[str, float] = {}
+    paired: dict[str, float] = {}
+    independent: dict[str, float] = {}
+    for agent in tournament.mean_score_by_agent:
+        scores = [float(result.scores_by_agent[agent]) for result in tournament.rounds]
+        baseline = [float(result.scores_by_agent[agent]) for result in reference.rounds]
+        count = len(scores)
+        differences[agent] = tournament.mean_score_by_agent[agent] - reference.mean_score_by_agent[agent]
+        paired[agent] = (variance([a - b for a, b in zip(scores, baseline)]) / count) ** 0.5
+        independent[agent] = ((variance(scores) + variance(baseline)) / count) ** 0.5
+    return VariantResult(name, rules, simulated, tournament, differences, paired, independent)
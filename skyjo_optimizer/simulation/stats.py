@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def variance(samples: Sequence[float]) -> float:
+    """Population variance (divides by ``len(samples)``)."""
+
+    mean = sum(samples) / len(samples)
+    return sum((x - mean) ** 2 for x in samples) / len(samples)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Quantile ``q`` in ``[0, 1]``, linearly interpolated between order statistics."""
+
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return float(ordered[0])
+
+    target = (len(ordered) - 1) * q
+    low = int(target)
+    high = min(low + 1, len(ordered) - 1)
+    weight = target - low
+    return ordered[low] * (1 - weight) + ordered[high] * weight
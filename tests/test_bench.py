@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import ast
+import importlib
+import inspect
+import json
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from skyjo_optimizer.bench import MEMORY_METRICS, WORKLOADS, compare_to_baseline, deep_sizeof, measure_memory, run_benchmarks
+from skyjo_optimizer.bench.memory import memory_metric
+from skyjo_optimizer.bench.startup import STARTUP_BUDGET_MS, STARTUP_COMMANDS, measure_startup
+from skyjo_optimizer.engine import RulesConfig, initialize_round
+
+
+def test_run_benchmarks_reports_median_spread_and_turn_rate() -> None:
+    payload = run_benchmarks(["run_round_heuristic", "initialize_round"], repeats=2, warmup=0, memory=False, startup=False, kernels=False)
+
+    workloads = payload["workloads"]
+    assert list(workloads) == ["run_round_heuristic", "initialize_round"]
+    heuristic = workloads["run_round_heuristic"]
+    assert heuristic["min_per_second"] <= heuristic["median_per_second"] <= heuristic["max_per_second"]
+    assert heuristic["turns_per_second"] > heuristic["median_per_second"]
+    assert workloads["initialize_round"]["turns_per_second"] is None
+    assert payload["turns_per_minute"] == pytest.approx(heuristic["turns_per_second"] * 60)
+    assert len({workload.name for workload in WORKLOADS}) == len(WORKLOADS)
+    with pytest.raises(ValueError):
+        run_benchmarks(["no_such_workload"])
+
+
+def test_deal_bank_workload_removes_its_bank(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    payload = run_benchmarks(["deal_bank"], repeats=1, warmup=0, memory=False, startup=False, kernels=False)
+    assert payload["workloads"]["deal_bank"]["median_per_second"] > 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_compare_to_baseline_flags_drops_beyond_threshold() -> None:
+    baseline = {"workloads": {"a": {"median_per_second": 100.0}, "b": {"median_per_second": 100.0}, "gone": {"median_per_second": 1.0}}}
+    current = {"workloads": {"a": {"median_per_second": 85.0}, "b": {"median_per_second": 75.0}, "new": {"median_per_second": 1.0}}}
+
+    regressions = compare_to_baseline(current, baseline, threshold=0.2)
+
+    assert [regression.name for regression in regressions] == ["b"]
+    assert regressions[0].change == pytest.approx(-0.25)
+    assert compare_to_baseline(current, baseline, threshold=0.1)[0].name == "a"
+
+
+def test_memory_accounting_is_stable_and_flags_growth() -> None:
+    report = measure_memory()
+
+    repeated = measure_memory()
+    for metric in MEMORY_METRICS:
+        assert memory_metric(repeated, metric) == pytest.approx(memory_metric(report, metric), rel=0.05)
+    assert report["turns_measured"] > 0 and report["bytes_allocated_per_turn"] > 0
+    assert report["peak_bytes_per_round"] > report["bytes_allocated_per_turn"]
+    assert report["tournament"]["retained_bytes_per_round_result"] > 0
+    assert report["optimize"]["fitness_cache_entries"] > 0
+    sizes = report["object_sizes"]
+    assert sizes["round_state_cards"] < sizes["round_state"] < sizes["tournament_result"] + sizes["round_state"]
+
+    deal = initialize_round(RulesConfig(), player_count=2, seed=1)
+    assert deep_sizeof((deal, deal)) - deep_sizeof(deal) == deep_sizeof((None, None)) - deep_sizeof(None)
+
+    grown = json.loads(json.dumps(report))
+    grown["tournament"]["retained_bytes_per_round_result"] *= 1.5
+    throughput = {"workloads": {}}
+    regressions = compare_to_baseline({**throughput, "memory": grown}, {**throughput, "memory": report})
+    assert [(regression.name, regression.unit) for regression in regressions] == [
+        ("memory.tournament.retained_bytes_per_round_result", "bytes")
+    ]
+    assert regressions[0].change == pytest.approx(0.5)
+
+
+def test_cli_bench_fails_on_regression(tmp_path) -> None:
+    command = [
+        *[sys.executable, "-m", "skyjo_optimizer.cli", "bench"],
+        *["--workload", "initialize_round", "--repeats", "1", "--no-memory", "--no-startup", "--no-kernels"],
+    ]
+    report = tmp_path / "bench.json"
+    subprocess.check_call([*command, "--output", str(report)])
+    payload = json.loads(report.read_text())
+
+    payload["workloads"]["initialize_round"]["median_per_second"] *= 100
+    inflated = tmp_path / "inflated.json"
+    inflated.write_text(json.dumps(payload))
+    result = subprocess.run([*command, "--baseline", str(inflated)], capture_output=True, text=True)
+
+    assert result.returncode == 1
+    assert "regression: initialize_round" in result.stderr
+
+
+def test_cli_help_does_not_import_subcommand_modules() -> None:
+    script = (
+        "import sys\n"
+        "from skyjo_optimizer import cli\n"
+        "try:\n"
+        "    cli.main(sys.argv[1:])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(' '.join(sorted(name for name in sys.modules if name.startswith('skyjo_optimizer'))))\n"
+    )
+
+    def loaded(*arguments: str) -> set[str]:
+        output = subprocess.check_output([sys.executable, "-c", script, *arguments], text=True)
+        return set(output.splitlines()[-1].split())
+
+    assert loaded("--help") == {"skyjo_optimizer", "skyjo_optimizer._lazy", "skyjo_optimizer.cli"}
+    verify_modules = loaded("verify", "--help")
+    assert "skyjo_optimizer.ml.evolution" not in verify_modules
+    assert "skyjo_optimizer.simulation.baseline" not in verify_modules
+
+
+@pytest.mark.parametrize(
+    "package",
+    ["skyjo_optimizer", "skyjo_optimizer.bench", "skyjo_optimizer.distributed", "skyjo_optimizer.ml",
+     "skyjo_optimizer.serve", "skyjo_optimizer.simulation"],
+)
+def test_lazy_exports_match_the_type_checking_imports(package: str) -> None:
+    module = importlib.import_module(package)
+    tree = ast.parse(inspect.getsource(module))
+    (block,) = [node for node in tree.body if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"]
+    imported = {alias.name: "." * node.level + node.module for node in block.body for alias in node.names}
+
+    assert imported == module._EXPORTS
+    assert module.__all__ == list(module._EXPORTS)
+    assert all(getattr(module, name) is not None for name in module.__all__)
+
+
+def test_measure_startup_stays_within_budget() -> None:
+    report = measure_startup(repeats=3)
+
+    assert set(report["median_ms"]) == set(STARTUP_COMMANDS)
+    assert report["budget_ms"] == STARTUP_BUDGET_MS
+    assert all(value <= STARTUP_BUDGET_MS for value in report["median_ms"].values()), report["median_ms"]
+    assert report["within_budget"]
+    slower = {"startup": {"median_ms": {name: value * 2 + 10 for name, value in report["median_ms"].items()}}}
+    names = [regression.name for regression in compare_to_baseline({"workloads": {}, **slower}, {"workloads": {}, "startup": report})]
+    assert names == sorted(f"startup.{name}" for name in STARTUP_COMMANDS)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import RulesConfig, board_geometry, initialize_round
+from skyjo_optimizer.simulation.baseline import SimpleHeuristicAgent, _score_player, run_round
+from skyjo_optimizer.simulation.engine_evaluator import StrategyAgent
+
+
+def test_geometry_tables_cover_every_board_shape() -> None:
+    default = board_geometry(RulesConfig())
+    assert default.column_slots == ((0, 4, 8), (1, 5, 9), (2, 6, 10), (3, 7, 11))
+    assert default.column_partners[5] == (1, 9)
+
+    tall = board_geometry(RulesConfig(board_rows=4, board_columns=2))
+    assert tall.column_slots == ((0, 2, 4, 6), (1, 3, 5, 7))
+    assert tall.column_of == (0, 1, 0, 1, 0, 1, 0, 1)
+    assert board_geometry(RulesConfig(board_rows=4, board_columns=2)) is tall
+    assert not board_geometry(RulesConfig(board_rows=1, board_columns=6)).clears_columns
+
+
+def test_column_clearing_scores_non_default_boards() -> None:
+    rules = RulesConfig(board_rows=2, board_columns=5)
+    state = initialize_round(rules, player_count=2, seed=4)
+    by_value: dict[int, list[int]] = {}
+    for card in state.cards.values():
+        by_value.setdefault(card.value, []).append(card.card_id)
+    slots = list(state.players[0].slots)
+    slots[1], slots[6] = by_value[7][:2]
+    player = replace(state.players[0], slots=tuple(slots), face_up=frozenset({1, 6, 2}))
+    state = replace(state, players=(player, state.players[1]))
+
+    raw = sum(state.cards[card_id].value for card_id in slots)
+    assert _score_player(state, 0) == raw - 14
+
+
+def test_large_tables_play_out_and_rules_round_trip() -> None:
+    rules = RulesConfig(board_rows=4, board_columns=4)
+    agents = [StrategyAgent(f"strategy_{seat}", HeuristicStrategy(0.5, 0.5, 0.9, 0.5)) for seat in range(4)]
+    agents += [SimpleHeuristicAgent(f"heuristic_{seat}") for seat in range(4)]
+    result = run_round(agents, seed=3, rules=rules)
+    assert len(result.scores_by_agent) == 8 and result.turns > 0
+
+    assert RulesConfig.from_dict(rules.to_dict()) == rules
+    legacy = {**RulesConfig().to_dict(), "cards_per_player": 12}
+    del legacy["board_rows"], legacy["board_columns"]
+    assert RulesConfig.from_dict(legacy) == RulesConfig()
+    with pytest.raises(ValueError):
+        RulesConfig.from_dict({**legacy, "cards_per_player": 10})
+    with pytest.raises(ValueError):
+        initialize_round(RulesConfig(board_rows=5, board_columns=5), player_count=8, seed=1)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+
+from skyjo_optimizer.ml.experiment import run_baseline_tournament_benchmark
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
+from skyjo_optimizer.simulation.bootstrap import PYTHON_REPLICATES, _python_resampler, bootstrap_intervals, default_replicates
+
+
+def test_intervals_cover_point_estimates_and_narrow_with_more_rounds() -> None:
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+    short = run_tournament(agents, rounds=12, seed=3)
+    long = run_tournament(agents, rounds=60, seed=3)
+
+    intervals = bootstrap_intervals(short, replicates=400, seed=1)
+    assert intervals == bootstrap_intervals(short, replicates=400, seed=1)
+    for metric in ("mean_score_by_agent", "median_score_by_agent", "tail95_score_by_agent", "win_rate_by_agent"):
+        for name, (low, high) in getattr(intervals, metric).items():
+            assert low <= getattr(short, metric)[name] <= high
+    low, high = intervals.win_rate_matrix["heuristic"]["random_a"]
+    assert 0.0 <= low <= short.win_rate_matrix["heuristic"]["random_a"] <= high <= 1.0
+
+    wide = intervals.mean_score_by_agent["heuristic"]
+    narrow = bootstrap_intervals(long, replicates=400, seed=1).mean_score_by_agent["heuristic"]
+    assert narrow[1] - narrow[0] < wide[1] - wide[0]
+
+    with pytest.raises(ValueError):
+        bootstrap_intervals(short, replicates=1)
+
+
+def test_vectorized_resampler_agrees_with_python_fallback() -> None:
+    pytest.importorskip("numpy")
+    from skyjo_optimizer.simulation.bootstrap import _numpy_resampler
+
+    samples = [float(value % 17) for value in range(0, 600, 7)]
+    tails = (0.025, 0.975)
+    vectorized = _numpy_resampler(0)(samples, 4000, (None, 0.5, 0.95), tails)
+    fallback = _python_resampler(0)(samples, 4000, (None, 0.5, 0.95), tails)
+    for (low, high), (other_low, other_high) in zip(vectorized, fallback):
+        assert low == pytest.approx(other_low, abs=0.6)
+        assert high == pytest.approx(other_high, abs=0.6)
+
+
+def test_replicate_count_defaults_by_numpy_and_zero_skips_intervals(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert default_replicates() == PYTHON_REPLICATES
+    report = run_baseline_tournament_benchmark(seed=3, rounds=6)
+    assert report["confidence_intervals"]["replicates"] == PYTHON_REPLICATES
+
+    assert "confidence_intervals" not in run_baseline_tournament_benchmark(seed=3, rounds=6, bootstrap_replicates=0)
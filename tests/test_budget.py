@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+
+from skyjo_optimizer.ml.budget import BudgetExhausted, EvaluationBudget
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_time_budget_keeps_reserve_for_final_pass() -> None:
+    clock = FakeClock()
+    budget = EvaluationBudget(time_budget_seconds=10.0, clock=clock)
+    budget.set_reserve(evaluations=4, rounds_each=10)
+
+    budget.check(10)
+    clock.now = 1.0
+    budget.record(10, 1.0)
+
+    # 1s elapsed + 10 rounds now + 40 reserved rounds at 0.1s/round = 6s.
+    budget.check(10)
+    assert budget.affordable_evaluations(rounds_each=10) == 9
+
+    clock.now = 2.0
+    # 2s elapsed over 10 rounds: 2s + (10 + 40) * 0.2s/round = 12s.
+    with pytest.raises(BudgetExhausted):
+        budget.check(10)
+    assert budget.exhausted
+
+
+def test_max_evaluations_stops_run_and_still_selects_final_candidate() -> None:
+    config = EvolutionConfig(
+        population_size=6,
+        generations=10,
+        elite_count=2,
+        rounds_per_eval=8,
+        holdout_rounds=8,
+        early_stop_patience=20,
+        seed=4,
+        max_evaluations=30,
+    )
+    optimizer = EvolutionOptimizer(config)
+    situations = DEFAULT_SITUATIONS[:2]
+
+    result = optimizer.optimize(situations)
+
+    usage = optimizer.budget.to_dict()
+    assert usage["stopped_by_budget"] is True
+    assert usage["evaluations"] <= 30
+    assert 0 < usage["generations_completed"] < config.generations
+    assert usage["final_candidates"] >= 1
+    assert set(result.scenario_scores) == {s.name for s in situations}
+    assert EvolutionOptimizer(config).optimize(situations) == result
+
+
+def test_early_stop_under_a_tight_budget_keeps_the_best_ranked_candidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Patience 0 stops right after generation 0's holdout, before any children are bred.
+    config = EvolutionConfig(
+        population_size=8,
+        generations=5,
+        elite_count=2,
+        rounds_per_eval=8,
+        holdout_rounds=8,
+        holdout_every=1,
+        early_stop_patience=0,
+        seed=6,
+        max_evaluations=100,
+    )
+    situations = DEFAULT_SITUATIONS[:2]
+    optimizer = EvolutionOptimizer(config)
+    final_candidates = []
+    final_ranking = optimizer.final_ranking
+
+    def record_candidates(population, situations):
+        final_candidates.extend(population)
+        return final_ranking(population, situations)
+
+    # Leave room for only three candidates in the final holdout pass.
+    monkeypatch.setattr(EvaluationBudget, "affordable_evaluations", lambda self, rounds_each: 3 * len(situations))
+    monkeypatch.setattr(optimizer, "final_ranking", record_candidates)
+    optimizer.optimize(situations)
+
+    generation_zero = sorted(optimizer.last_state.history, key=lambda row: row[1], reverse=True)
+    assert optimizer.last_state.generation_records[-1].generation == 0
+    assert optimizer.budget.final_candidates == 3
+    assert final_candidates == [strategy for strategy, _ in generation_zero[:3]]
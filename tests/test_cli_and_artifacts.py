@@ -4,6 +4,9 @@ import json
 import subprocess
 import sys
 
+import pytest
+
+from skyjo_optimizer.cli import main
 from skyjo_optimizer.ml.evolution import EvolutionConfig
 from skyjo_optimizer.ml.experiment import run_experiment
 from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
@@ -17,7 +20,8 @@ def test_experiment_writes_structured_artifacts(tmp_path) -> None:
 
     run_dir = report.write_artifacts(tmp_path)
     assert (run_dir / "report.json").exists()
-    assert (run_dir / "tournament_summary.csv").exists()
+    header = (run_dir / "tournament_summary.csv").read_text().splitlines()[0]
+    assert header.startswith("agent,mean_score,median_score,tail95_score,win_rate,mean_score_low,mean_score_high")
 
     payload = json.loads((run_dir / "report.json").read_text())
     assert payload["metadata"]["seed_bank_id"]
@@ -45,6 +49,8 @@ def test_cli_baseline_command_writes_json(tmp_path) -> None:
     assert payload["rounds"] == 6
     assert payload["seed"] == 4
     assert "heuristic" in payload["mean_score_by_agent"]
+    low, high = payload["confidence_intervals"]["mean_score_by_agent"]["heuristic"]
+    assert low <= payload["mean_score_by_agent"]["heuristic"] <= high
 
 
 def test_cli_baseline_config_parsing_and_cli_override(tmp_path) -> None:
@@ -103,6 +109,7 @@ output_root = "{tmp_path}"
             str(config),
             "--generations",
             "3",
+            "--common-random-numbers",
         ]
     )
 
@@ -113,3 +120,56 @@ output_root = "{tmp_path}"
     assert payload["metadata"]["resolved_config"]["population_size"] == 6
     assert payload["metadata"]["resolved_config"]["generations"] == 3
     assert payload["metadata"]["resolved_config"]["output_root"] == str(tmp_path)
+    assert payload["metadata"]["optimizer_config"]["common_random_numbers"] is True
+    comparison = payload["paired_comparison"][DEFAULT_SITUATIONS[0].name]
+    assert comparison["reference_index"] == 0 and len(comparison["mean_difference"]) == 2
+    assert 0.0 < comparison["variance_reduction"] <= 1.0
+
+
+def test_cli_optimize_resume_reuses_run_directory(tmp_path) -> None:
+    base_command = [sys.executable, "-m", "skyjo_optimizer.cli", "optimize"]
+    subprocess.check_call(
+        base_command
+        + ["--population-size", "4", "--generations", "2", "--elite-count", "2", "--rounds-per-eval", "6"]
+        + ["--seed", "5", "--output-root", str(tmp_path)]
+    )
+    (run_dir,) = [path for path in tmp_path.iterdir() if path.is_dir()]
+    first = json.loads((run_dir / "report.json").read_text())
+    assert (run_dir / "checkpoint.json.gz").exists()
+
+    output = subprocess.check_output(base_command + ["--resume", str(run_dir)], text=True)
+    resumed = json.loads((run_dir / "report.json").read_text())
+
+    assert output.strip() == str(run_dir)
+    assert resumed["optimized"] == first["optimized"]
+    assert resumed["metadata"]["resolved_config"]["population_size"] == 4
+
+    with pytest.raises(SystemExit):
+        main(["optimize", "--resume", str(run_dir), "--islands", "2"])
+    stored = json.loads((run_dir / "resolved_config.json").read_text())
+    (run_dir / "resolved_config.json").write_text(json.dumps({**stored, "islands": 2}))
+    with pytest.raises(SystemExit):
+        main(["optimize", "--resume", str(run_dir)])
+    (run_dir / "resolved_config.json").write_text(json.dumps(stored))
+
+    (run_dir / "checkpoint.json.gz").unlink()
+    with pytest.raises(SystemExit):
+        main(["optimize", "--resume", str(run_dir)])
+    with pytest.raises(SystemExit):
+        main(["optimize", "--resume", str(tmp_path / "missing")])
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ["--deal-bank", "missing.bank", "--evaluator", "engine"],
+        ["--deal-bank", "missing.bank"],
+        ["--evaluator", "engine", "--opponent-pool", "nobody"],
+        ["--islands", "2", "--migrant-count", "9"],
+        ["--islands", "2", "--local-workers", "1"],
+    ],
+)
+def test_cli_optimize_rejects_invalid_options_before_creating_a_run(tmp_path, options) -> None:
+    with pytest.raises(SystemExit):
+        main(["optimize", "--output-root", str(tmp_path), *options])
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pickle
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from skyjo_optimizer.engine import DealBank, RulesConfig, build_deal_bank, initialize_round
+from skyjo_optimizer.engine import deal_bank as deal_bank_module
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament, tournament_seeds
+from skyjo_optimizer.simulation.regression import run_regression_checks
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+
+def _forbid_dealing(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("round was dealt from its seed instead of the bank")
+
+    monkeypatch.setattr(deal_bank_module, "initialize_round", fail)
+
+
+def test_bank_reproduces_initialize_round(tmp_path: Path) -> None:
+    rules = RulesConfig()
+    small_deck = RulesConfig(starting_face_up_cards=3, deck_composition={value: 4 for value in range(-2, 13)})
+    path = build_deal_bank(tmp_path / "deals.bin", [(rules, 3, range(40)), (small_deck, 2, [5, 9, 5]), (rules, 3, [100])])
+    bank = DealBank(path)
+
+    assert len(bank.tables) == 2 and len(bank) == 43
+    for seed in [*range(40), 100]:
+        assert bank.deal(rules, 3, seed) == initialize_round(rules, player_count=3, seed=seed)
+    # Rules outside the deal layout (here the ender penalty) share the table.
+    lenient = replace(rules, ender_penalty_mode="off")
+    assert bank.deal(lenient, 3, 7) == initialize_round(lenient, player_count=3, seed=7)
+    assert bank.deal(small_deck, 2, 9) == initialize_round(small_deck, player_count=2, seed=9)
+    assert bank.deal(rules, 3, 41) is None and bank.deal(rules, 4, 1) is None
+    assert pickle.loads(pickle.dumps(bank)).deal(rules, 3, 12) == bank.deal(rules, 3, 12)
+
+    (tmp_path / "other.bin").write_bytes(b"not a deal bank")
+    with pytest.raises(ValueError, match="not a deal bank"):
+        DealBank(tmp_path / "other.bin")
+
+
+def test_tournaments_and_regression_checks_read_banked_deals(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random")]
+    expected = run_tournament(agents, rounds=20, seed=11)
+    checks = run_regression_checks(rounds=20, seed=11)
+    bank = DealBank(build_deal_bank(tmp_path / "deals.bin", [(RulesConfig(), 2, tournament_seeds(range(20), 11))]))
+
+    _forbid_dealing(monkeypatch)
+    assert run_tournament(agents, rounds=20, seed=11, deal_bank=bank) == expected
+    assert run_regression_checks(rounds=20, seed=11, deal_bank=bank) == checks
+
+
+def test_holdout_deal_tables_cover_engine_holdout_rounds(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    config = EvolutionConfig(population_size=4, generations=1, elite_count=2, rounds_per_eval=4, holdout_rounds=4, evaluator="engine")
+    situations = DEFAULT_SITUATIONS[:2]
+    optimizer = EvolutionOptimizer(config)
+    population = optimizer.initial_state().population.individuals()
+    expected = optimizer.final_ranking(population, situations)
+    bank = DealBank(build_deal_bank(tmp_path / "holdout.bin", optimizer.holdout_deal_tables(situations)))
+
+    _forbid_dealing(monkeypatch)
+    banked = EvolutionOptimizer(config, evaluator=get_evaluator("engine", deal_bank=bank))
+    assert banked.final_ranking(population, situations) == expected
+    with pytest.raises(ValueError, match="engine evaluator"):
+        EvolutionOptimizer(EvolutionConfig()).holdout_deal_tables(situations)
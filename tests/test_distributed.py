@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+import socket
+import subprocess
+import sys
+import threading
+from dataclasses import replace
+
+import pytest
+
+from skyjo_optimizer.distributed import Coordinator, DistributedEvaluator, LocalCluster, WorkUnitError, distributed_tournament, run_worker
+from skyjo_optimizer.distributed.units import TOURNAMENT_SHARD, tournament_shard_payload
+from skyjo_optimizer.engine import RulesConfig
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.serve.protocol import JSON_FORMAT, encode_message
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+AGENTS = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+
+
+def test_local_cluster_reproduces_tournaments_and_optimizer_runs() -> None:
+    rules = replace(RulesConfig(), ender_penalty_mode="off")
+    config = EvolutionConfig(population_size=6, generations=2, elite_count=2, rounds_per_eval=6, holdout_rounds=6, seed=3, evaluator="engine")
+    local = EvolutionOptimizer(config).optimize(DEFAULT_SITUATIONS[:2])
+
+    with LocalCluster(2) as coordinator:
+        assert distributed_tournament(coordinator, AGENTS, rounds=11, seed=5, shard_rounds=3) == run_tournament(AGENTS, rounds=11, seed=5)
+        assert distributed_tournament(coordinator, AGENTS, rounds=4, seed=5, rules=rules) == run_tournament(AGENTS, rounds=4, seed=5, rules=rules)
+        backend = get_evaluator("engine")
+        evaluator = DistributedEvaluator(backend.name, backend.opponent_pool, coordinator=coordinator, chunk_size=2)
+        distributed = EvolutionOptimizer(config, evaluator=evaluator).optimize(DEFAULT_SITUATIONS[:2])
+        with pytest.raises(WorkUnitError, match="unknown work unit kind"):
+            coordinator.run([("no_such_kind", {})])
+
+    assert distributed == local
+    with pytest.raises(ValueError, match="does not match"):
+        EvolutionOptimizer(EvolutionConfig(), evaluator=evaluator)
+
+
+def test_unit_lost_with_its_worker_is_retried_elsewhere() -> None:
+    with Coordinator(lease_seconds=10) as coordinator:
+        lost = socket.create_connection(coordinator.address.split(":"))
+        lost.sendall(encode_message({"op": "hello", "worker": "flaky"}, JSON_FORMAT))
+        coordinator.wait_for_workers(1)
+        payload = tournament_shard_payload(AGENTS, range(0, 3), seed=9, rules=None)
+        future = coordinator.submit(TOURNAMENT_SHARD, payload)
+        assert lost.makefile("rb").readline()  # the flaky worker takes the unit, then disappears
+        lost.close()
+
+        worker = threading.Thread(target=run_worker, args=(coordinator.address,), daemon=True)
+        worker.start()
+        rows = future.result(timeout=30)
+
+    expected = run_tournament(AGENTS, rounds=3, seed=9).rounds
+    assert [row[0] for row in rows] == [[result.scores_by_agent[agent.name] for agent in AGENTS] for result in expected]
+    assert coordinator.counts["retries"] == 1 and coordinator.counts["completed"] == 1
+
+
+def test_run_fails_when_no_worker_is_connected() -> None:
+    payload = tournament_shard_payload(AGENTS, range(0, 3), seed=9, rules=None)
+    with Coordinator(worker_timeout=0.2) as coordinator:
+        with pytest.raises(WorkUnitError, match="no worker connected"):
+            coordinator.run([(TOURNAMENT_SHARD, payload), (TOURNAMENT_SHARD, payload)])
+        assert coordinator.counts["failed"] == 2
+    with pytest.raises(ValueError, match="worker_timeout"):
+        Coordinator(worker_timeout=0)
+
+
+def test_cli_baseline_with_local_workers_matches_in_process() -> None:
+    command = [sys.executable, "-m", "skyjo_optimizer.cli", "baseline", "--rounds", "6", "--seed", "4"]
+    local = json.loads(subprocess.check_output(command))
+    distributed = json.loads(subprocess.check_output([*command, "--local-workers", "2"]))
+
+    assert distributed["mean_score_by_agent"] == local["mean_score_by_agent"]
+    assert distributed["win_rate_matrix"] == local["win_rate_matrix"]
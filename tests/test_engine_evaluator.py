@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import Action, RulesConfig, apply_action, initialize_round, is_legal_action, legal_actions
+from skyjo_optimizer.ml.checkpoint import read_fitness_cache, write_fitness_cache
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.engine_evaluator import situation_setup
+from skyjo_optimizer.simulation.evaluator import EvaluationResult, compare_paired
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS, GameSituation
+
+
+def test_engine_evaluator_is_deterministic_and_batch_consistent() -> None:
+    evaluator = get_evaluator("engine")
+    situation = DEFAULT_SITUATIONS[0]
+    strategies = [HeuristicStrategy(0.2, 0.8, 0.6, 0.4), HeuristicStrategy(0.9, 0.1, 0.0, 0.9)]
+
+    batch = evaluator.evaluate_batch(strategies, situation, rounds=6, seed=3)
+    single = evaluator.evaluate(strategies[1], situation, rounds=6, seed=3)
+
+    assert isinstance(single, EvaluationResult)
+    assert single.scenario == situation.name
+    assert batch[1] == single
+    assert evaluator.evaluate_batch(strategies, situation, rounds=6, seed=3) == batch
+    assert evaluator.evaluate(strategies[1], situation, rounds=6, seed=4) != single
+
+
+def test_situation_setup_maps_onto_rules_and_opponents() -> None:
+    calm = GameSituation("calm", volatility=0.0, endgame_pressure=0.0, deck_richness=1.0, opponent_aggression=0.0)
+    wild = GameSituation("wild", volatility=1.0, endgame_pressure=1.0, deck_richness=0.0, opponent_aggression=1.0)
+
+    calm_rules, calm_opponents = situation_setup(calm)
+    wild_rules, wild_opponents = situation_setup(wild)
+
+    assert calm_opponents == ("heuristic",)
+    assert wild_opponents == ("random", "random", "random")
+    assert calm_rules.starting_face_up_cards == 2
+    assert wild_rules.starting_face_up_cards == 4
+    assert calm_rules.deck_composition[-2] > wild_rules.deck_composition[-2]
+    assert calm_rules.deck_composition[12] < wild_rules.deck_composition[12]
+    with pytest.raises(ValueError):
+        situation_setup(calm, ("heuristic", "shark"))
+
+
+def test_engine_sampler_gives_common_random_numbers() -> None:
+    evaluator = get_evaluator("engine", "heuristic")
+    situation = DEFAULT_SITUATIONS[2]
+    strategies = [HeuristicStrategy(0.5, 0.5, 0.5, 0.5), HeuristicStrategy(0.5, 0.5, 0.5, 0.6)]
+
+    comparison = compare_paired(strategies, situation, rounds=20, seed=8, sampler=evaluator.score_batch)
+
+    assert comparison.variance_reduction > 0.3
+
+
+def test_fitness_cache_is_keyed_by_evaluator(tmp_path) -> None:
+    config = EvolutionConfig(population_size=4, generations=1, elite_count=2, rounds_per_eval=4, holdout_rounds=4)
+    cache: dict = {}
+    EvolutionOptimizer(config, fitness_cache=cache).optimize(DEFAULT_SITUATIONS[:1])
+    engine_config = EvolutionConfig(**{**config.__dict__, "evaluator": "engine"})
+    EvolutionOptimizer(engine_config, fitness_cache=cache).optimize(DEFAULT_SITUATIONS[:1])
+
+    assert {key[-1] for key in cache} == {"synthetic", "engine[heuristic,random]"}
+    write_fitness_cache(tmp_path / "cache.json.gz", cache)
+    assert read_fitness_cache(tmp_path / "cache.json.gz") == cache
+
+
+def test_is_legal_action_matches_legal_actions() -> None:
+    state = initialize_round(RulesConfig(), player_count=3, seed=5)
+    rng = Random(5)
+    for _ in range(30):
+        legal = legal_actions(state)
+        candidates = [Action(kind, slot) for kind in ("take_discard_swap", "draw_swap", "draw_discard_flip") for slot in range(13)]
+        assert [action for action in candidates if is_legal_action(state, action)] == sorted(
+            legal, key=lambda action: candidates.index(action)
+        )
+        state = apply_action(state, rng.choice(legal))
@@ -60,3 +60,13 @@ def test_random_playout_terminates_in_finite_steps() -> None:
         raise AssertionError("round did not terminate in finite steps")
 
     assert is_round_over(state)
+
+
+def test_playout_conserves_cards_on_large_tables() -> None:
+    rules = RulesConfig(board_rows=4, board_columns=4)
+    state = initialize_round(rules, player_count=8, seed=5)
+    rng = random.Random(5)
+
+    while not is_round_over(state):
+        state = apply_action(state, rng.choice(legal_actions(state)))
+        assert sum(card_location_counts(state).values()) == rules.total_cards
@@ -1,5 +1,10 @@
+import pytest
+
 from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml.checkpoint import read_checkpoint
 from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.population import Parameter, ParameterSchema
+from skyjo_optimizer.simulation.evaluator import compare_paired
 from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS, GameSituation
 
 
@@ -37,3 +42,76 @@ def test_select_best_for_specific_situation_prefers_risk_aligned_policy() -> Non
     best = optimizer.select_best_for_situation([conservative, aligned], situation, rounds=220)
 
     assert best.strategy == aligned
+
+
+def test_resume_from_checkpoint_matches_uninterrupted_run(tmp_path, monkeypatch) -> None:
+    config = EvolutionConfig(population_size=8, generations=5, elite_count=3, rounds_per_eval=12, holdout_rounds=12, seed=21)
+    situations = DEFAULT_SITUATIONS[:2]
+    expected = EvolutionOptimizer(config).optimize(situations)
+
+    checkpoint = tmp_path / "checkpoint.json.gz"
+    original_score = EvolutionOptimizer._score_population
+    calls = {"count": 0}
+
+    def flaky_score(self, *args, **kwargs):
+        calls["count"] += 1
+        # Generation 0 scores the population and the holdout, generation 1 only the population.
+        if calls["count"] > 3:
+            raise KeyboardInterrupt
+        return original_score(self, *args, **kwargs)
+
+    monkeypatch.setattr(EvolutionOptimizer, "_score_population", flaky_score)
+    with pytest.raises(KeyboardInterrupt):
+        EvolutionOptimizer(config).optimize(situations, checkpoint_path=checkpoint)
+    monkeypatch.undo()
+
+    assert read_checkpoint(checkpoint).next_generation == 2
+    resumed = EvolutionOptimizer(config).optimize(situations, checkpoint_path=checkpoint, resume=True)
+
+    assert resumed == expected
+
+
+def test_resume_rejects_mismatched_config(tmp_path) -> None:
+    checkpoint = tmp_path / "checkpoint.json.gz"
+    config = EvolutionConfig(population_size=4, generations=1, elite_count=2, rounds_per_eval=5, holdout_rounds=5)
+    EvolutionOptimizer(config).optimize(DEFAULT_SITUATIONS[:1], checkpoint_path=checkpoint)
+
+    other = EvolutionConfig(population_size=4, generations=1, elite_count=2, rounds_per_eval=6, holdout_rounds=5)
+    with pytest.raises(ValueError):
+        EvolutionOptimizer(other).optimize(DEFAULT_SITUATIONS[:1], checkpoint_path=checkpoint, resume=True)
+    with pytest.raises(ValueError, match="do not match the schema"):
+        read_checkpoint(checkpoint, ParameterSchema((Parameter("risk_tolerance"),)))
+
+
+def test_common_random_numbers_selection_reports_variance_reduction() -> None:
+    optimizer = EvolutionOptimizer(EvolutionConfig(seed=3, common_random_numbers=True))
+    situation = DEFAULT_SITUATIONS[1]
+    candidates = [HeuristicStrategy(0.1, 0.3, 0.5, 0.4), HeuristicStrategy(0.9, 0.3, 0.5, 0.4)]
+
+    best = optimizer.select_best_for_situation(candidates, situation, rounds=20)
+
+    comparison = optimizer.last_comparison
+    assert best.strategy == candidates[1]
+    assert comparison.reference_index == 0 and comparison.best_index == 1
+    assert comparison.mean_difference[0] == 0.0
+    assert comparison.mean_difference[1] > 0.0
+    # The synthetic model's noise is additive, so pairing cancels it entirely.
+    assert comparison.variance_reduction > 0.99
+    assert comparison.paired_stderr[1] < comparison.independent_stderr[1]
+
+
+def test_compare_paired_ranks_by_mean_paired_difference_not_penalized_fitness() -> None:
+    situation = DEFAULT_SITUATIONS[0]
+    rows = {"reference": [10.0] * 8, "volatile": [0.0, 12.0] * 4, "steady": [7.0] * 8}
+
+    def sampler(strategies, situation, rounds, seed):
+        return [rows[name] for name in strategies]
+
+    comparison = compare_paired(["reference", "volatile", "steady"], situation, 8, seed=1, sampler=sampler)
+
+    # The variance penalty makes "steady" the fittest, but "volatile" scores 1 point lower per round on average.
+    assert max(range(3), key=lambda index: comparison.results[index].fitness) == 2
+    assert comparison.mean_difference == (0.0, 4.0, 3.0)
+    assert comparison.best_index == 1
+    with pytest.raises(ValueError):
+        compare_paired(["reference"], situation, 8, seed=1, reference=1, sampler=sampler)
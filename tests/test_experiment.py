@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 
+from skyjo_optimizer.ml.artifact_cache import ArtifactCache
 from skyjo_optimizer.ml.evolution import EvolutionConfig
 from skyjo_optimizer.ml.experiment import run_experiment
 from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS, GameSituation
@@ -59,3 +60,33 @@ def test_run_experiment_supports_custom_tournament_round_count() -> None:
 
     assert report.tournament_benchmark["rounds"] == 10
     assert abs(sum(report.tournament_benchmark["win_rate_by_agent"].values()) - 1.0) < 1e-9
+
+
+def test_run_experiment_reuses_cached_artifacts(tmp_path) -> None:
+    config = EvolutionConfig(population_size=4, generations=1, elite_count=2, rounds_per_eval=10, holdout_rounds=10, seed=3)
+    situations = DEFAULT_SITUATIONS[:2]
+    cache = ArtifactCache(tmp_path / "cache")
+
+    first = run_experiment(situations, config=config, tournament_rounds=6, artifact_cache=cache)
+    second = run_experiment(
+        situations,
+        config=config,
+        tournament_rounds=6,
+        artifact_cache=cache,
+        concurrent_tournament=True,
+    )
+    uncached = run_experiment(situations, config=config, tournament_rounds=6, concurrent_tournament=True)
+
+    assert {entry["reused"] for entry in first.cached_artifacts.values()} == {False}
+    assert {entry["reused"] for entry in second.cached_artifacts.values()} == {True}
+    assert first.cached_artifacts == {
+        name: {**entry, "reused": False} for name, entry in second.cached_artifacts.items()
+    }
+    assert second.benchmark == first.benchmark == uncached.benchmark
+    assert second.tournament_benchmark == first.tournament_benchmark == uncached.tournament_benchmark
+    assert uncached.cached_artifacts is None
+    assert json.loads(second.write_json(tmp_path / "report.json").read_text())["cached_artifacts"]["benchmark"]["reused"]
+
+    other_seed = EvolutionConfig(**{**config.__dict__, "seed": 4})
+    third = run_experiment(situations, config=other_seed, tournament_rounds=6, artifact_cache=cache)
+    assert not third.cached_artifacts["tournament_benchmark"]["reused"]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.islands import IslandConfig, IslandOptimizer, island_seed, migrate
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+CONFIG = EvolutionConfig(population_size=6, generations=4, elite_count=2, rounds_per_eval=12, holdout_rounds=12, seed=3)
+
+
+def test_island_result_is_independent_of_worker_count() -> None:
+    serial = IslandOptimizer(CONFIG, IslandConfig(island_count=3, migration_interval=2, migrant_count=1, workers=1))
+    parallel = IslandOptimizer(CONFIG, IslandConfig(island_count=3, migration_interval=2, migrant_count=1, workers=2))
+
+    first = serial.optimize(DEFAULT_SITUATIONS[:2])
+
+    assert first == serial.optimize(DEFAULT_SITUATIONS[:2])
+    assert first == parallel.optimize(DEFAULT_SITUATIONS[:2])
+    assert set(first.scenario_scores) == {s.name for s in DEFAULT_SITUATIONS[:2]}
+
+
+def test_island_seeds_are_distinct_substreams() -> None:
+    seeds = {island_seed(7, index) for index in range(8)}
+    assert len(seeds) == 8
+    assert island_seed(7, 0) == island_seed(7, 0)
+
+
+def test_ring_migration_replaces_trailing_mutants() -> None:
+    optimizer = EvolutionOptimizer(CONFIG)
+    states = [optimizer.initial_state(population_seed=index) for index in range(3)]
+    for state in states:
+        state.next_generation = 2
+    before = [state.population.individuals() for state in states]
+
+    migrate(states, migrant_count=2, generation=2)
+
+    for index, state in enumerate(states):
+        source = before[(index - 1) % 3]
+        after = state.population.individuals()
+        assert after[:-2] == before[index][:-2]
+        assert after[-2:] == source[:2]
+
+
+def test_island_config_rejects_too_many_migrants() -> None:
+    with pytest.raises(ValueError):
+        IslandOptimizer(CONFIG, IslandConfig(island_count=2, migrant_count=3))
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import dataclasses
+from random import Random
+
+import pytest
+
+from skyjo_optimizer.bench import measure_kernels
+from skyjo_optimizer.engine import RulesConfig, apply_action, deal_round, is_round_over, kernels, legal_actions
+from skyjo_optimizer.engine.kernels import ArrayState, kernel_round
+from skyjo_optimizer.engine.state import ACTION_KINDS
+from skyjo_optimizer.simulation.baseline import (
+    KERNEL_POLICIES,
+    RandomAgent,
+    SimpleHeuristicAgent,
+    play_round,
+    run_round,
+    run_tournament,
+)
+
+# Without Numba the kernels are plain Python already; with it, each test also runs their ``py_func``.
+BACKENDS = ["numba", "python"] if kernels.COMPILED else ["python"]
+KERNEL_FUNCTIONS = ("_draw", "step", "score", "random_action", "heuristic_action", "play")
+
+TABLES = [
+    (RulesConfig(), (2, 3, 5, 8)),
+    (RulesConfig(ender_penalty_mode="off"), (2, 4)),
+    (RulesConfig(board_rows=4, board_columns=5), (2, 4, 7)),
+    (RulesConfig(board_rows=1, board_columns=6), (2, 3)),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def kernel_backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "python" and kernels.COMPILED:
+        # ``py_func`` looks its callees up in the module, so they run uncompiled too.
+        for name in KERNEL_FUNCTIONS:
+            monkeypatch.setattr(kernels, name, getattr(kernels, name).py_func)
+    return request.param
+
+
+def _outcome(callable_):  # type: ignore[no-untyped-def]
+    try:
+        return callable_()
+    except RuntimeError as error:
+        return str(error)
+
+
+@pytest.mark.parametrize(("rules", "player_counts"), TABLES)
+def test_kernel_rounds_match_the_object_engine(
+    rules: RulesConfig, player_counts: tuple[int, ...], kernel_backend: str
+) -> None:
+    assert KERNEL_POLICIES == {RandomAgent: kernels.POLICY_RANDOM, SimpleHeuristicAgent: kernels.POLICY_HEURISTIC}
+    for players in player_counts:
+        for seed in range(24):
+            policies = [(seed >> seat) & 1 for seat in range(players)]
+            agents = [(RandomAgent, SimpleHeuristicAgent)[policy](f"seat{seat}") for seat, policy in enumerate(policies)]
+            state = deal_round(rules, players, seed)
+
+            def expected(max_turns: int = 1000):  # type: ignore[no-untyped-def]
+                result = play_round(agents, state, rng=Random(seed), max_turns=max_turns)
+                return [result.scores_by_agent[agent.name] for agent in agents], result.turns
+
+            reference = expected()
+            assert kernel_round(policies, state, rng=Random(seed)) == reference
+            # The turn limit trips exactly where the object engine's does.
+            for max_turns in (reference[1], reference[1] - 1):
+                assert _outcome(lambda: kernel_round(policies, state, rng=Random(seed), max_turns=max_turns)) == _outcome(
+                    lambda: expected(max_turns)
+                )
+
+
+def test_step_kernel_tracks_apply_action(kernel_backend: str) -> None:
+    rules = RulesConfig(board_rows=4, board_columns=5)
+    state = deal_round(rules, 3, 11)
+    arrays = ArrayState(state)
+    rng = Random(5)
+    while not is_round_over(state):
+        action = rng.choice(legal_actions(state))
+        state = apply_action(state, action)
+        arrays.step(ACTION_KINDS.index(action.kind), action.slot_index)
+
+        unpacked = ArrayState(state)
+        for name in ("slots", "face_up", "face_count", "header"):
+            assert list(getattr(arrays, name)) == list(getattr(unpacked, name)), name
+        for pile, length in (("draw", kernels.DRAW_LENGTH), ("discard", kernels.DISCARD_LENGTH)):
+            assert list(getattr(arrays, pile))[: arrays.header[length]] == list(getattr(state, f"{pile}_pile"))
+
+
+def test_face_up_deal_at_a_waiting_seat_ends_the_round_on_turn_one(kernel_backend: str) -> None:
+    state = deal_round(RulesConfig(), 3, 4)
+    waiting = (state.active_player + 1) % 3
+    players = list(state.players)
+    players[waiting] = dataclasses.replace(players[waiting], face_up=frozenset(range(len(players[waiting].slots))))
+    state = dataclasses.replace(state, players=tuple(players))
+
+    after = apply_action(state, legal_actions(state)[0])
+    assert (after.round_ender, after.final_turns_remaining) == (waiting, 2)
+    arrays = ArrayState(state)
+    arrays.step(ACTION_KINDS.index(legal_actions(state)[0].kind), legal_actions(state)[0].slot_index)
+    assert list(arrays.header) == list(ArrayState(after).header)
+
+    agents = [SimpleHeuristicAgent(f"seat{seat}") for seat in range(3)]
+    result = play_round(agents, state, rng=Random(4))
+    assert result.turns == 3
+    assert kernel_round([kernels.POLICY_HEURISTIC] * 3, state, rng=Random(4)) == (
+        [result.scores_by_agent[agent.name] for agent in agents],
+        result.turns,
+    )
+
+
+def test_run_round_uses_kernels_only_for_plain_baseline_agents(monkeypatch: pytest.MonkeyPatch) -> None:
+    class CautiousAgent(SimpleHeuristicAgent):
+        def choose_action(self, state, actions, rng):  # type: ignore[no-untyped-def]
+            return actions[-1]
+
+    agents = [RandomAgent("random"), SimpleHeuristicAgent("heuristic"), RandomAgent("other")]
+    with_kernels = run_tournament(agents, rounds=30, seed=4)
+    mixed = run_round([*agents[:2], CautiousAgent("cautious")], seed=9)
+    monkeypatch.setattr(kernels, "ENABLED", False)
+
+    assert run_tournament(agents, rounds=30, seed=4) == with_kernels
+    assert run_round([*agents[:2], CautiousAgent("cautious")], seed=9) == mixed
+
+    report = measure_kernels(1, rounds=2)
+    assert report["backend"] == kernels.KERNEL_BACKEND
+    assert set(report["kernels"]) == {"step", "score", "random_policy", "heuristic_policy", "round"}
+    for row in report["kernels"].values():
+        assert row["speedup"] == pytest.approx(row["kernel_per_second"] / row["python_per_second"])
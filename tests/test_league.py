@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.cli import main
+from skyjo_optimizer.ml.league import League, LeagueEntry, MatchResult, Rating, rate_match
+
+
+def _tiered_league(seed: int) -> League:
+    league = League(seed=seed)
+    for index in range(4):
+        league.add(LeagueEntry(f"heuristic_{index}", "heuristic"))
+    for index in range(8):
+        league.add(LeagueEntry(f"random_{index}", "random"))
+    return league
+
+
+def test_rate_match_moves_ratings_towards_the_outcome() -> None:
+    winner, loser = rate_match(Rating(), Rating(), 1.0)
+    assert winner.mu > 25.0 > loser.mu
+    assert winner.sigma < Rating().sigma and loser.sigma < Rating().sigma
+
+    tied_a, tied_b = rate_match(Rating(), Rating(), 0.5)
+    assert tied_a.mu == pytest.approx(25.0) and tied_b.mu == pytest.approx(25.0)
+
+    # Beating a stronger opponent moves a rating further than beating an equal one.
+    upset, favourite = rate_match(Rating(20.0, 3.0), Rating(30.0, 3.0), 1.0)
+    even_win, _ = rate_match(Rating(25.0, 3.0), Rating(25.0, 3.0), 1.0)
+    assert upset.mu - 20.0 > even_win.mu - 25.0 and favourite.mu < 30.0
+
+
+def test_league_ranks_tiers_with_fewer_matches_than_a_round_robin() -> None:
+    league = _tiered_league(seed=3)
+    streamed: list[MatchResult] = []
+    league.run(24, on_match=streamed.append)
+
+    names = [row["name"] for row in league.leaderboard()]
+    assert all(name.startswith("heuristic") for name in names[:4])
+    # A round-robin over 12 entries needs 66 pairings; every entry still gets rated.
+    assert [match.match_index for match in streamed] == list(range(24)) and league.rounds_played == 48
+    assert min(league.match_counts.values()) >= 2
+    assert league.run(10, target_sigma=100.0) == []
+
+
+def test_saved_league_continues_exactly(tmp_path: Path) -> None:
+    uninterrupted = _tiered_league(seed=5)
+    uninterrupted.add(LeagueEntry("evolved", "strategy", HeuristicStrategy(0.4, 0.6, 0.5, 0.3)))
+    uninterrupted.run(20)
+
+    first_session = _tiered_league(seed=5)
+    first_session.add(LeagueEntry("evolved", "strategy", HeuristicStrategy(0.4, 0.6, 0.5, 0.3)))
+    first_session.run(12)
+    first_session.save(tmp_path / "league.json.gz")
+    resumed = League.load(tmp_path / "league.json.gz")
+    resumed.run(8)
+
+    assert resumed.ratings == uninterrupted.ratings
+    assert resumed.leaderboard() == uninterrupted.leaderboard()
+    with pytest.raises(ValueError, match="already has"):
+        resumed.add(LeagueEntry("evolved", "random"))
+
+
+def test_cli_league_rejects_a_zero_save_interval(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["league", "--state", str(tmp_path / "league.json.gz"), "--add-baselines", "--save-every", "0"])
+    assert not (tmp_path / "league.json.gz").exists()
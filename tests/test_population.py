@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pickle
+import random
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml.population import HEURISTIC_SCHEMA, Parameter, ParameterSchema, Population
+
+
+def test_mutants_draw_parents_then_noise_for_the_whole_buffer() -> None:
+    elites = [HeuristicStrategy(0.1, 0.95, 0.5, 0.02), HeuristicStrategy(0.7, 0.3, 0.99, 0.4)]
+    expected_rng = random.Random(17)
+    parents = [elites[expected_rng.randrange(len(elites))] for _ in range(50)]
+    expected = [
+        HeuristicStrategy(
+            risk_tolerance=parent.risk_tolerance + expected_rng.gauss(0, 0.2),
+            reveal_priority=parent.reveal_priority + expected_rng.gauss(0, 0.2),
+            column_focus=parent.column_focus + expected_rng.gauss(0, 0.2),
+            discard_aggression=parent.discard_aggression + expected_rng.gauss(0, 0.2),
+        ).clipped()
+        for parent in parents
+    ]
+
+    children = Population.of(elites).mutants(50, 0.2, random.Random(17))
+
+    assert children.individuals() == expected
+    assert children.schema == HEURISTIC_SCHEMA
+
+
+def test_decoded_rows_are_reused_by_take_and_add() -> None:
+    population = Population.random(HEURISTIC_SCHEMA, 6, random.Random(1))
+    decoded = population.individuals()
+
+    elites = population.take([4, 1])
+    combined = elites + elites.mutants(3, 0.1, random.Random(2))
+
+    assert combined.individuals()[0] is decoded[4] and combined.individuals()[1] is decoded[1]
+    assert pickle.loads(pickle.dumps(combined))._decoded is None
+
+
+def test_schema_supports_arbitrary_genomes_and_bounds() -> None:
+    schema = ParameterSchema(tuple(Parameter(f"gene{index}", -index, index + 1) for index in range(7)))
+    population = Population.random(schema, 30, random.Random(3))
+
+    children = population.mutants(200, 5.0, random.Random(4))
+
+    assert len(population) == 30 and len(children.genes) == 200 * schema.width
+    for row in children.individuals():
+        assert isinstance(row, tuple) and len(row) == 7
+        assert all(parameter.low <= value <= parameter.high for parameter, value in zip(schema.parameters, row))
+    elites = population.take([5, 0])
+    assert elites.individuals() == [population.row(5), population.row(0)]
+    assert (elites + children).individuals() == elites.individuals() + children.individuals()
+    assert pickle.loads(pickle.dumps(population)) == population
+    with pytest.raises(ValueError):
+        Population(schema, [0.0] * 6)
+    with pytest.raises(ValueError):
+        ParameterSchema((Parameter("a"), Parameter("a")))
+    with pytest.raises(IndexError):
+        population.take([30])
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from skyjo_optimizer import cli
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.engine import kernels
+from skyjo_optimizer.simulation import profiling
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+
+def test_profiling_counts_hot_paths_without_changing_results(tmp_path) -> None:
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random")]
+    evaluator = get_evaluator("engine")
+    strategy = HeuristicStrategy(0.4, 0.6, 0.5, 0.3)
+    plain_tournament = run_tournament(agents, rounds=5, seed=3)
+    plain_scores = evaluator.score_batch([strategy], DEFAULT_SITUATIONS[0], 4, 9)
+    assert profiling.ACTIVE is None
+
+    with profiling.profile_session(tmp_path) as hot_paths:
+        assert run_tournament(agents, rounds=5, seed=3) == plain_tournament
+        assert evaluator.score_batch([strategy], DEFAULT_SITUATIONS[0], 4, 9) == plain_scores
+
+    assert profiling.ACTIVE is None
+    # The tournament's heuristic/random tables are profiled on the kernel path, the evaluator's on the object engine.
+    kernel_rounds = 5 if kernels.ENABLED else 0
+    kernel_turns = sum(result.turns for result in plain_tournament.rounds) if kernels.ENABLED else 0
+    assert hot_paths.rounds == 9
+    assert hot_paths.calls["kernel_round"] == kernel_rounds
+    assert hot_paths.calls["agent_decision"] == hot_paths.calls["engine_step"] == hot_paths.turns - kernel_turns > 0
+    assert hot_paths.calls["deal_setup"] == 9 and hot_paths.calls["scoring"] == 9 - kernel_rounds
+    assert hot_paths.calls["evaluation"] == 1
+
+    summary = json.loads((tmp_path / profiling.PROFILE_SUMMARY_FILENAME).read_text())
+    assert summary["turns_per_second"] > 0
+    assert set(summary["components"]) == set(profiling.COMPONENTS)
+    assert (tmp_path / profiling.PROFILE_STATS_FILENAME).exists()
+    assert "cumulative" in (tmp_path / profiling.PROFILE_TEXT_FILENAME).read_text()
+
+
+def test_cli_verify_profile_writes_artifacts(tmp_path) -> None:
+    subprocess.check_call(
+        [sys.executable, "-m", "skyjo_optimizer.cli", "verify", "--rounds", "12", "--profile"],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    (profile_dir,) = (tmp_path / "artifacts" / "profiles").iterdir()
+    summary = json.loads((profile_dir / profiling.PROFILE_SUMMARY_FILENAME).read_text())
+    assert summary["rounds"] > 0
+    # The subprocess inherits SKYJO_KERNELS, so it takes the same path as this process.
+    assert summary["components"]["kernel_round" if kernels.ENABLED else "agent_decision"]["percent_of_wall"] > 0
+
+
+def test_cli_without_profile_skips_the_profile_directory(monkeypatch: pytest.MonkeyPatch) -> None:
+    from skyjo_optimizer.ml import experiment
+
+    def no_run_dir(root: Path) -> Path:
+        raise AssertionError("named a profile directory without --profile")
+
+    monkeypatch.setattr(experiment, "new_run_dir", no_run_dir)
+    assert cli.main(["verify", "--rounds", "12"]) == 0
+    assert cli.main(["baseline", "--rounds", "6", "--bootstrap", "0"]) == 0
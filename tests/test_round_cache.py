@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml.checkpoint import read_gzip_json, write_gzip_json
+from skyjo_optimizer.ml.round_cache import ROUND_CACHE_VERSION, RoundCache, agent_fingerprint, cached_tournament
+from skyjo_optimizer.simulation.baseline import BaselineAgent, RandomAgent, SimpleHeuristicAgent, run_tournament
+from skyjo_optimizer.simulation.engine_evaluator import StrategyAgent
+
+
+def _agents() -> list[BaselineAgent]:
+    return [
+        SimpleHeuristicAgent("heuristic"),
+        RandomAgent("random"),
+        StrategyAgent("cautious", HeuristicStrategy(0.2, 0.7, 0.4, 0.3)),
+    ]
+
+
+def test_cached_tournament_matches_full_rerun_and_replays_from_cache(tmp_path: Path) -> None:
+    agents = _agents()
+    cache = RoundCache(tmp_path / "rounds.json.gz")
+
+    assert cached_tournament(agents, rounds=12, seed=5, cache=cache) == run_tournament(agents, rounds=12, seed=5)
+    assert (cache.hits, cache.misses) == (0, 12)
+    cache.save()
+
+    reloaded = RoundCache(tmp_path / "rounds.json.gz")
+    assert cached_tournament(agents, rounds=16, seed=5, cache=reloaded) == run_tournament(agents, rounds=16, seed=5)
+    assert (reloaded.hits, reloaded.misses) == (12, 4)
+
+    payload = read_gzip_json(tmp_path / "rounds.json.gz")
+    assert payload["version"] == ROUND_CACHE_VERSION
+    write_gzip_json(tmp_path / "rounds.json.gz", {**payload, "version": ROUND_CACHE_VERSION + 1})
+    assert len(RoundCache(tmp_path / "rounds.json.gz")) == 0
+
+
+def test_adding_an_agent_simulates_only_its_tables() -> None:
+    agents = _agents()
+    newcomer = StrategyAgent("bold", HeuristicStrategy(0.9, 0.2, 0.8, 0.7))
+    cache = RoundCache()
+    cached_tournament(agents, rounds=6, seed=3, cache=cache, table_size=2)
+    cache.hits = cache.misses = 0
+
+    extended = [*agents, newcomer]
+    result = cached_tournament(extended, rounds=6, seed=3, cache=cache, table_size=2)
+
+    assert result == run_tournament(extended, rounds=6, seed=3, table_size=2)
+    # Three existing pairs come from the cache; only the three pairs with the newcomer run.
+    assert (cache.hits, cache.misses) == (18, 18)
+    assert result.win_rate_matrix["bold"].keys() == {"heuristic", "random", "cautious"}
+
+
+def test_fingerprints_track_parameters_not_names() -> None:
+    strategy = HeuristicStrategy(0.2, 0.7, 0.4, 0.3)
+    assert agent_fingerprint(StrategyAgent("a", strategy)) == agent_fingerprint(StrategyAgent("b", strategy))
+    assert agent_fingerprint(StrategyAgent("a", strategy)) != agent_fingerprint(
+        StrategyAgent("a", HeuristicStrategy(0.2, 0.7, 0.4, 0.31))
+    )
+    assert agent_fingerprint(RandomAgent("a")) != agent_fingerprint(SimpleHeuristicAgent("a"))
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from skyjo_optimizer.engine import RulesConfig
+from skyjo_optimizer.simulation.baseline import RandomAgent, SimpleHeuristicAgent, run_tournament
+from skyjo_optimizer.simulation.rule_sweep import rule_variants, run_rule_sweep
+
+
+def test_rule_sweep_rescores_shared_rounds_and_matches_independent_tournaments() -> None:
+    agents = [SimpleHeuristicAgent("heuristic"), RandomAgent("random_a"), RandomAgent("random_b")]
+    variants = rule_variants(
+        RulesConfig(),
+        {"starting_face_up_cards": [2, 3], "ender_penalty_mode": ["strict_lowest_required", "off"]},
+    )
+    result = run_rule_sweep(agents, variants, rounds=16, seed=9)
+
+    assert [variant.simulated for variant in result.variants] == [True, False, True, False]
+    for variant in result.variants:
+        assert variant.tournament == run_tournament(agents, rounds=16, seed=9, rules=variants[variant.name])
+
+    reference, penalty_off = result.variants[0], result.variants[1]
+    assert reference.mean_difference_by_agent == {name: 0.0 for name in reference.mean_difference_by_agent}
+    # Dropping the penalty can only lower scores, round by round.
+    assert all(difference <= 0 for difference in penalty_off.mean_difference_by_agent.values())
+    assert len(result.rows()) == len(variants) * len(agents)
+
+
+def test_rule_variants_validate_fields() -> None:
+    assert rule_variants(RulesConfig(), {}) == {"base": RulesConfig()}
+    with pytest.raises(ValueError):
+        rule_variants(RulesConfig(), {"board_size": [3]})
+
+
+def test_cli_rule_sweep_prints_paired_table() -> None:
+    completed = subprocess.run(
+        [sys.executable, "-m", "skyjo_optimizer.cli", "rule-sweep", "--rounds", "6", "--seed", "2"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    lines = completed.stdout.splitlines()
+    assert lines[0] == "variant,agent,simulated,mean_score,win_rate,mean_difference,paired_stderr,independent_stderr"
+    assert len(lines) == 1 + 2 * 3
+    assert "simulated 1 of 2 variants" in completed.stderr
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.serve import EvaluationServer, ServeClient, ServeConfig, ServeError, protocol
+from skyjo_optimizer.simulation.backends import get_evaluator
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+STRATEGIES = [HeuristicStrategy(0.1 * index, 0.6, 0.5, 0.3) for index in range(6)]
+
+
+def _serve_in_background(config: ServeConfig, clients: list[Callable[[str], object]]) -> tuple[list[object], dict[str, object]]:
+    async def scenario() -> tuple[list[object], dict[str, object]]:
+        server = EvaluationServer(config)
+        await server.start()
+        closed = asyncio.ensure_future(server.wait_closed())
+        results = await asyncio.gather(*(asyncio.to_thread(client, server.address) for client in clients))
+        stats = server.stats()
+        server.close()
+        await closed
+        return list(results), stats
+
+    return asyncio.run(scenario())
+
+
+def test_concurrent_evaluations_are_batched_and_match_direct_scoring(tmp_path) -> None:
+    config = ServeConfig(socket_path=tmp_path / "serve.sock", batch_window_ms=200)
+
+    def client(strategy: HeuristicStrategy) -> Callable[[str], object]:
+        return lambda address: ServeClient(address).evaluate(strategy, rounds=12, seed=4)
+
+    # Four clients fit in asyncio's default thread pool even on a single-CPU machine.
+    strategies = STRATEGIES[:4]
+    results, stats = _serve_in_background(config, [client(strategy) for strategy in strategies])
+
+    evaluator = get_evaluator()
+    for strategy, result in zip(strategies, results):
+        expected = [asdict(evaluator.evaluate(strategy, situation, 12, 4)) for situation in DEFAULT_SITUATIONS]
+        assert [{key: row[key] for key in expected[0]} for row in result["results"]] == expected
+    assert stats["requests"] == len(strategies)
+    assert stats["batched_evaluations"] == len(strategies) * len(DEFAULT_SITUATIONS)
+    assert stats["batches"] == len(DEFAULT_SITUATIONS)
+    assert stats["queue_depth"] == 0 and stats["in_flight_batches"] == 0
+    assert stats["latency_ms"]["count"] == len(strategies)
+    assert stats["latency_ms"]["p50"] <= stats["latency_ms"]["p99"]
+    assert not (tmp_path / "serve.sock").exists()
+
+
+def test_pipelined_requests_on_one_connection_are_paired_by_id() -> None:
+    def client(address: str) -> list[dict[str, object]]:
+        with ServeClient(address) as connection:
+            for index, strategy in enumerate(STRATEGIES[:3]):
+                connection.send({"id": index, "op": "evaluate", "strategy": asdict(strategy), "situations": ["balanced"]})
+            connection.send({"id": "bad", "op": "evaluate", "strategy": {"risk_tolerance": 1.0}})
+            return [connection.receive() for _ in range(4)]
+
+    (responses,), stats = _serve_in_background(ServeConfig(batch_window_ms=100), [client])
+
+    by_id = {response["id"]: response for response in responses}
+    assert set(by_id) == {0, 1, 2, "bad"}
+    assert not by_id["bad"]["ok"] and by_id[0]["ok"]
+    assert stats["batches"] == 1 and stats["errors"] == 1
+
+
+def test_cli_serve_answers_tournament_regression_and_shutdown(tmp_path) -> None:
+    socket_path = tmp_path / "serve.sock"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "skyjo_optimizer.cli", "serve", "--socket", str(socket_path), "--workers", "2"],
+        stdout=subprocess.PIPE,
+        text=True,
+        env={"PYTHONPATH": str(Path(__file__).resolve().parents[1])},
+    )
+    try:
+        address = process.stdout.readline().split()[-1]
+        with ServeClient(address) as client:
+            tournament = client.request("tournament", agents=["heuristic", "random"], rounds=6, seed=3)
+            assert set(tournament["mean_score_by_agent"]) == {"heuristic_0", "random_1"}
+            assert client.request("regression", rounds=8, seed=11)["deterministic_replay_ok"]
+            with pytest.raises(ServeError, match="unknown op"):
+                client.request("train")
+            client.request("shutdown")
+        assert process.wait(timeout=30) == 0
+    finally:
+        process.kill()
+
+
+def test_msgpack_connections_round_trip(tmp_path) -> None:
+    pytest.importorskip("msgpack")
+
+    def client(address: str) -> object:
+        with ServeClient(address, message_format="msgpack") as connection:
+            return connection.evaluate(STRATEGIES[0], rounds=6, situations=["balanced"])
+
+    (result,), _ = _serve_in_background(ServeConfig(socket_path=tmp_path / "serve.sock"), [client])
+    assert result["results"][0]["situation"] == "balanced"
+
+
+def test_non_json_connection_without_msgpack_gets_a_json_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def missing_msgpack():  # type: ignore[no-untyped-def]
+        raise protocol.ProtocolError("msgpack messages need the optional 'msgpack' package")
+
+    monkeypatch.setattr(protocol, "_msgpack", missing_msgpack)
+
+    def client(address: str) -> tuple[bytes, bytes]:
+        host, port = address.rsplit(":", 1)
+        with socket.create_connection((host, int(port)), timeout=10) as connection:
+            connection.sendall(b"GET / HTTP/1.0\r\n\r\n")
+            stream = connection.makefile("rb")
+            return stream.readline(), stream.read()
+
+    ((reply, rest),), stats = _serve_in_background(ServeConfig(), [client])
+
+    assert json.loads(reply) == {"id": None, "ok": False, "error": "msgpack messages need the optional 'msgpack' package"}
+    assert rest == b"" and stats["errors"] == 1
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+import random
+
+import pytest
+
+from skyjo_optimizer.engine import (
+    RoundState,
+    RulesConfig,
+    SharedStateBatch,
+    StateCodec,
+    apply_action,
+    initialize_round,
+    is_round_over,
+    legal_actions,
+)
+
+
+def _playout_states(rules: RulesConfig, player_count: int, seeds: range) -> list[RoundState]:
+    states = []
+    for seed in seeds:
+        state = initialize_round(rules, player_count=player_count, seed=seed)
+        rng = random.Random(seed)
+        states.append(state)
+        while not is_round_over(state):
+            state = apply_action(state, rng.choice(legal_actions(state)))
+            states.append(state)
+    return states
+
+
+def _advance_first_action(batch: SharedStateBatch) -> None:
+    for index in range(len(batch)):
+        state = batch[index]
+        batch[index] = apply_action(state, legal_actions(state)[0])
+    batch.close()
+
+
+def test_codec_round_trips_every_state_of_full_rounds() -> None:
+    rules = RulesConfig(starting_face_up_cards=3)
+    codec = StateCodec(rules, player_count=3)
+    states = _playout_states(rules, 3, range(6))
+
+    assert any(state.round_ender is not None for state in states)
+    assert all(codec.decode(codec.encode(state)) == state for state in states)
+    encoded = codec.encode_batch(states)
+    assert len(encoded) == len(states) * codec.size
+    assert codec.decode_batch(memoryview(encoded)) == states
+    assert codec.size < len(pickle.dumps(states[0])) // 5
+    with pytest.raises(ValueError, match="codec expects 4"):
+        StateCodec(rules, player_count=4).encode(states[0])
+
+
+def test_shared_batch_is_updated_in_place_by_another_process() -> None:
+    rules = RulesConfig()
+    states = [state for state in _playout_states(rules, 2, range(3)) if not is_round_over(state)][:40]
+    with SharedStateBatch.from_states(StateCodec(rules, 2), states) as batch:
+        worker = multiprocessing.Process(target=_advance_first_action, args=(batch,))
+        worker.start()
+        worker.join(30)
+
+        assert worker.exitcode == 0
+        assert list(batch) == [apply_action(state, legal_actions(state)[0]) for state in states]
+        with pytest.raises(IndexError):
+            batch[len(states)]
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import math
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+from skyjo_optimizer.ml.evolution import EvolutionConfig
+from skyjo_optimizer.ml.experiment import benchmark_round_scores, run_experiment
+from skyjo_optimizer.ml.store import ArtifactStore, read_npy, write_npy
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+
+def test_npy_round_trip_matches_numpy_layout(tmp_path) -> None:
+    values = array("d", [1.5, -2.0, float("nan")])
+    path = write_npy(tmp_path / "values.npy", values)
+
+    raw = path.read_bytes()
+    assert raw[:8] == b"\x93NUMPY\x01\x00"
+    assert (10 + int.from_bytes(raw[8:10], "little")) % 64 == 0
+    loaded = read_npy(path)
+    assert loaded.typecode == "d" and loaded[:2] == values[:2] and math.isnan(loaded[2])
+    assert read_npy(write_npy(tmp_path / "ints.npy", array("q", [3, 4]))) == array("q", [3, 4])
+
+
+def test_npy_files_load_with_numpy(tmp_path) -> None:
+    numpy = pytest.importorskip("numpy")
+    path = write_npy(tmp_path / "values.npy", array("d", [1.5, -2.0]))
+    assert numpy.load(path).tolist() == [1.5, -2.0]
+
+
+def test_store_indexes_runs_and_aggregates_without_reports(tmp_path) -> None:
+    store = ArtifactStore(tmp_path / "store")
+    situations = DEFAULT_SITUATIONS[:2]
+    for seed in (1, 2, 3):
+        for population_size in (4, 6):
+            config = EvolutionConfig(
+                population_size=population_size,
+                generations=2,
+                elite_count=2,
+                rounds_per_eval=6,
+                holdout_rounds=6,
+                seed=seed,
+            )
+            report = run_experiment(situations, config=config, tournament_rounds=4)
+            store.add_run(
+                f"run-{seed}-{population_size}",
+                report,
+                round_scores=benchmark_round_scores(report, situations),
+            )
+
+    rows = store.query({"seed": 2})
+    assert {row["run_id"] for row in rows} == {"run-2-4", "run-2-6"}
+    assert len(store.query(limit=4)) == 4
+
+    groups = store.compare("config_hash")
+    assert len(groups) == 6 and {group["runs"] for group in groups} == {1}
+    by_commit = store.compare("git_commit_hash", "benchmark_fitness")
+    assert len(by_commit) == 1 and by_commit[0]["runs"] == 6
+
+    generations = store.load_column("run-1-4", "generations", "generation")
+    assert generations == array("q", [0, 1])
+    assert not math.isnan(store.load_column("run-1-4", "generations", "holdout_score")[0])
+    rounds = store.load_column("run-1-4", "rounds", "optimized_score")
+    assert len(rounds) == 12
+
+    with pytest.raises(ValueError):
+        store.query({"aggregate_fitness": 1})
+
+
+def test_cli_query_and_compare(tmp_path) -> None:
+    store_root = tmp_path / "store"
+    command = [sys.executable, "-m", "skyjo_optimizer.cli"]
+    for seed in ("3", "4"):
+        subprocess.check_call(
+            [
+                *command,
+                "optimize",
+                "--population-size",
+                "4",
+                "--generations",
+                "1",
+                "--elite-count",
+                "2",
+                "--rounds-per-eval",
+                "4",
+                "--seed",
+                seed,
+                "--output-root",
+                str(tmp_path / "runs"),
+                "--store",
+                str(store_root),
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    listed = subprocess.check_output([*command, "query", "--store", str(store_root), "--filter", "seed=4"], text=True)
+    header, *rows = listed.strip().splitlines()
+    assert header.startswith("run_id,")
+    assert len(rows) == 1
+
+    compared = subprocess.check_output([*command, "compare", "--store", str(store_root), "--group-by", "seed"], text=True)
+    assert compared.strip().splitlines()[0] == "seed,runs,mean,min,max"
+    assert len(compared.strip().splitlines()) == 3
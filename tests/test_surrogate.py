@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from skyjo_optimizer.agents.heuristic import HeuristicStrategy
+from skyjo_optimizer.ml import evolution
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.experiment import run_experiment
+from skyjo_optimizer.ml.surrogate import QuadraticSurrogate
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+
+def _target(strategy: HeuristicStrategy) -> float:
+    return -((strategy.risk_tolerance - 0.7) ** 2) - 0.5 * strategy.column_focus * strategy.reveal_priority
+
+
+def test_quadratic_surrogate_recovers_quadratic_fitness() -> None:
+    rng = random.Random(4)
+    history = []
+    for _ in range(60):
+        strategy = HeuristicStrategy(rng.random(), rng.random(), rng.random(), rng.random())
+        history.append((strategy, _target(strategy)))
+
+    surrogate = QuadraticSurrogate()
+    assert surrogate.fit(history)
+
+    probe = HeuristicStrategy(0.2, 0.4, 0.9, 0.1)
+    mean, std = surrogate.predict(probe)
+    assert abs(mean - _target(probe)) < 1e-3
+    assert std < 1e-3
+
+
+def test_surrogate_needs_more_points_than_features() -> None:
+    history = [(HeuristicStrategy(0.1 * i, 0.5, 0.5, 0.5), float(i)) for i in range(5)]
+    assert QuadraticSurrogate().fit(history) is False
+
+
+def test_optimize_with_surrogate_tracks_saved_evaluations(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(evolution, "HISTORY_WINDOW", 25)
+    config = EvolutionConfig(
+        population_size=10,
+        generations=6,
+        elite_count=3,
+        rounds_per_eval=10,
+        holdout_rounds=10,
+        early_stop_patience=10,
+        seed=2,
+        surrogate_pool_factor=4,
+    )
+    optimizer = EvolutionOptimizer(config)
+    optimizer.optimize(DEFAULT_SITUATIONS[:2])
+
+    stats = optimizer.last_state.surrogate
+    assert stats.evaluated > 0
+    assert stats.screened == 4 * stats.evaluated
+    assert stats.evaluations_saved == 3 * stats.evaluated
+    assert len(optimizer.last_state.history) == 25
+    assert stats.error_count > 0
+
+
+def test_run_experiment_reports_surrogate_stats() -> None:
+    report = run_experiment(
+        situations=DEFAULT_SITUATIONS[:1],
+        config=EvolutionConfig(
+            population_size=8, generations=5, elite_count=2, rounds_per_eval=8, seed=5, surrogate_pool_factor=3
+        ),
+        tournament_rounds=4,
+    )
+
+    assert report.surrogate is not None
+    assert report.to_dict()["surrogate"]["evaluations_saved"] >= 0
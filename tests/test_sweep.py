@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+from skyjo_optimizer.ml.checkpoint import read_fitness_cache
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.experiment import run_experiment
+from skyjo_optimizer.ml.sweep import SweepSpec, config_hash, run_sweep
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+BASE = {"generations": 2, "rounds_per_eval": 6, "holdout_rounds": 6, "seed": 5}
+
+
+def test_grid_expansion_is_cartesian_product() -> None:
+    spec = SweepSpec(mode="grid", base=BASE, parameters={"population_size": [4, 6], "elite_count": [1, 2]})
+    configs = spec.expand()
+
+    assert len(configs) == 4
+    assert {(c.population_size, c.elite_count) for c in configs} == {(4, 1), (4, 2), (6, 1), (6, 2)}
+    assert all(c.generations == 2 for c in configs)
+
+
+def test_random_expansion_is_seeded() -> None:
+    spec = SweepSpec(
+        mode="random",
+        base=BASE,
+        parameters={"mutation_sigma": {"low": 0.05, "high": 0.2}, "elite_count": [1, 2]},
+        samples=5,
+        seed=3,
+    )
+
+    assert spec.expand() == spec.expand()
+    assert all(0.05 <= c.mutation_sigma <= 0.2 for c in spec.expand())
+
+
+def test_unknown_fields_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        SweepSpec(parameters={"populaton_size": [4]}).expand()
+
+
+def test_expand_rejects_invalid_configs_before_any_run(tmp_path) -> None:
+    spec = SweepSpec(mode="grid", base=BASE, parameters={"population_size": [4, 6], "elite_count": [2, 5]})
+
+    with pytest.raises(ValueError, match="elite_count cannot exceed population_size"):
+        run_sweep(spec, tmp_path, situations=DEFAULT_SITUATIONS[:1])
+    assert not any(tmp_path.iterdir())
+
+
+def test_jobs_receive_only_the_fitness_entries_their_config_can_hit() -> None:
+    situations = DEFAULT_SITUATIONS[:1]
+    small = EvolutionConfig(**{**BASE, "population_size": 4, "elite_count": 2})
+    other_seed = EvolutionConfig(**{**BASE, "population_size": 4, "elite_count": 2, "seed": 9})
+    cache: dict = {}
+    EvolutionOptimizer(small, fitness_cache=cache).optimize(situations)
+    EvolutionOptimizer(other_seed, fitness_cache=cache).optimize(DEFAULT_SITUATIONS[:2])
+
+    relevant = EvolutionOptimizer(small).relevant_fitness(cache, situations)
+
+    assert relevant and len(relevant) < len(cache)
+    reused: dict = dict(relevant)
+    EvolutionOptimizer(small, fitness_cache=reused).optimize(situations)
+    assert reused == relevant
+
+
+def test_sweep_skips_completed_runs_and_matches_standalone_results(tmp_path) -> None:
+    situations = DEFAULT_SITUATIONS[:1]
+    spec = SweepSpec(
+        mode="grid",
+        base={**BASE, "elite_count": 2},
+        parameters={"population_size": [4, 6]},
+        tournament_rounds=4,
+    )
+
+    first = run_sweep(spec, tmp_path, situations=situations)
+    second = run_sweep(spec, tmp_path, situations=situations)
+
+    assert len(first.executed) == 2 and not first.skipped
+    assert not second.executed and set(second.skipped) == set(first.executed)
+    assert read_fitness_cache(tmp_path / "fitness_cache.json.gz")
+
+    rows = first.results_path.read_text().strip().splitlines()
+    assert len(rows) == 3
+
+    config = EvolutionConfig(**{**BASE, "elite_count": 2, "population_size": 6})
+    standalone = run_experiment(situations, config=config, tournament_rounds=4)
+    digest = config_hash(config, situations, 4)
+    assert any(row.startswith(digest) and f"{standalone.optimized.aggregate_fitness:.6f}" in row for row in rows)
+
+
+def test_cli_sweep_writes_results_table(tmp_path) -> None:
+    spec = tmp_path / "sweep.toml"
+    spec.write_text(
+        """
+[sweep]
+mode = "grid"
+tournament_rounds = 4
+
+[base]
+generations = 1
+rounds_per_eval = 4
+holdout_rounds = 4
+elite_count = 1
+
+[grid]
+population_size = [2, 3]
+""".strip()
+        + "\n"
+    )
+
+    output = subprocess.check_output(
+        [sys.executable, "-m", "skyjo_optimizer.cli", "sweep", "--spec", str(spec), "--output-root", str(tmp_path / "out")],
+        text=True,
+    )
+
+    assert output.strip() == str(tmp_path / "out" / "sweep_results.csv")
+    assert len((tmp_path / "out" / "sweep_results.csv").read_text().strip().splitlines()) == 3
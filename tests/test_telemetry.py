@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+
+from skyjo_optimizer.cli import main
+from skyjo_optimizer.ml.evolution import EvolutionConfig, EvolutionOptimizer
+from skyjo_optimizer.ml.telemetry import PHASES, GenerationEvent, JsonlTelemetrySink, RunFinishedEvent, read_events, tail_events
+from skyjo_optimizer.simulation.scenarios import DEFAULT_SITUATIONS
+
+CONFIG = EvolutionConfig(population_size=6, generations=3, elite_count=2, rounds_per_eval=8, holdout_rounds=8, seed=5)
+
+
+def test_observer_receives_generation_and_finish_events() -> None:
+    events = []
+    observed = EvolutionOptimizer(CONFIG, observers=[events.append]).optimize(DEFAULT_SITUATIONS[:2])
+
+    assert observed == EvolutionOptimizer(CONFIG).optimize(DEFAULT_SITUATIONS[:2])
+    generations = [event for event in events if isinstance(event, GenerationEvent)]
+    assert [event.generation for event in generations] == [0, 1, 2]
+    assert all(set(event.phase_seconds) == set(PHASES) for event in generations)
+    assert generations[0].evaluations == 6 * 2 + 2
+    assert generations[0].holdout_score is not None and generations[1].holdout_score is None
+    assert generations[0].best_fitness >= generations[0].median_fitness
+    assert isinstance(events[-1], RunFinishedEvent)
+    assert events[-1].best_fitness == observed.aggregate_fitness
+
+
+def test_jsonl_sink_is_readable_while_the_run_is_live(tmp_path) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    followed: list[dict] = []
+    reader = threading.Thread(target=lambda: followed.extend(tail_events(path, follow=True, poll_seconds=0.01)))
+    reader.start()
+    EvolutionOptimizer(CONFIG, observers=[JsonlTelemetrySink(path)]).optimize(DEFAULT_SITUATIONS[:1])
+    reader.join(timeout=10)
+
+    assert not reader.is_alive()
+    assert followed == read_events(path)
+    assert [event["event"] for event in followed] == ["generation"] * 3 + ["finished"]
+
+    printed = subprocess.check_output([sys.executable, "-m", "skyjo_optimizer.cli", "tail", str(tmp_path)], text=True)
+    lines = printed.strip().splitlines()
+    assert len(lines) == 4 and lines[0].startswith("gen    0") and lines[-1].startswith("finished")
+
+
+def test_follow_stops_for_crashed_and_island_runs(tmp_path, capsys) -> None:
+    path = tmp_path / "telemetry.jsonl"
+    EvolutionOptimizer(CONFIG, observers=[JsonlTelemetrySink(path)]).optimize(DEFAULT_SITUATIONS[:1])
+    # A crash leaves the generation lines but never the finished event.
+    path.write_text("".join(path.read_text().splitlines(keepends=True)[:-1]))
+
+    followed = list(tail_events(path, follow=True, poll_seconds=0.01, idle_seconds=0.05))
+    assert [event["event"] for event in followed] == ["generation"] * 3
+    assert list(tail_events(path, follow=True, poll_seconds=0.01, finished=lambda: True)) == followed
+    assert list(tail_events(tmp_path / "missing.jsonl", follow=True, poll_seconds=0.01, idle_seconds=0.05)) == []
+
+    assert main(["tail", str(tmp_path), "--follow", "--idle-timeout", "0.05"]) == 0
+    assert len(capsys.readouterr().out.strip().splitlines()) == 3
+
+    island_run = tmp_path / "island"
+    island_run.mkdir()
+    (island_run / "resolved_config.json").write_text('{"islands": 2}')
+    assert main(["tail", str(island_run), "--follow"]) == 0
+    assert "island run" in capsys.readouterr().err